@@ -0,0 +1 @@
+"""Offline benchmarks for media_art_wrapper (not shipped with the integration)."""
@@ -0,0 +1,163 @@
+"""Local aiohttp stand-in for the iTunes, MusicBrainz and Cover Art Archive APIs.
+
+The server answers from a small in-memory catalogue and can inject latency,
+server errors and 429 throttling so resolver behaviour is measurable offline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import io
+import random
+import re
+from typing import Any
+
+from aiohttp import web
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover
+    Image = None
+
+_RE_WORDS = re.compile(r"[^\w]+")
+_RE_MB_FIELD = re.compile(r'(recording|artist):"([^"]*)"')
+
+
+def _words(value: str) -> set[str]:
+    return {w for w in _RE_WORDS.split(value.lower()) if w}
+
+
+@dataclass(slots=True)
+class CatalogueTrack:
+    track_id: int
+    artist: str
+    title: str
+    album: str
+
+
+@dataclass(slots=True)
+class FakeProviderConfig:
+    latency_ms: float = 80.0
+    jitter_ms: float = 20.0
+    error_rate: float = 0.0  # share of requests answered with HTTP 500
+    rate_limit_rate: float = 0.0  # share of requests answered with HTTP 429
+    seed: int = 1
+
+
+@dataclass(slots=True)
+class ServerCounters:
+    requests: Counter = field(default_factory=Counter)
+    bytes: int = 0
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+
+class FakeProviderServer:
+    def __init__(self, catalogue: list[CatalogueTrack], config: FakeProviderConfig | None = None) -> None:
+        self.catalogue = catalogue
+        self.config = config or FakeProviderConfig()
+        self.counters = ServerCounters()
+        self.base_url = ""
+        self._random = random.Random(self.config.seed)
+        self._images: dict[int, bytes] = {}
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> str:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/itunes/search", self._itunes_search)
+        app.router.add_get("/itunes/lookup", self._itunes_lookup)
+        app.router.add_get(r"/itunes/art/{track_id}/{size:\d+}x{size2:\d+}bb.jpg", self._image)
+        app.router.add_get("/mb/ws/2/recording", self._mb_search)
+        app.router.add_get("/caa/release/{release_id}/front-500", self._caa_front)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        route = "/".join(request.path.split("/")[1:3])  # e.g. "itunes/search", "caa/release"
+        self.counters.requests[route] += 1
+        delay = max(0.0, self._random.gauss(self.config.latency_ms, self.config.jitter_ms)) / 1000
+        await asyncio.sleep(delay)
+        roll = self._random.random()
+        if roll < self.config.rate_limit_rate:
+            return web.Response(status=429)
+        if roll < self.config.rate_limit_rate + self.config.error_rate:
+            return web.Response(status=500)
+        response = await handler(request)
+        self.counters.bytes += len(response.body or b"")
+        return response
+
+    def _search(self, artist_words: set[str], title_words: set[str]) -> list[CatalogueTrack]:
+        return [
+            track
+            for track in self.catalogue
+            if title_words <= _words(track.title) and artist_words <= _words(track.artist)
+        ]
+
+    def _itunes_item(self, track: CatalogueTrack) -> dict[str, Any]:
+        return {
+            "wrapperType": "track",
+            "trackId": track.track_id,
+            "collectionId": track.track_id + 1_000_000,
+            "artistName": track.artist,
+            "trackName": track.title,
+            "collectionName": track.album,
+            "artworkUrl100": f"{self.base_url}/itunes/art/{track.track_id}/100x100bb.jpg",
+        }
+
+    async def _itunes_search(self, request: web.Request) -> web.Response:
+        words = _words(request.query.get("term", "")) - {"single"}
+        matches = [t for t in self.catalogue if words and words <= _words(f"{t.artist} {t.title}")]
+        return web.json_response({"resultCount": len(matches), "results": [self._itunes_item(t) for t in matches[:15]]})
+
+    async def _itunes_lookup(self, request: web.Request) -> web.Response:
+        ids = {int(i) for i in request.query.get("id", "").split(",") if i.isdigit()}
+        matches = [t for t in self.catalogue if t.track_id in ids or t.track_id + 1_000_000 in ids]
+        return web.json_response({"resultCount": len(matches), "results": [self._itunes_item(t) for t in matches]})
+
+    async def _mb_search(self, request: web.Request) -> web.Response:
+        fields = dict(_RE_MB_FIELD.findall(request.query.get("query", "")))
+        matches = self._search(_words(fields.get("artist", "")), _words(fields.get("recording", "")))
+        recordings = [
+            {
+                "title": t.title,
+                "artist-credit": [{"name": t.artist}],
+                "releases": [{"id": f"release-{t.track_id}", "title": t.album}],
+            }
+            for t in matches[:5]
+        ]
+        return web.json_response({"recordings": recordings})
+
+    async def _caa_front(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._image_bytes(500), content_type="image/jpeg")
+
+    async def _image(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._image_bytes(int(request.match_info["size"])), content_type="image/jpeg")
+
+    def _image_bytes(self, size: int) -> bytes:
+        size = max(16, min(size, 3000))
+        image = self._images.get(size)
+        if image is None:
+            if Image is not None:
+                buffer = io.BytesIO()
+                Image.effect_noise((size, size), 48).convert("RGB").save(buffer, format="JPEG", quality=85)
+                image = buffer.getvalue()
+            else:
+                # Roughly JPEG-sized payload with a JPEG signature.
+                image = b"\xff\xd8\xff\xe0" + bytes(self._random.getrandbits(8) for _ in range(size * size // 6))
+            self._images[size] = image
+        return image
@@ -0,0 +1,150 @@
+"""Memory footprint of the cover cache at 10k and 100k tracks.
+
+Writes a synthetic cache file (iTunes-style entries with artist, title, ids and
+artwork URL, artists shared across tracks like on a real radio) into a
+temporary config directory and loads it through ``CoverCache.async_load``,
+the same path Home Assistant takes on start. Reports the traced Python memory
+per cached track, split into entries and the near-duplicate index, and the
+time of a near-duplicate lookup at that size.
+
+The run exits non-zero when the footprint grows past ``--max-bytes-per-track``
+(default ``BYTES_PER_TRACK_BUDGET``); ``tests/test_memory.py`` checks the 10k
+case on every test run. The footprint depends on the Home Assistant and Python
+versions (HA 2024.6 on Python 3.12 traces more than a bare interpreter), so the
+budget leaves headroom for that:
+
+    python -m benchmarks.memory_benchmark --tracks 10000 --tracks 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.media_art_wrapper import cache as cache_module
+from custom_components.media_art_wrapper.cache import CoverCache
+from custom_components.media_art_wrapper.const import COVER_CACHE_STORAGE_KEY, COVER_CACHE_STORAGE_VERSION
+
+BYTES_PER_TRACK_BUDGET = 2000
+
+_WORDS = (
+    "love night heart fire dance light baby time girl world dream summer rain blue gold wild road home star song "
+    "city river ocean shadow golden electric midnight sugar paper silver young forever broken crazy"
+).split()
+
+
+def _name(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS).capitalize() for _ in range(words))
+
+
+def synthetic_covers(tracks: int, seed: int = 1) -> dict[str, dict[str, Any]]:
+    """``tracks`` cache entries at 600 px; roughly 30 tracks per artist."""
+    rng = random.Random(seed)
+    artists = [_name(rng, 2) for _ in range(max(1, tracks // 30))]
+    covers: dict[str, dict[str, Any]] = {}
+    for index in range(tracks):
+        artist, title, album = rng.choice(artists), f"{_name(rng, 3)} {index}", _name(rng, 2)
+        key = f"{artist.lower()}|{title.lower()}|{album.lower()}|600"
+        covers[key] = {
+            "provider": "itunes",
+            "artwork_url": f"https://is1-ssl.mzstatic.com/image/thumb/Music/v4/{index:08x}/600x600bb.jpg",
+            "content_type": "image/jpeg",
+            "track_id": 1_000_000 + index,
+            "collection_id": 2_000_000 + index,
+            "validated_at": 1.7e9 + index,
+            "artist": artist,
+            "title": title,
+            "confidence": 0.93,
+        }
+    return covers
+
+
+async def measure(tracks: int) -> dict[str, Any]:
+    covers = synthetic_covers(tracks)
+    with tempfile.TemporaryDirectory() as config_dir:
+        os.makedirs(os.path.join(config_dir, ".storage"))
+        with open(os.path.join(config_dir, ".storage", COVER_CACHE_STORAGE_KEY), "w", encoding="utf-8") as handle:
+            json.dump(
+                {"version": COVER_CACHE_STORAGE_VERSION, "key": COVER_CACHE_STORAGE_KEY, "data": {"covers": covers}},
+                handle,
+            )
+        queries = [(entry["artist"], f"{entry['title']} (Remastered 2011)") for entry in list(covers.values())[:500]]
+        del covers
+
+        hass = HomeAssistant(config_dir)
+        max_entries = cache_module.COVER_CACHE_MAX_ENTRIES
+        cache_module.COVER_CACHE_MAX_ENTRIES = tracks
+        try:
+            gc.collect()
+            tracemalloc.start()
+            cache = CoverCache(hass)
+            await cache.async_load()
+            gc.collect()
+            total = tracemalloc.get_traced_memory()[0]
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+            fuzzy_file = cache_module.FuzzyIndex.__module__.replace(".", os.sep)
+            fuzzy = sum(s.size for s in snapshot.statistics("filename") if fuzzy_file in s.traceback[0].filename)
+
+            timings = []
+            for artist, title in queries:
+                started = time.perf_counter()
+                cache.find_similar("|600", artist, title)
+                timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            cache_module.COVER_CACHE_MAX_ENTRIES = max_entries
+            await hass.async_stop(force=True)
+
+    return {
+        "tracks": len(cache),
+        "total_mb": round(total / 1e6, 1),
+        "bytes_per_track": round(total / tracks),
+        "index_bytes_per_track": round(fuzzy / tracks),
+        "fuzzy_lookup_ms": {
+            "p50": round(statistics.median(timings), 3),
+            "max": round(max(timings), 3),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, action="append", help="cache size, repeatable (default: 10000, 100000)")
+    parser.add_argument(
+        "--max-bytes-per-track",
+        type=int,
+        default=BYTES_PER_TRACK_BUDGET,
+        help=f"fail when a run exceeds this footprint (default: {BYTES_PER_TRACK_BUDGET}, 0 disables the check)",
+    )
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = [asyncio.run(measure(tracks)) for tracks in args.tracks or [10_000, 100_000]]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            print(
+                f"{result['tracks']:>7} tracks: {result['total_mb']:7.1f} MB, "
+                f"{result['bytes_per_track']} B/track ({result['index_bytes_per_track']} B in the fuzzy index), "
+                f"fuzzy lookup p50 {result['fuzzy_lookup_ms']['p50']} ms / max {result['fuzzy_lookup_ms']['max']} ms"
+            )
+    if args.max_bytes_per_track and any(r["bytes_per_track"] > args.max_bytes_per_track for r in results):
+        sys.exit(f"memory budget of {args.max_bytes_per_track} B/track exceeded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Replay a recorded metadata trace through the coordinator at accelerated speed.
+
+Each configuration gets a fresh Home Assistant instance and an empty cover
+cache. Every trace event is turned into a ``State`` and fed to
+``CoverCoordinator._set_track_from_state``; when the track key changes the
+coordinator resolves the cover exactly as it would live. With ``--speed`` the
+original gaps are kept (divided by the factor), otherwise events are replayed
+back to back, so a day of radio replays in seconds.
+
+Traces come from the ``record_trace`` option
+(``<config>/media_art_wrapper/traces/<entity>.jsonl``). Providers are served by
+the local fake server unless ``--live`` is given.
+
+    python -m benchmarks.replay_trace my_trace.jsonl --config itunes --config source,itunes,musicbrainz@300
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from homeassistant.core import HomeAssistant, State
+
+from custom_components.media_art_wrapper import CoverCoordinator
+from custom_components.media_art_wrapper.const import (
+    CONF_ARTWORK_HEIGHT,
+    CONF_ARTWORK_WIDTH,
+    CONF_PROVIDERS,
+    CONF_SOURCE_ENTITY_ID,
+    DEFAULT_ARTWORK_SIZE,
+)
+from custom_components.media_art_wrapper.engine import async_get_resolver_engine, async_release_resolver_engine
+from custom_components.media_art_wrapper.trace import load_trace
+
+from .fake_providers import FakeProviderConfig, FakeProviderServer
+from .run_benchmark import _patch_provider_urls, catalogue_from_trace
+
+
+def parse_config(spec: str) -> tuple[list[str], int]:
+    """``"source,itunes@300"`` -> ``(["source", "itunes"], 300)``."""
+    providers, _, size = spec.partition("@")
+    return [p.strip() for p in providers.split(",") if p.strip()], int(size or DEFAULT_ARTWORK_SIZE)
+
+
+async def replay(events: list[dict[str, Any]], providers: list[str], size: int, speed: float) -> dict[str, Any]:
+    entity_id = events[0].get("entity_id", "media_player.replay")
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            entry = SimpleNamespace(
+                entry_id="replay",
+                data={
+                    CONF_SOURCE_ENTITY_ID: entity_id,
+                    CONF_PROVIDERS: providers,
+                    CONF_ARTWORK_WIDTH: size,
+                    CONF_ARTWORK_HEIGHT: size,
+                },
+                options={},
+            )
+            engine = await async_get_resolver_engine(hass)
+            coordinator = CoverCoordinator(hass, entry, engine)
+
+            changes = covers = 0
+            started = time.perf_counter()
+            for event in events:
+                if speed > 0:
+                    delay = float(event.get("t", 0.0)) / speed - (time.perf_counter() - started)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                attributes = {k: v for k, v in event.items() if k.startswith("media_")}
+                state = State(event.get("entity_id", entity_id), event.get("state", "playing"), attributes)
+                if not coordinator._set_track_from_state(state):  # noqa: SLF001
+                    continue
+                changes += 1
+                await coordinator.async_refresh()
+                covers += bool(coordinator.data and coordinator.data.image)
+            elapsed = time.perf_counter() - started
+
+            await coordinator.async_stop()
+            await async_release_resolver_engine(hass)
+            stats = coordinator.stats
+            hits = stats.cache_hits + stats.fuzzy_hits
+            lookups = hits + stats.cache_misses
+            return {
+                "providers": providers,
+                "size": size,
+                "track_changes": changes,
+                "covers": covers,
+                "cache_hits": stats.cache_hits,
+                "fuzzy_hits": stats.fuzzy_hits,
+                "cache_misses": stats.cache_misses,
+                "cache_hit_rate": round(hits / lookups, 3) if lookups else None,
+                "provider_requests": {name: p.requests for name, p in stats.providers.items()},
+                "wall_time_s": round(elapsed, 2),
+            }
+        finally:
+            await hass.async_stop(force=True)
+
+
+async def async_main(args: argparse.Namespace) -> list[dict[str, Any]]:
+    events = load_trace(args.trace)
+    if not events:
+        raise SystemExit(f"{args.trace}: no events")
+
+    server: FakeProviderServer | None = None
+    if not args.live:
+        server = FakeProviderServer(catalogue_from_trace(events), FakeProviderConfig(latency_ms=args.latency))
+        _patch_provider_urls(await server.start())
+    try:
+        return [await replay(events, *parse_config(spec), args.speed) for spec in args.config or ["itunes"]]
+    finally:
+        if server is not None:
+            await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("trace")
+    parser.add_argument("--config", action="append", help="providers[@size], repeatable (default: itunes)")
+    parser.add_argument("--speed", type=float, default=0.0, help="replay speed-up (0 = back to back)")
+    parser.add_argument("--latency", type=float, default=20.0, help="fake provider latency in ms")
+    parser.add_argument("--live", action="store_true", help="query the real provider APIs")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = asyncio.run(async_main(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for result in results:
+        rate = result["cache_hit_rate"]
+        print(
+            f"{','.join(result['providers'])}@{result['size']}: "
+            f"changes={result['track_changes']} covers={result['covers']} "
+            f"cache hit rate={'-' if rate is None else f'{rate:.1%}'} "
+            f"requests={result['provider_requests']} ({result['wall_time_s']} s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
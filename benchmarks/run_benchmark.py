@@ -0,0 +1,302 @@
+"""Offline benchmark for cover resolution.
+
+Starts ``FakeProviderServer``, points the provider modules at it and replays a
+track-change trace twice: once straight through ``async_resolve_cover`` (one
+resolution per distinct track) and once through a real ``CoverCoordinator``
+driven by state changes. Reports time-to-cover percentiles, provider requests
+and bytes per track change and peak Python memory.
+
+The coordinator runs without its refresh cooldown. By default track changes
+are replayed back to back, each one waiting until the coordinator has
+published its result; with ``--speed`` the recorded gaps are kept (divided by
+the factor) and covers overtaken by the next change count as superseded, not
+as never published.
+
+Run from the repository root (Home Assistant must be installed)::
+
+    python -m benchmarks.run_benchmark --trace benchmarks/traces/radio_sample.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import aiohttp_client
+
+from custom_components.media_art_wrapper import CoverCoordinator, itunes, musicbrainz
+from custom_components.media_art_wrapper.const import (
+    CONF_ARTWORK_HEIGHT,
+    CONF_ARTWORK_WIDTH,
+    CONF_PROVIDERS,
+    CONF_SOURCE_ENTITY_ID,
+    PROVIDER_ITUNES,
+    PROVIDER_MUSICBRAINZ,
+)
+from custom_components.media_art_wrapper.cover_resolver import async_resolve_cover
+from custom_components.media_art_wrapper.engine import async_get_resolver_engine, async_release_resolver_engine
+from custom_components.media_art_wrapper.metadata import ParsedMetadata, parse_metadata
+from custom_components.media_art_wrapper.models import TrackQuery
+from custom_components.media_art_wrapper.stats import ResolutionStats
+from custom_components.media_art_wrapper.trace import load_trace
+
+from .fake_providers import CatalogueTrack, FakeProviderConfig, FakeProviderServer
+
+COVER_TIMEOUT = 30.0
+
+
+def catalogue_from_trace(events: list[dict[str, Any]]) -> list[CatalogueTrack]:
+    """Every music event with an artist becomes a known track; everything else will miss."""
+    tracks: dict[tuple[str, str], CatalogueTrack] = {}
+    for event in events:
+        parsed = parse_metadata(event.get("entity_id", ""), event)
+        artist, title = parsed.artist, parsed.title
+        if artist and title and not parsed.skip_reason and (artist, title) not in tracks:
+            tracks[(artist, title)] = CatalogueTrack(
+                track_id=1000 + len(tracks),
+                artist=artist,
+                title=title,
+                album=parsed.album or title,
+            )
+    return list(tracks.values())
+
+
+def _percentiles(samples: list[float]) -> dict[str, float | None]:
+    if not samples:
+        return {"p50": None, "p90": None, "p99": None, "max": None}
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 1)
+
+    return {"p50": pick(0.5), "p90": pick(0.9), "p99": pick(0.99), "max": round(ordered[-1], 1)}
+
+
+def _patch_provider_urls(base_url: str) -> None:
+    itunes.ITUNES_SEARCH_URL = f"{base_url}/itunes/search"
+    itunes.ITUNES_LOOKUP_URL = f"{base_url}/itunes/lookup"
+    musicbrainz.MB_SEARCH_URL = f"{base_url}/mb/ws/2/recording"
+    musicbrainz.CAA_FRONT_URL = f"{base_url}/caa/release/{{release_id}}/front-500"
+
+
+def _track_changes(events: list[dict[str, Any]]) -> list[tuple[float, ParsedMetadata]]:
+    """Return ``(t, parsed)`` for events that change the track key."""
+    changes = []
+    last_key: str | None = None
+    for event in events:
+        parsed = parse_metadata(event.get("entity_id", ""), event)
+        if parsed.track_key != last_key and event.get("state") not in {"unavailable", "unknown"}:
+            changes.append((float(event.get("t", 0.0)), parsed))
+            last_key = parsed.track_key
+    return changes
+
+
+async def bench_resolver(session, server: FakeProviderServer, events, providers: list[str], size: int) -> dict[str, Any]:
+    """Resolve each music track change directly, without coordinator or cache."""
+    stats = ResolutionStats()
+    timings: list[float] = []
+    found = 0
+    requests_before, bytes_before = server.counters.total_requests, server.counters.bytes
+    changes = [parsed for _t, parsed in _track_changes(events) if parsed.track_key and not parsed.skip_reason]
+    for parsed in changes:
+        query = TrackQuery(
+            artist=parsed.artist,
+            title=parsed.title,
+            album=parsed.album,
+            artwork_width=size,
+            artwork_height=size,
+            original_title=parsed.raw_title if parsed.raw_title != parsed.title else None,
+        )
+        started = time.perf_counter()
+        resolved = await async_resolve_cover(session=session, query=query, providers=providers, stats=stats)
+        timings.append((time.perf_counter() - started) * 1000)
+        found += resolved is not None
+
+    n = max(1, len(changes))
+    return {
+        "track_changes": len(changes),
+        "covers_found": found,
+        "time_to_cover_ms": _percentiles(timings),
+        "requests_per_change": round((server.counters.total_requests - requests_before) / n, 2),
+        "bytes_per_change": round((server.counters.bytes - bytes_before) / n),
+        "providers": {name: p.as_dict() for name, p in stats.providers.items()},
+    }
+
+
+async def bench_coordinator(hass: HomeAssistant, server: FakeProviderServer, events, providers: list[str], size: int, speed: float) -> dict[str, Any]:
+    """Replay the trace as state changes through a real ``CoverCoordinator``."""
+    entity_id = events[0].get("entity_id", "media_player.bench") if events else "media_player.bench"
+    entry = SimpleNamespace(
+        entry_id="bench",
+        data={
+            CONF_SOURCE_ENTITY_ID: entity_id,
+            CONF_PROVIDERS: providers,
+            CONF_ARTWORK_WIDTH: size,
+            CONF_ARTWORK_HEIGHT: size,
+        },
+        options={},
+    )
+    engine = await async_get_resolver_engine(hass)
+    cache = engine.cache
+    coordinator = CoverCoordinator(hass, entry, engine)
+
+    pending: dict[str, float] = {}
+    time_to_cover: list[float] = []
+    superseded = 0
+    updates = 0
+
+    def _on_update() -> None:
+        nonlocal updates
+        updates += 1
+        data = coordinator.data
+        if data is not None and data.image and data.track_key in pending:
+            time_to_cover.append((time.perf_counter() - pending.pop(data.track_key)) * 1000)
+
+    unsub = coordinator.async_add_listener(_on_update)
+    await coordinator.async_start()
+    # No refresh cooldown: every track change is resolved, as with live gaps of minutes.
+    coordinator._debounced_refresh.cooldown = 0  # noqa: SLF001
+
+    requests_before, bytes_before = server.counters.total_requests, server.counters.bytes
+    changes = 0
+    started = time.perf_counter()
+    last_key: str | None = coordinator._track.track_key  # noqa: SLF001
+    for event in events:
+        if speed > 0:
+            delay = float(event.get("t", 0.0)) / speed - (time.perf_counter() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        attributes = {k: v for k, v in event.items() if k.startswith("media_") and v is not None}
+        updates_before = updates
+        hass.states.async_set(entity_id, event.get("state", "playing"), attributes)
+        await asyncio.sleep(0)
+        track = coordinator._track  # noqa: SLF001
+        key = track.track_key
+        if key != last_key:
+            changes += 1
+            # A track that changed before its cover arrived was superseded, not lost.
+            for pending_key in [k for k in pending if k != key]:
+                del pending[pending_key]
+                superseded += 1
+            last_key = key
+            if key and not track.skip_reason:
+                pending[key] = time.perf_counter()
+            if speed <= 0:
+                # Back to back: the next change waits until this one has been resolved.
+                deadline = time.perf_counter() + COVER_TIMEOUT
+                while updates == updates_before and time.perf_counter() < deadline:
+                    await asyncio.sleep(0.005)
+
+    deadline = time.perf_counter() + COVER_TIMEOUT
+    while pending and time.perf_counter() < deadline:
+        await asyncio.sleep(0.05)
+
+    unsub()
+    await coordinator.async_stop()
+    await async_release_resolver_engine(hass)
+
+    n = max(1, changes)
+    return {
+        "track_changes": changes,
+        "covers_published": len(time_to_cover),
+        "superseded": superseded,
+        "never_published": len(pending),
+        "time_to_cover_ms": _percentiles(time_to_cover),
+        "requests_per_change": round((server.counters.total_requests - requests_before) / n, 2),
+        "bytes_per_change": round((server.counters.bytes - bytes_before) / n),
+        "cache_entries": len(cache),
+        "stages": coordinator.stats.as_dict()["stages"],
+    }
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    events = load_trace(args.trace)
+    server = FakeProviderServer(
+        catalogue_from_trace(events),
+        FakeProviderConfig(
+            latency_ms=args.latency,
+            jitter_ms=args.jitter,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+        ),
+    )
+    _patch_provider_urls(await server.start())
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        tracemalloc.start()
+        try:
+            session = aiohttp_client.async_get_clientsession(hass)
+            report = {
+                "trace": args.trace,
+                "events": len(events),
+                "server": {
+                    "latency_ms": args.latency,
+                    "error_rate": args.error_rate,
+                    "rate_limit_rate": args.rate_limit_rate,
+                },
+                "resolver": await bench_resolver(session, server, events, args.providers, args.size),
+                "coordinator": await bench_coordinator(hass, server, events, args.providers, args.size, args.speed),
+                "server_requests": dict(server.counters.requests),
+            }
+            report["peak_memory_mb"] = round(tracemalloc.get_traced_memory()[1] / 1_048_576, 2)
+        finally:
+            tracemalloc.stop()
+            await hass.async_stop(force=True)
+            await server.stop()
+    return report
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print(f"trace: {report['trace']} ({report['events']} events)")
+    for mode in ("resolver", "coordinator"):
+        result = report[mode]
+        ttc = result["time_to_cover_ms"]
+        print(
+            f"{mode:12s} changes={result['track_changes']:4d}  "
+            f"time-to-cover p50={ttc['p50']} p90={ttc['p90']} p99={ttc['p99']} max={ttc['max']} ms  "
+            f"requests/change={result['requests_per_change']}  bytes/change={result['bytes_per_change']}"
+        )
+        if mode == "coordinator":
+            print(
+                f"{'':12s} published={result['covers_published']}  superseded={result['superseded']}  "
+                f"never published={result['never_published']}"
+            )
+    print(f"peak memory: {report['peak_memory_mb']} MB")
+    print(f"server requests: {report['server_requests']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trace", default="benchmarks/traces/radio_sample.jsonl")
+    parser.add_argument("--providers", nargs="+", default=[PROVIDER_ITUNES, PROVIDER_MUSICBRAINZ])
+    parser.add_argument("--size", type=int, default=600, help="artwork size in px")
+    parser.add_argument("--latency", type=float, default=80.0, help="mean provider latency in ms")
+    parser.add_argument("--jitter", type=float, default=20.0, help="latency standard deviation in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="trace replay speed-up; 0 (default) replays back to back, each change waiting for its cover",
+    )
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(async_main(args))
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        _print_report(report)
+
+
+if __name__ == "__main__":
+    main()
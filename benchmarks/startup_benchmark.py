@@ -0,0 +1,131 @@
+"""Startup cost of the integration: module import time and per-entry setup time.
+
+Import times come from ``python -X importtime`` in a fresh interpreter, once for
+the integration package and once per platform module, so modules already
+imported by a previous measurement do not hide their cost. Setup time is the
+construction and start of one ``CoverCoordinator`` per simulated entry against
+a real ``HomeAssistant`` instance (no network, source states set up front).
+
+    python -m benchmarks.startup_benchmark --entries 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any
+
+PACKAGE = "custom_components.media_art_wrapper"
+PLATFORM_MODULES = ("image", "camera", "media_player", "sensor")
+
+
+def import_cost(module: str) -> dict[str, Any]:
+    """Return cumulative import time of ``module`` and the integration modules it pulled in."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    own: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = [part.strip() for part in line.removeprefix("import time:").split("|")]
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue
+        name = fields[2]
+        if name == module:
+            total_us = cumulative_us
+        if name.startswith(PACKAGE):
+            own[name.removeprefix(f"{PACKAGE}.") or "__init__"] = self_us
+    return {
+        "total_ms": round(total_us / 1000, 1),
+        "integration_modules": sorted(own),
+        "integration_self_ms": round(sum(own.values()) / 1000, 1),
+    }
+
+
+async def setup_cost(entries: int) -> dict[str, Any]:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.media_art_wrapper import CoverCoordinator
+    from custom_components.media_art_wrapper.const import CONF_PROVIDERS, CONF_SOURCE_ENTITY_ID, DEFAULT_PROVIDERS
+    from custom_components.media_art_wrapper.engine import async_get_resolver_engine, async_release_resolver_engine
+
+    timings: list[float] = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        coordinators = []
+        try:
+            started = time.perf_counter()
+            engine = await async_get_resolver_engine(hass)
+            engine_ms = (time.perf_counter() - started) * 1000
+            for index in range(entries):
+                entity_id = f"media_player.room_{index}"
+                hass.states.async_set(entity_id, "idle", {})
+                entry = SimpleNamespace(
+                    entry_id=f"entry_{index}",
+                    data={CONF_SOURCE_ENTITY_ID: entity_id, CONF_PROVIDERS: list(DEFAULT_PROVIDERS)},
+                    options={},
+                )
+                started = time.perf_counter()
+                coordinator = CoverCoordinator(hass, entry, engine)
+                await coordinator.async_start()
+                timings.append((time.perf_counter() - started) * 1000)
+                coordinators.append(coordinator)
+        finally:
+            for coordinator in coordinators:
+                await coordinator.async_stop()
+            await async_release_resolver_engine(hass)
+            await hass.async_stop(force=True)
+
+    return {
+        "entries": entries,
+        "engine_ms": round(engine_ms, 2),
+        "per_entry_ms": {
+            "mean": round(statistics.fmean(timings), 2) if timings else None,
+            "max": round(max(timings), 2) if timings else None,
+        },
+        "total_ms": round(engine_ms + sum(timings), 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=12)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    report = {
+        "import": {PACKAGE: import_cost(PACKAGE)}
+        | {module: import_cost(f"{PACKAGE}.{module}") for module in PLATFORM_MODULES},
+        "setup": asyncio.run(setup_cost(args.entries)),
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for module, cost in report["import"].items():
+        print(
+            f"import {module:40s} {cost['total_ms']:7.1f} ms total, "
+            f"{cost['integration_self_ms']:6.1f} ms in {len(cost['integration_modules'])} integration modules"
+        )
+    setup = report["setup"]
+    print(
+        f"setup: engine {setup['engine_ms']} ms, {setup['entries']} entries "
+        f"mean {setup['per_entry_ms']['mean']} ms / max {setup['per_entry_ms']['max']} ms, total {setup['total_ms']} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
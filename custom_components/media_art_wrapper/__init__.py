@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 import logging
-import re
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, State, callback
-from homeassistant.helpers import aiohttp_client
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event, async_track_time_interval
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
@@ -18,105 +20,167 @@ from .const import (
     CONF_ARTWORK_HEIGHT,
     CONF_ARTWORK_SIZE,
     CONF_ARTWORK_WIDTH,
+    CONF_CAMERA_SIZE,
+    CONF_IMAGE_SIZE,
+    CONF_LIBRARY_PATH,
+    CONF_PLATFORMS,
+    CONF_PLAYER_SIZE,
     CONF_PROVIDERS,
+    CONF_RECORD_TRACE,
     CONF_SOURCE_ENTITY_ID,
+    COVER_URL_REFRESH_INTERVAL,
+    DATA_LIBRARY_INDEXES,
+    DATA_STARTUP_NEXT_REFRESH,
+    DATA_VIEW_REGISTERED,
+    DATA_WEBSOCKET_REGISTERED,
     DEFAULT_ARTWORK_HEIGHT,
     DEFAULT_ARTWORK_SIZE,
     DEFAULT_ARTWORK_WIDTH,
     DEFAULT_PROVIDERS,
     DOMAIN,
     PLATFORMS,
+    PRIORITY_PLAYING,
+    PRIORITY_PREFETCH,
+    PRIORITY_WARMUP,
+    PROVIDER_LOCAL_LIBRARY,
+    PROVIDER_SOURCE,
+    SIGNAL_COVER_UPDATED,
+    STARTUP_REFRESH_STAGGER,
 )
-from .cover_resolver import async_resolve_cover
-from .models import TrackQuery
+from .cache import CachedCover
+from .engine import ResolverEngine, async_get_resolver_engine, async_release_resolver_engine
+from .imaging import ImageJobCancelled
+from .metadata import NO_TRACK, ParsedMetadata, StationRules, async_get_station_rules, parse_metadata
+from .models import ResolvedCover, TrackQuery
+from .palette import Palette
+from .renditions import ProcessedCover, Rendition, image_hash, pick_rendition, process_cover, share_original
+from .stats import ResolutionStats
+from .trace import TraceRecorder
+from .views import CoverImageView
+from .websocket_api import async_register_websocket_commands
+
+if TYPE_CHECKING:
+    from .local_library import LocalLibraryIndex
 
 _LOGGER = logging.getLogger(__name__)
 
-_RE_CLEAN = re.compile(
-    r"""
-       \s*
-       (
-           \([^)]*(?:Remix|Edit|Mix)[^)]*\) |
-           \[[^\]]*(?:Remix|Edit|Mix)[^\]]*\] |
-           -\s*.*(?:Remix|Edit|Mix).* |
-           \(?\s*\d+[_:]\d+\s*\)?
-       )
-    """,
-    re.I | re.X,
-)
-_BAD = {"", "none", "null", "unknown", "n/a", "-"}
+_NO_PALETTE: dict[str, Any] = {"dominant_color": None, "vibrant_color": None, "palette": None, "blurhash": None}
 
 
 @dataclass(slots=True)
 class CoverData:
+    """Published cover of one track.
+
+    Track metadata is the coordinator's interned ``ParsedMetadata`` and image,
+    renditions and palette are the cache's objects, all held by reference.
+    """
+
     source_entity_id: str
-    track_key: str | None
-    artist: str | None
-    title: str | None
-    album: str | None
+    track: ParsedMetadata
     provider: str | None
     artwork_url: str | None
     content_type: str
     image: bytes | None
     last_updated: datetime | None
+    image_hash: str | None = None
+    renditions: dict[int, Rendition] = field(default_factory=dict)
+    palette: Palette | None = None
+    confidence: float | None = None  # 0..1 match confidence of the provider result
 
+    @property
+    def track_key(self) -> str | None:
+        return self.track.track_key
 
-def _raw_text(value: str | None) -> str | None:
-    """Normalize whitespace only – keeps remix/edit/mix annotations intact."""
-    if not isinstance(value, str):
-        return None
-    normalized = re.sub(r"\s{2,}", " ", value).strip()
-    if normalized.lower() in _BAD:
-        return None
-    return normalized or None
-
-
-def _clean_text(value: str | None) -> str | None:
-    if not isinstance(value, str):
-        return None
-    cleaned = re.sub(r"\s{2,}", " ", _RE_CLEAN.sub("", value)).strip()
-    if cleaned.lower() in _BAD:
-        return None
-    return cleaned or None
+    @property
+    def artist(self) -> str | None:
+        return self.track.artist
 
+    @property
+    def title(self) -> str | None:
+        return self.track.title
 
-def _norm(s: str) -> str:
-    return " ".join(s.strip().lower().split())
+    @property
+    def album(self) -> str | None:
+        return self.track.album
+
+    def image_for_size(self, size: int | None) -> tuple[bytes | None, str]:
+        """Return the rendition nearest to ``size`` (longest edge), or the original."""
+        if size and self.renditions and (rendition := pick_rendition(self.renditions, size)):
+            return rendition.image, rendition.content_type
+        return self.image, self.content_type
+
+
+@dataclass(slots=True, frozen=True)
+class SourceSnapshot:
+    """Parsed view of the source media_player, built once per state event.
+
+    All platforms read the source through this snapshot instead of calling
+    ``hass.states.get`` from every property.
+    """
+
+    state: str | None = None
+    attributes: Mapping[str, Any] = field(default_factory=dict)
+    supported_features: int = 0
+
+    @classmethod
+    def from_state(cls, state: State | None) -> SourceSnapshot:
+        if state is None:
+            return cls()
+        try:
+            supported_features = int(state.attributes.get("supported_features", 0))
+        except (TypeError, ValueError):
+            supported_features = 0
+        return cls(state=state.state, attributes=state.attributes, supported_features=supported_features)
 
+    @property
+    def available(self) -> bool:
+        return self.state is not None and self.state not in {"unavailable", "unknown"}
 
-def _build_track_key(artist: str | None, title: str | None, album: str | None) -> str | None:
-    if not artist and not title:
-        return None
-    parts = [
-        _norm(artist) if artist else "",
-        _norm(title) if title else "",
-        _norm(album) if album else "",
-    ]
-    return "|".join(parts)
+    def attr(self, key: str, default: Any = None) -> Any:
+        return self.attributes.get(key, default)
 
 
 class CoverCoordinator(DataUpdateCoordinator[CoverData]):
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, engine: ResolverEngine) -> None:
         self.entry = entry
+        self.engine = engine
+        self.cache = engine.cache
         self.source_entity_id: str = entry.data[CONF_SOURCE_ENTITY_ID]
         self.providers: list[str] = []
         self.artwork_size: int = DEFAULT_ARTWORK_SIZE
         self.artwork_width: int = DEFAULT_ARTWORK_WIDTH
         self.artwork_height: int = DEFAULT_ARTWORK_HEIGHT
-
-        self._session = aiohttp_client.async_get_clientsession(hass)
+        self.image_size: int = DEFAULT_ARTWORK_SIZE
+        self.camera_size: int = DEFAULT_ARTWORK_SIZE
+        self.player_size: int = DEFAULT_ARTWORK_SIZE
+        self.library: LocalLibraryIndex | None = None
+        self.platforms: list[Platform] = list(PLATFORMS)
+        self.recorder: TraceRecorder | None = None
+        self.station_rules = StationRules()
+
+        self._session = engine.session
         self._unsub_state_change: Any | None = None
+        self._unsub_started: Any | None = None
+        self._unsub_initial_refresh: Any | None = None
+        self._unsub_url_refresh: Any | None = None
+        self._warmup = False
+        self._source_listeners: list[Callable[[SourceSnapshot], None]] = []
+        self.stats = ResolutionStats()
         self._lock = asyncio.Lock()
+        self.source = SourceSnapshot()
 
-        self._update_from_entry(entry)
+        self._update_from_entry(hass, entry)
 
-        self._artist: str | None = None
-        self._title: str | None = None
-        self._raw_title: str | None = None
-        self._album: str | None = None
-        self._track_key: str | None = None
+        self._track: ParsedMetadata = NO_TRACK
+        self._source_picture: str | None = None
+        self._current_source_picture: str | None = None
+        self._late_picture = False  # re-resolve the current track from a picture that arrived after it
         self._last_cover: CoverData | None = None
         self._last_error: str | None = None
+        self._upgrade_task: asyncio.Task | None = None
+        self._attributes: dict[str, Any] | None = None
+        self._attributes_data: CoverData | None = None
+        self._pushed_data: CoverData | None = None
 
         super().__init__(
             hass=hass,
@@ -126,7 +190,7 @@ class CoverCoordinator(DataUpdateCoordinator[CoverData]):
             update_interval=None,  # event-driven
         )
 
-    def _update_from_entry(self, entry: ConfigEntry) -> None:
+    def _update_from_entry(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         providers = entry.options.get(CONF_PROVIDERS, entry.data.get(CONF_PROVIDERS, DEFAULT_PROVIDERS))
         self.providers = list(providers) if isinstance(providers, list) else list(DEFAULT_PROVIDERS)
 
@@ -143,83 +207,318 @@ class CoverCoordinator(DataUpdateCoordinator[CoverData]):
         self.artwork_height = int(artwork_height)
         self.artwork_size = max(self.artwork_width, self.artwork_height)
 
+        # Per-entity rendition sizes; 0 means "use the artwork size".
+        self.image_size = int(entry.options.get(CONF_IMAGE_SIZE, 0) or self.artwork_size)
+        self.camera_size = int(entry.options.get(CONF_CAMERA_SIZE, 0) or self.artwork_size)
+        self.player_size = int(entry.options.get(CONF_PLAYER_SIZE, 0) or self.artwork_size)
+
+        platforms = entry.options.get(CONF_PLATFORMS)
+        if isinstance(platforms, list):
+            self.platforms = [platform for platform in PLATFORMS if platform.value in platforms]
+
+        library_path = entry.options.get(CONF_LIBRARY_PATH, entry.data.get(CONF_LIBRARY_PATH))
+        if library_path and PROVIDER_LOCAL_LIBRARY in self.providers:
+            from .local_library import async_get_library_index  # noqa: PLC0415
+
+            self.library = async_get_library_index(hass, library_path)
+        else:
+            self.library = None
+
+        if entry.options.get(CONF_RECORD_TRACE):
+            self.recorder = TraceRecorder(hass, self.source_entity_id)
+
     async def async_start(self) -> None:
-        """Start listening to media_player state changes and do initial refresh."""
+        """Start listening to media_player state changes and schedule the initial refresh.
+
+        Returns without any network I/O. A cover still held in memory by the
+        cache (e.g. after an options reload) is published right away; otherwise
+        entities show fallback data until the first resolution, which runs after
+        Home Assistant has started. Only resolutions that need a provider search
+        are staggered across entries.
+        """
         if self._unsub_state_change is not None:
             return
 
+        self.station_rules = await async_get_station_rules(self.hass)
         self._unsub_state_change = async_track_state_change_event(
             self.hass,
             [self.source_entity_id],
             self._handle_state_change,
         )
+        self._unsub_url_refresh = async_track_time_interval(
+            self.hass, self._async_refresh_cover_urls, COVER_URL_REFRESH_INTERVAL
+        )
 
         state = self.hass.states.get(self.source_entity_id)
+        self.source = SourceSnapshot.from_state(state)
+        if self.recorder is not None:
+            self.recorder.record(state)
         changed = self._set_track_from_state(state)
+        if self._async_publish_cached():
+            return
         if changed or state is not None:
-            await self.async_request_refresh()
+            self._unsub_started = async_at_started(self.hass, self._async_schedule_initial_refresh)
+
+    def _startup_cache_entry(self) -> CachedCover | None:
+        """Cache entry of the current track, looked up without network I/O."""
+        track = self._track
+        if not track.track_key or track.skip_reason or not (track.artist or track.title):
+            return None
+        return self.cache.get(f"{track.track_key}|{self.artwork_size}")
+
+    @callback
+    def _async_publish_cached(self) -> bool:
+        """Publish the current track's cover if the cache holds its bytes; True when published."""
+        cached = self._startup_cache_entry()
+        if cached is None or not cached.image:
+            return False
+        data = CoverData(
+            source_entity_id=self.source_entity_id,
+            track=self._track,
+            provider=cached.provider,
+            artwork_url=cached.artwork_url,
+            content_type=cached.content_type,
+            image=cached.image,
+            last_updated=dt_util.utcnow(),
+            image_hash=cached.image_hash or image_hash(cached.image),
+            renditions=cached.renditions or {},
+            palette=cached.palette,
+            confidence=cached.confidence,
+        )
+        self._last_cover = data
+        self.stats.cache_hits += 1
+        self.async_set_updated_data(data)
+        return True
+
+    @callback
+    def _async_schedule_initial_refresh(self, _hass: HomeAssistant) -> None:
+        """Queue the first resolution.
+
+        A cached track only needs its artwork URL downloaded and starts at once;
+        provider searches are spaced ``STARTUP_REFRESH_STAGGER`` after the
+        previous entry's.
+        """
+        if self._startup_cache_entry() is not None:
+            self._unsub_initial_refresh = async_call_later(self.hass, 0, self._async_initial_refresh)
+            return
+        now = time.monotonic()
+        start_at = max(now, self.hass.data.get(DATA_STARTUP_NEXT_REFRESH, 0.0))
+        self.hass.data[DATA_STARTUP_NEXT_REFRESH] = start_at + STARTUP_REFRESH_STAGGER
+        self._unsub_initial_refresh = async_call_later(self.hass, start_at - now, self._async_initial_refresh)
+
+    async def _async_initial_refresh(self, _now: Any) -> None:
+        self._unsub_initial_refresh = None
+        if self.data is not None and self.data.track_key == self._track.track_key:
+            return  # a state change got there first
+        self._warmup = True
+        await self.async_request_refresh()
 
     async def async_stop(self) -> None:
         """Stop listeners."""
         if self._unsub_state_change is not None:
             self._unsub_state_change()
             self._unsub_state_change = None
+        if self._unsub_started is not None:
+            self._unsub_started()
+            self._unsub_started = None
+        if self._unsub_initial_refresh is not None:
+            self._unsub_initial_refresh()
+            self._unsub_initial_refresh = None
+        if self._unsub_url_refresh is not None:
+            self._unsub_url_refresh()
+            self._unsub_url_refresh = None
+        self._cancel_upgrade()
+        if self.recorder is not None:
+            await self.recorder.async_stop()
+
+    @callback
+    def _async_refresh_cover_urls(self, _now: Any) -> None:
+        """Rewrite the entity states so a shown cover URL is re-signed before it expires."""
+        if self.data is not None and self.data.image:
+            super().async_update_listeners()
+
+    @callback
+    def async_add_source_listener(self, update_callback: Callable[[SourceSnapshot], None]) -> Callable[[], None]:
+        """Call ``update_callback`` with the new snapshot on every source state event."""
+        self._source_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._source_listeners:
+                self._source_listeners.remove(update_callback)
+
+        return remove_listener
 
     @callback
     def _handle_state_change(self, event) -> None:
         new_state: State | None = event.data.get("new_state")
+        self.source = SourceSnapshot.from_state(new_state)
+        for update_callback in list(self._source_listeners):
+            update_callback(self.source)
+
         if new_state is None:
             return
+        if self.recorder is not None:
+            self.recorder.record(new_state)
 
+        started = time.perf_counter()
         changed = self._set_track_from_state(new_state)
+        self.stats.observe("normalize", (time.perf_counter() - started) * 1000, trace=False)
         if not changed:
             return
 
         self.hass.async_create_task(self.async_request_refresh())
+        if self.station_rules.due:
+            # Picks up edits to station_rules.json for the following tracks.
+            self.hass.async_create_task(self._async_reload_station_rules())
+
+    async def _async_reload_station_rules(self) -> None:
+        self.station_rules = await async_get_station_rules(self.hass)
 
     def _set_track_from_state(self, state: State | None) -> bool:
         if state is None or state.state in {"unavailable", "unknown"}:
             return False
 
         attrs = state.attributes or {}
-        raw_title = _raw_text(attrs.get("media_title"))
-        artist = _clean_text(attrs.get("media_artist"))
-        title = _clean_text(attrs.get("media_title"))
-        album = _clean_text(attrs.get("media_album_name"))
+        parsed = parse_metadata(self.source_entity_id, attrs, self.station_rules)
+        picture = attrs.get("entity_picture")
+        picture = picture if isinstance(picture, str) and picture else None
 
         # Use raw title in the key so "Song (Remix)" and "Song" are treated as
         # distinct tracks and each triggers its own cover fetch.
-        new_key = _build_track_key(artist, raw_title, album)
-        if new_key == self._track_key:
-            return False
+        if parsed.track_key == self._track.track_key:
+            return self._set_late_picture(picture)
+
+        # An unchanged picture on a new track is most likely left over from the
+        # previous one (the source has not caught up yet) unless the album matches.
+        stale_picture = picture == self._source_picture and (parsed.album is None or parsed.album != self._track.album)
+        self._source_picture = picture
+        self._current_source_picture = None if stale_picture else picture
+
+        self._track = parsed
+        # Image work still waiting for the previous track is no longer needed.
+        self.engine.images.cancel_owner(self.source_entity_id)
+        return True
+
+    def _set_late_picture(self, picture: str | None) -> bool:
+        """Take a picture the source published after the title of the current track.
 
-        self._artist = artist
-        self._title = title
-        self._raw_title = raw_title
-        self._album = album
-        self._track_key = new_key
+        Returns True when the track should be resolved again from it, i.e. the
+        source provider is enabled and the current cover is not already its own
+        artwork (it came from a text search or is still being resolved).
+        """
+        if picture is None or picture == self._source_picture:
+            return False
+        self._source_picture = picture
+        self._current_source_picture = picture
+        data = self.data
+        if PROVIDER_SOURCE not in self.providers or (
+            data is not None
+            and data.track_key == self._track.track_key
+            and data.provider in (PROVIDER_SOURCE, PROVIDER_LOCAL_LIBRARY)
+        ):
+            return False
+        self._late_picture = True
         return True
 
+    @property
+    def group_members(self) -> tuple[str, ...]:
+        """Members of the speaker group of the source (``group_members``), empty when ungrouped."""
+        members = self.source.attr("group_members")
+        if not isinstance(members, (list, tuple)) or len(members) < 2 or self.source_entity_id not in members:
+            return ()
+        return tuple(member for member in members if isinstance(member, str))
+
+    def _elect_leader(self) -> CoverCoordinator | None:
+        """First group member with a coordinator resolving the same way (size, providers)."""
+        members = self.group_members
+        if not members:
+            return None
+        coordinators = {c.source_entity_id: c for c in self.hass.data.get(DOMAIN, {}).values()}
+        for member in members:
+            candidate = coordinators.get(member)
+            if candidate is not None and candidate._share_key == self._share_key:  # noqa: SLF001
+                return candidate
+        return None
+
+    @property
+    def _share_key(self) -> tuple[Any, ...]:
+        return (self.artwork_width, self.artwork_height, self.providers)
+
+    @property
+    def group_leader(self) -> CoverCoordinator | None:
+        """Coordinator resolving covers for this source's group; None when this one resolves itself.
+
+        Grouped players (Sonos, AirPlay, ...) list their leader first in
+        ``group_members``, so every member elects the same coordinator. A leader
+        that, by its own view of the group, would follow someone else is ignored
+        while the members' states are out of sync.
+        """
+        leader = self._elect_leader()
+        if leader is None or leader is self or leader._elect_leader() is not leader:  # noqa: SLF001
+            return None
+        return leader
+
+    @callback
+    def async_update_listeners(self) -> None:
+        super().async_update_listeners()
+        data = self.data
+        if data is not None and data is not self._pushed_data:
+            # WebSocket subscribers get each published cover once, not every refresh.
+            self._pushed_data = data
+            async_dispatcher_send(self.hass, SIGNAL_COVER_UPDATED, self)
+        if data is None or not data.track_key or not self.hass.data.get(DOMAIN):
+            return
+        # Hand the cover to the followers playing the same track; they keep a
+        # reference to this CoverData instead of resolving and storing their own.
+        for follower in list(self.hass.data[DOMAIN].values()):
+            if follower is self or follower._track.track_key != data.track_key or follower.data is data:  # noqa: SLF001
+                continue
+            if follower.group_leader is self:
+                follower._async_follow(data)  # noqa: SLF001
+
+    @callback
+    def _async_follow(self, data: CoverData) -> None:
+        self.stats.group_hits += 1
+        if data.image:
+            self._last_cover = data
+        self.async_set_updated_data(data)
+
     @property
     def last_error(self) -> str | None:
         return self._last_error
 
-    def _fallback_data(
-        self,
-        *,
-        track_key: str | None,
-        artist: str | None,
-        title: str | None,
-        album: str | None,
-    ) -> CoverData:
+    @property
+    def cover_attributes(self) -> dict[str, Any]:
+        """Attributes shared by all entities, rebuilt only when ``data`` changes.
+
+        The same dict instance is handed to every entity; callers must not mutate it.
+        """
+        data: CoverData | None = self.data
+        if self._attributes is None or self._attributes_data is not data:
+            self._attributes_data = data
+            self._attributes = {
+                "source_entity_id": self.source_entity_id,
+                "track_key": data.track_key if data else None,
+                "artist": data.artist if data else None,
+                "title": data.title if data else None,
+                "album": data.album if data else None,
+                "provider": data.provider if data else None,
+                "artwork_url": data.artwork_url if data else None,
+                "artwork_width": self.artwork_width,
+                "artwork_height": self.artwork_height,
+                "artwork_size": self.artwork_size,
+                "confidence": data.confidence if data else None,
+                **(data.palette.as_attributes() if data and data.palette else _NO_PALETTE),
+            }
+        return self._attributes
+
+    def _fallback_data(self, track: ParsedMetadata) -> CoverData:
         if self._last_cover is not None:
             return self._last_cover
         return CoverData(
             source_entity_id=self.source_entity_id,
-            track_key=track_key,
-            artist=artist,
-            title=title,
-            album=album,
+            track=track,
             provider=None,
             artwork_url=None,
             content_type="image/jpeg",
@@ -227,83 +526,289 @@ class CoverCoordinator(DataUpdateCoordinator[CoverData]):
             last_updated=None,
         )
 
+    def _provider_session(self, provider: str | None):
+        """Artwork downloads reuse the connection pool of the provider that found the cover."""
+        return self.engine.sessions.get(provider) or self._session
+
+    async def _async_cached_image(self, cache_key: str, cached: CachedCover) -> bytes | None:
+        """Return cached bytes, re-downloading them from the stored artwork URL if evicted."""
+        if cached.image:
+            return cached.image
+        url = cached.artwork_url
+        if not url or not url.startswith(("http://", "https://")):
+            return None
+        try:
+            with self.stats.timed("download", f"cached: {url}"):
+                async with self._provider_session(cached.provider).get(url, timeout=10) as resp:
+                    if resp.status >= 400:
+                        return None
+                    content_type = resp.headers.get("Content-Type", cached.content_type)
+                    image = await resp.read()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Cached artwork fetch failed for %s: %s", url, err)
+            return None
+        self.cache.set_image(cache_key, image, content_type)
+        return image or None
+
+    async def _async_process(self, cache_key: str, image: bytes, content_type: str) -> ProcessedCover:
+        """Return hash, renditions and palette of ``image``, reusing what is cached with the cover."""
+        cached = self.cache.get(cache_key)
+        if cached is not None and cached.image is image and cached.renditions is not None and cached.image_hash:
+            return ProcessedCover(cached.image_hash, cached.renditions, cached.palette)
+        try:
+            processed = await self.engine.images.async_run(
+                cache_key, self.source_entity_id, process_cover, image, content_type
+            )
+        except ImageJobCancelled:
+            # Superseded or shed: publish the original only, process again on next use.
+            return ProcessedCover(image_hash(image))
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Image processing failed for %s: %s", cache_key, err)
+            return ProcessedCover(image_hash(image))
+        processed = share_original(processed, image)
+        self.cache.set_processed(cache_key, image, processed)
+        return processed
+
+    def _cancel_upgrade(self) -> None:
+        if self._upgrade_task is not None and not self._upgrade_task.done():
+            self._upgrade_task.cancel()
+        self._upgrade_task = None
+
+    async def _async_upgrade_artwork(self, cache_key: str, resolved: ResolvedCover, preview: CoverData) -> None:
+        """Replace a published preview with the full-size artwork."""
+        url = resolved.upgrade_url
+        image: bytes | None = None
+        content_type = resolved.content_type
+        started = time.perf_counter()
+        try:
+            async with self._provider_session(resolved.provider).get(url, timeout=10) as resp:
+                resp.raise_for_status()
+                content_type = resp.headers.get("Content-Type", content_type)
+                image = await resp.read()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Full-size artwork fetch failed for %s: %s", url, err)
+        self.stats.observe("upgrade_download", (time.perf_counter() - started) * 1000, url, trace=False)
+
+        if not image:
+            return  # the full-size URL is already cached; the next play downloads it again
+
+        self.cache.put(
+            cache_key,
+            replace(resolved, artwork_url=url, content_type=content_type, image=image, upgrade_url=None),
+            artist=preview.artist,
+            title=preview.track.raw_title,
+        )
+        if self._track.track_key != preview.track_key:
+            return
+        processed = await self._async_process(cache_key, image, content_type)
+        data = replace(
+            preview,
+            artwork_url=url,
+            content_type=content_type,
+            image=image,
+            last_updated=dt_util.utcnow(),
+            image_hash=processed.image_hash,
+            renditions=processed.renditions,
+            palette=processed.palette,
+        )
+        self._last_cover = data
+        self.async_set_updated_data(data)
+
     async def _async_update_data(self) -> CoverData:
         """Fetch and cache cover data for current track."""
+        self._cancel_upgrade()
         async with self._lock:
-            track_key = self._track_key
-            artist = self._artist
-            title = self._title
-            album = self._album
-
-            if not track_key or (not artist and not title):
-                return self._fallback_data(track_key=None, artist=artist, title=title, album=album)
-
+            self.stats.begin_resolution()
+            started = time.perf_counter()
             try:
-                raw_title = self._raw_title
-                query = TrackQuery(
-                    artist=artist,
-                    title=title,
-                    album=album,
-                    artwork_width=self.artwork_width,
-                    artwork_height=self.artwork_height,
-                    # Pass raw title so the resolver can try it first (e.g. "Song (Remix)")
-                    # before falling back to the cleaned title ("Song").
-                    original_title=raw_title if raw_title != title else None,
-                )
-                resolved = await async_resolve_cover(
-                    session=self._session,
-                    query=query,
-                    providers=self.providers,
-                )
-            except Exception as err:  # noqa: BLE001
-                self._last_error = str(err)
-                _LOGGER.warning(
-                    "Cover resolution failed for %s (%s - %s): %s",
-                    self.source_entity_id,
-                    artist,
-                    title,
-                    err,
-                )
-                return self._fallback_data(track_key=track_key, artist=artist, title=title, album=album)
-
-            if resolved is None:
-                return self._fallback_data(track_key=track_key, artist=artist, title=title, album=album)
-
+                return await self._async_resolve_current()
+            finally:
+                self.stats.observe("total", (time.perf_counter() - started) * 1000)
+                self.stats.end_resolution()
+
+    async def _async_resolve_current(self) -> CoverData:
+        # A paused or idle room must not hold up the one that is playing; the
+        # startup refresh of an idle room yields to everything else.
+        if self.source.state == "playing":
+            priority = PRIORITY_PLAYING
+        else:
+            priority = PRIORITY_WARMUP if self._warmup else PRIORITY_PREFETCH
+        self._warmup = False
+
+        track = self._track
+        track_key = track.track_key
+        artist = track.artist
+        title = track.title
+        source_picture = self._current_source_picture
+        late_picture, self._late_picture = self._late_picture and bool(source_picture), False
+
+        if not track_key or (not artist and not title):
+            return self._fallback_data(NO_TRACK)
+        if track.skip_reason:
+            # News, jingles, ads: keep showing the last cover, no lookup.
+            self.stats.skipped += 1
+            _LOGGER.debug("Skipping %s segment %r on %s", track.skip_reason, title, self.source_entity_id)
+            return self._fallback_data(track)
+
+        if (leader := self.group_leader) is not None:
+            if leader.data is not None and leader.data.track_key == track_key:
+                if leader.data is not self.data:
+                    self.stats.group_hits += 1
+                if leader.data.image:
+                    self._last_cover = leader.data
+                return leader.data
+            if leader._track.track_key == track_key:  # noqa: SLF001
+                # The leader is resolving this track and hands the result over.
+                return self.data or self._fallback_data(track)
+
+        cache_key = f"{track_key}|{self.artwork_size}"
+        raw_title = track.raw_title
+        cached: CachedCover | None = None
+        image: bytes | None = None
+        # A late source picture replaces the cached text-search cover of this track.
+        if not late_picture:
+            with self.stats.timed("cache_lookup"):
+                cached = self.cache.get(cache_key)
+                image = await self._async_cached_image(cache_key, cached) if cached is not None else None
+            if cached is None or not image:
+                # Near-duplicate of a resolved track ("feat." order, "Remastered 2011", ...)
+                with self.stats.timed("fuzzy_lookup"):
+                    similar = self.cache.find_similar(cache_key, artist, raw_title)
+                    if similar is not None:
+                        similar_key, cached, confidence = similar
+                        image = await self._async_cached_image(similar_key, cached)
+                if similar is not None and image:
+                    _LOGGER.debug("Fuzzy cache hit for %r: %s (%.2f)", track_key, similar_key, confidence)
+                    self.stats.fuzzy_hits += 1
+                    cached = (
+                        self.cache.alias(cache_key, similar_key, artist=artist, title=raw_title, similarity=confidence)
+                        or cached
+                    )
+                else:
+                    cached = None
+            else:
+                self.stats.cache_hits += 1
+        if cached is not None and image:
             self._last_error = None
+            processed = await self._async_process(cache_key, image, cached.content_type)
             data = CoverData(
                 source_entity_id=self.source_entity_id,
-                track_key=track_key,
-                artist=artist,
-                title=title,
-                album=album,
-                provider=resolved.provider,
-                artwork_url=resolved.artwork_url,
-                content_type=resolved.content_type,
-                image=resolved.image,
+                track=track,
+                provider=cached.provider,
+                artwork_url=cached.artwork_url,
+                content_type=cached.content_type,
+                image=image,
                 last_updated=dt_util.utcnow(),
+                image_hash=processed.image_hash,
+                renditions=processed.renditions,
+                palette=processed.palette,
+                confidence=cached.confidence,
             )
             self._last_cover = data
             return data
 
+        self.stats.cache_misses += 1
+        try:
+            query = TrackQuery(
+                artist=artist,
+                title=title,
+                album=track.album,
+                artwork_width=self.artwork_width,
+                artwork_height=self.artwork_height,
+                # Pass raw title so the resolver can try it first (e.g. "Song (Remix)")
+                # before falling back to the cleaned title ("Song").
+                original_title=raw_title if raw_title != title else None,
+                source_entity_id=self.source_entity_id,
+                source_picture=source_picture,
+                progressive=True,
+            )
+            resolved = await self.engine.async_resolve(
+                query,
+                providers=[PROVIDER_SOURCE] if late_picture else self.providers,
+                key=cache_key,
+                library=self.library,
+                stats=self.stats,
+                priority=priority,
+            )
+        except Exception as err:  # noqa: BLE001
+            self._last_error = str(err)
+            _LOGGER.warning(
+                "Cover resolution failed for %s (%s - %s): %s",
+                self.source_entity_id,
+                artist,
+                title,
+                err,
+            )
+            return self._fallback_data(track)
+
+        if resolved is None:
+            return self._fallback_data(track)
+
+        self._last_error = None
+        if resolved.upgrade_url:
+            # Cache the full-size URL without bytes right away: if the upgrade fails or
+            # is cancelled by the next refresh, the next play downloads it instead of
+            # searching again (the preview itself is never cached).
+            url_only = replace(resolved, artwork_url=resolved.upgrade_url, image=None, upgrade_url=None)
+            self.cache.put(cache_key, url_only, artist=artist, title=raw_title)
+        else:
+            self.cache.put(cache_key, resolved, artist=artist, title=raw_title)
+        processed = await self._async_process(cache_key, resolved.image, resolved.content_type)
+        data = CoverData(
+            source_entity_id=self.source_entity_id,
+            track=track,
+            provider=resolved.provider,
+            artwork_url=resolved.artwork_url,
+            content_type=resolved.content_type,
+            image=resolved.image,
+            last_updated=dt_util.utcnow(),
+            image_hash=processed.image_hash,
+            renditions=processed.renditions,
+            palette=processed.palette,
+            confidence=resolved.confidence,
+        )
+        self._last_cover = data
+        if resolved.upgrade_url:
+            self._upgrade_task = self.hass.async_create_background_task(
+                self._async_upgrade_artwork(cache_key, resolved, data),
+                f"{DOMAIN} artwork upgrade {self.source_entity_id}",
+            )
+        return data
+
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await hass.config_entries.async_reload(entry.entry_id)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    coordinator = CoverCoordinator(hass, entry)
+    if not hass.data.get(DATA_VIEW_REGISTERED):
+        hass.http.register_view(CoverImageView(hass))
+        hass.data[DATA_VIEW_REGISTERED] = True
+    if not hass.data.get(DATA_WEBSOCKET_REGISTERED):
+        async_register_websocket_commands(hass)
+        hass.data[DATA_WEBSOCKET_REGISTERED] = True
+
+    engine = await async_get_resolver_engine(hass)
+    coordinator = CoverCoordinator(hass, entry, engine)
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     await coordinator.async_start()
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    coordinator: CoverCoordinator = hass.data[DOMAIN][entry.entry_id]
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, coordinator.platforms)
     if unload_ok:
-        coordinator: CoverCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DOMAIN].pop(entry.entry_id)
         await coordinator.async_stop()
+        if not hass.data[DOMAIN]:
+            await async_release_resolver_engine(hass)
+            if DATA_LIBRARY_INDEXES in hass.data:
+                from .local_library import async_release_library_indexes  # noqa: PLC0415
+
+                async_release_library_indexes(hass)
     return unload_ok
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any, AsyncContextManager
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    COVER_CACHE_MAX_ENTRIES,
+    COVER_CACHE_MAX_IMAGES,
+    COVER_CACHE_REVALIDATE_AGE,
+    COVER_CACHE_REVALIDATE_INTERVAL,
+    COVER_CACHE_SAVE_DELAY,
+    COVER_CACHE_STORAGE_KEY,
+    COVER_CACHE_STORAGE_VERSION,
+    DATA_COVER_CACHE,
+    PROVIDER_ITUNES,
+)
+from .fuzzy import FuzzyIndex
+from .metadata import intern_text
+from .models import ResolvedCover
+from .palette import Palette
+from .renditions import ProcessedCover, Rendition
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CachedCover:
+    provider: str
+    artwork_url: str | None
+    content_type: str
+    track_id: int | None = None
+    collection_id: int | None = None
+    validated_at: float = 0.0  # wall-clock seconds of the last resolve/revalidation
+    artist: str | None = None  # as played, for the near-duplicate index
+    title: str | None = None
+    confidence: float | None = None  # match confidence of the provider result
+    image: bytes | None = None  # kept in memory only, never persisted
+    image_hash: str | None = None
+    renditions: dict[int, Rendition] | None = None  # evicted together with image
+    palette: Palette | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "artwork_url": self.artwork_url,
+            "content_type": self.content_type,
+            "track_id": self.track_id,
+            "collection_id": self.collection_id,
+            "validated_at": self.validated_at,
+            "artist": self.artist,
+            "title": self.title,
+            "confidence": self.confidence,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CachedCover:
+        # Provider, content type and artist repeat across thousands of entries.
+        return cls(
+            provider=intern_text(str(data.get("provider") or "")) or "",
+            artwork_url=data.get("artwork_url"),
+            content_type=intern_text(str(data.get("content_type") or "image/jpeg")) or "image/jpeg",
+            track_id=data.get("track_id"),
+            collection_id=data.get("collection_id"),
+            validated_at=float(data.get("validated_at") or 0.0),
+            artist=intern_text(data.get("artist")),
+            title=intern_text(data.get("title")),
+            confidence=data.get("confidence"),
+        )
+
+    @property
+    def lookup_id(self) -> int | None:
+        return self.track_id or self.collection_id
+
+
+def _size_group(key: str) -> str:
+    """Cache keys end in ``|<artwork size>``; near-duplicates must match in size."""
+    return key.rsplit("|", 1)[-1]
+
+
+def _drop_image(entry: CachedCover) -> None:
+    entry.image = None
+    entry.image_hash = None
+    entry.renditions = None
+    entry.palette = None
+
+
+class CoverCache:
+    """Domain-wide cache of resolved covers, keyed by track key.
+
+    Metadata (provider, artwork URL, iTunes ids) is persisted through a ``Store``
+    so a restart does not repeat text searches; image bytes are only held for the
+    ``COVER_CACHE_MAX_IMAGES`` most recently used entries and re-downloaded from
+    the stored artwork URL otherwise. A trigram index over the stored
+    artist/title (rebuilt on load) finds near-duplicates of a new track key.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, COVER_CACHE_STORAGE_VERSION, COVER_CACHE_STORAGE_KEY)
+        # Plain dict in LRU order (re-inserted on use): half the per-entry size of an OrderedDict.
+        self._entries: dict[str, CachedCover] = {}
+        self._image_keys: OrderedDict[str, None] = OrderedDict()
+        self._fuzzy = FuzzyIndex()
+        self._unsub_revalidate: Any | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load()
+        covers = stored.get("covers") if isinstance(stored, dict) else None
+        if not isinstance(covers, dict):
+            return
+        for key, data in covers.items():
+            if isinstance(data, dict):
+                entry = self._entries[key] = CachedCover.from_dict(data)
+                self._fuzzy.add(key, entry.artist, entry.title, _size_group(key))
+        _LOGGER.debug("Loaded %d cached covers", len(self._entries))
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"covers": {key: entry.as_dict() for key, entry in self._entries.items()}}
+
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, COVER_CACHE_SAVE_DELAY)
+
+    def get(self, key: str) -> CachedCover | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._entries[key] = entry
+        return entry
+
+    def put(
+        self,
+        key: str,
+        resolved: ResolvedCover,
+        *,
+        artist: str | None = None,
+        title: str | None = None,
+    ) -> CachedCover:
+        entry = CachedCover(
+            provider=resolved.provider,
+            artwork_url=resolved.artwork_url,
+            content_type=intern_text(resolved.content_type) or "image/jpeg",
+            track_id=resolved.track_id,
+            collection_id=resolved.collection_id,
+            validated_at=time.time(),
+            artist=artist,
+            title=title,
+            confidence=resolved.confidence,
+        )
+        self._insert(key, entry)
+        self.set_image(key, resolved.image, resolved.content_type)
+        return entry
+
+    def _insert(self, key: str, entry: CachedCover) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = entry
+        self._fuzzy.add(key, entry.artist, entry.title, _size_group(key))
+        while len(self._entries) > COVER_CACHE_MAX_ENTRIES:
+            evicted = next(iter(self._entries))
+            del self._entries[evicted]
+            self._image_keys.pop(evicted, None)
+            self._fuzzy.remove(evicted)
+        self._async_schedule_save()
+
+    def find_similar(self, key: str, artist: str | None, title: str | None) -> tuple[str, CachedCover, float] | None:
+        """Return ``(key, entry, confidence)`` of a near-duplicate of ``key`` at the same size."""
+        match = self._fuzzy.find(artist, title, _size_group(key))
+        if match is None or match[0] == key:
+            return None
+        entry = self._entries.get(match[0])
+        return (match[0], entry, match[1]) if entry is not None else None
+
+    def alias(
+        self, key: str, source_key: str, *, artist: str | None, title: str | None, similarity: float = 1.0
+    ) -> CachedCover | None:
+        """Store the cover of ``source_key`` under ``key`` so the next play is an exact hit.
+
+        The confidence of the alias is that of the source scaled by ``similarity``.
+        """
+        source = self._entries.get(source_key)
+        if source is None:
+            return None
+        entry = CachedCover(
+            provider=source.provider,
+            artwork_url=source.artwork_url,
+            content_type=source.content_type,
+            track_id=source.track_id,
+            collection_id=source.collection_id,
+            validated_at=source.validated_at,
+            artist=artist,
+            title=title,
+            confidence=round(source.confidence * similarity, 3) if source.confidence is not None else None,
+        )
+        self._insert(key, entry)
+        if source.image:
+            self.set_image(key, source.image, source.content_type)
+            entry.image_hash, entry.renditions, entry.palette = source.image_hash, source.renditions, source.palette
+        return entry
+
+    def set_image(self, key: str, image: bytes | None, content_type: str) -> None:
+        entry = self._entries.get(key)
+        if entry is None or not image:
+            return
+        if entry.image is not image:
+            _drop_image(entry)
+        entry.image = image
+        entry.content_type = intern_text(content_type) or entry.content_type
+        self._image_keys[key] = None
+        self._image_keys.move_to_end(key)
+        while len(self._image_keys) > COVER_CACHE_MAX_IMAGES:
+            stale, _ = self._image_keys.popitem(last=False)
+            if (stale_entry := self._entries.get(stale)) is not None:
+                _drop_image(stale_entry)
+
+    def find_by_hash(self, image_hash: str) -> CachedCover | None:
+        """Return the in-memory entry whose image has ``image_hash`` (scans only entries holding bytes)."""
+        for key in reversed(self._image_keys):
+            entry = self._entries.get(key)
+            if entry is not None and entry.image_hash == image_hash:
+                return entry
+        return None
+
+    def set_processed(self, key: str, image: bytes, processed: ProcessedCover) -> None:
+        """Attach hash, rendition ladder and palette of ``image``; ignored if the entry moved on."""
+        entry = self._entries.get(key)
+        if entry is None or entry.image is not image:
+            return
+        entry.image_hash = processed.image_hash
+        entry.renditions = processed.renditions
+        entry.palette = processed.palette
+
+    async def async_revalidate(self, session, limiter: AsyncContextManager[Any] | None = None) -> int:
+        """Refresh stale iTunes entries via bulk id lookups instead of text searches.
+
+        Entries whose artwork moved get the new URL (and lose their cached bytes);
+        entries iTunes no longer knows are dropped so the next play searches again.
+        Ids of batches that came back empty or mostly empty are left stale and
+        retried at the next run. ``limiter`` paces the lookup requests. Returns the
+        number of entries checked.
+        """
+        from .itunes import artwork_size_from_url, artwork_url_for_item, async_itunes_lookup  # noqa: PLC0415
+
+        now = time.time()
+        max_age = COVER_CACHE_REVALIDATE_AGE.total_seconds()
+        by_id: dict[int, list[str]] = {}
+        for key, entry in self._entries.items():
+            if entry.provider != PROVIDER_ITUNES or entry.lookup_id is None:
+                continue
+            if now - entry.validated_at < max_age:
+                continue
+            by_id.setdefault(entry.lookup_id, []).append(key)
+
+        if not by_id:
+            return 0
+
+        checked = sum(len(keys) for keys in by_id.values())
+        found, answered = await async_itunes_lookup(session, by_id, limiter)
+
+        changed = dropped = 0
+        for item_id, keys in by_id.items():
+            item = found.get(item_id)
+            if item is None and item_id not in answered:
+                continue  # no trustworthy answer: keep the entries stale, retry next time
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if item is None:
+                    del self._entries[key]
+                    self._image_keys.pop(key, None)
+                    self._fuzzy.remove(key)
+                    dropped += 1
+                    continue
+                size = artwork_size_from_url(entry.artwork_url or "") or 600
+                artwork_url = artwork_url_for_item(item, size)
+                if artwork_url and artwork_url != entry.artwork_url:
+                    entry.artwork_url = artwork_url
+                    _drop_image(entry)
+                    self._image_keys.pop(key, None)
+                    changed += 1
+                entry.validated_at = now
+
+        _LOGGER.debug(
+            "Revalidated %d cached covers (%d ids, %d changed, %d dropped)",
+            checked,
+            len(by_id),
+            changed,
+            dropped,
+        )
+        self._async_schedule_save()
+        return checked
+
+    @callback
+    def async_start(self, session, limiter: AsyncContextManager[Any] | None = None) -> None:
+        """Revalidate stale entries periodically (one bulk lookup per 200 ids)."""
+        if self._unsub_revalidate is not None:
+            return
+
+        async def _async_revalidate(_now) -> None:
+            try:
+                await self.async_revalidate(session, limiter)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Cover cache revalidation failed: %s", err)
+
+        self._unsub_revalidate = async_track_time_interval(
+            self.hass, _async_revalidate, COVER_CACHE_REVALIDATE_INTERVAL
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        if self._unsub_revalidate is not None:
+            self._unsub_revalidate()
+            self._unsub_revalidate = None
+
+
+async def async_get_cover_cache(hass: HomeAssistant) -> CoverCache:
+    """Return the domain-wide cover cache, loading it from storage on first use."""
+    cache: CoverCache | None = hass.data.get(DATA_COVER_CACHE)
+    if cache is None:
+        cache = hass.data[DATA_COVER_CACHE] = CoverCache(hass)
+        await cache.async_load()
+    return cache
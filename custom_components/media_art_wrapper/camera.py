@@ -8,8 +8,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import CoverCoordinator, CoverData
-from .const import DOMAIN
-from .helpers import FALLBACK_IMAGE, source_name
+from .const import DOMAIN, UNRECORDED_ATTRIBUTES
+from .helpers import fallback_image, source_name
+from .views import async_signed_cover_url
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
@@ -20,6 +21,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 class MediaCoverArtCamera(CoordinatorEntity[CoverCoordinator], Camera):
     _attr_has_entity_name = True
     _attr_icon = "mdi:image"
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
 
     def __init__(self, coordinator: CoverCoordinator, entry: ConfigEntry) -> None:
         CoordinatorEntity.__init__(self, coordinator)
@@ -40,22 +42,20 @@ class MediaCoverArtCamera(CoordinatorEntity[CoverCoordinator], Camera):
         data: CoverData | None = self.coordinator.data
         if not data or not data.image:
             self.content_type = "image/png"
-            return FALLBACK_IMAGE
-        self.content_type = data.content_type or "image/jpeg"
-        return data.image
+            return fallback_image()
+        size = max(width or 0, height or 0) or self.coordinator.camera_size
+        image, content_type = data.image_for_size(size)
+        self.content_type = content_type or "image/jpeg"
+        return image
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def entity_picture(self) -> str | None:
+        # Content-addressed, signed URL: browsers cache it and refetch only on a new cover.
         data: CoverData | None = self.coordinator.data
-        return {
-            "source_entity_id": self.coordinator.source_entity_id,
-            "track_key": data.track_key if data else None,
-            "artist": data.artist if data else None,
-            "title": data.title if data else None,
-            "album": data.album if data else None,
-            "provider": data.provider if data else None,
-            "artwork_url": data.artwork_url if data else None,
-            "artwork_width": self.coordinator.artwork_width,
-            "artwork_height": self.coordinator.artwork_height,
-            "artwork_size": self.coordinator.artwork_size,
-        }
+        if data and data.image and data.image_hash:
+            return async_signed_cover_url(self.hass, data.image_hash, data.content_type, self.coordinator.camera_size)
+        return super().entity_picture
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self.coordinator.cover_attributes
@@ -12,20 +12,38 @@ from .const import (
     CONF_ARTWORK_HEIGHT,
     CONF_ARTWORK_SIZE,
     CONF_ARTWORK_WIDTH,
+    CONF_CAMERA_SIZE,
+    CONF_IMAGE_SIZE,
+    CONF_LIBRARY_PATH,
+    CONF_PLATFORMS,
+    CONF_PLAYER_SIZE,
     CONF_PROVIDERS,
+    CONF_RECORD_TRACE,
     CONF_SOURCE_ENTITY_ID,
     DEFAULT_ARTWORK_HEIGHT,
     DEFAULT_ARTWORK_SIZE,
     DEFAULT_ARTWORK_WIDTH,
     DEFAULT_PROVIDERS,
     DOMAIN,
+    PLATFORMS,
     PROVIDER_ITUNES,
+    PROVIDER_LOCAL_LIBRARY,
     PROVIDER_MUSICBRAINZ,
+    PROVIDER_SOURCE,
 )
 
 PROVIDER_OPTIONS = [
+    {"value": PROVIDER_SOURCE, "label": "Source player artwork (entity_picture)"},
     {"value": PROVIDER_ITUNES, "label": "iTunes (Apple Search API)"},
     {"value": PROVIDER_MUSICBRAINZ, "label": "MusicBrainz + Cover Art Archive"},
+    {"value": PROVIDER_LOCAL_LIBRARY, "label": "Local music library (embedded tags, folder.jpg)"},
+]
+
+PLATFORM_OPTIONS = [
+    {"value": "image", "label": "Image entity"},
+    {"value": "camera", "label": "Camera entity"},
+    {"value": "media_player", "label": "Media player wrapper"},
+    {"value": "sensor", "label": "Status and timing sensors"},
 ]
 
 
@@ -51,6 +69,7 @@ def _data_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
                 CONF_ARTWORK_HEIGHT,
                 default=defaults.get(CONF_ARTWORK_HEIGHT, defaults.get(CONF_ARTWORK_SIZE, DEFAULT_ARTWORK_HEIGHT)),
             ): vol.Coerce(int),
+            vol.Optional(CONF_LIBRARY_PATH, default=defaults.get(CONF_LIBRARY_PATH, "")): str,
         }
     )
 
@@ -80,6 +99,7 @@ class MediaCoverArtConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_PROVIDERS: user_input.get(CONF_PROVIDERS, DEFAULT_PROVIDERS),
                 CONF_ARTWORK_WIDTH: int(user_input.get(CONF_ARTWORK_WIDTH, user_input.get(CONF_ARTWORK_SIZE, DEFAULT_ARTWORK_WIDTH))),
                 CONF_ARTWORK_HEIGHT: int(user_input.get(CONF_ARTWORK_HEIGHT, user_input.get(CONF_ARTWORK_SIZE, DEFAULT_ARTWORK_HEIGHT))),
+                CONF_LIBRARY_PATH: user_input.get(CONF_LIBRARY_PATH, ""),
             }
             return self.async_create_entry(title=title, data=data)
 
@@ -115,6 +135,15 @@ class MediaCoverArtOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
                 CONF_ARTWORK_HEIGHT,
                 self.config_entry.data.get(CONF_ARTWORK_HEIGHT, self.config_entry.data.get(CONF_ARTWORK_SIZE, DEFAULT_ARTWORK_HEIGHT)),
             ),
+            CONF_LIBRARY_PATH: self.config_entry.options.get(
+                CONF_LIBRARY_PATH,
+                self.config_entry.data.get(CONF_LIBRARY_PATH, ""),
+            ),
+            CONF_IMAGE_SIZE: self.config_entry.options.get(CONF_IMAGE_SIZE, 0),
+            CONF_CAMERA_SIZE: self.config_entry.options.get(CONF_CAMERA_SIZE, 0),
+            CONF_PLAYER_SIZE: self.config_entry.options.get(CONF_PLAYER_SIZE, 0),
+            CONF_RECORD_TRACE: self.config_entry.options.get(CONF_RECORD_TRACE, False),
+            CONF_PLATFORMS: self.config_entry.options.get(CONF_PLATFORMS, [platform.value for platform in PLATFORMS]),
         }
 
         # Options allow changing providers/size; source entity stays fixed per unique_id
@@ -129,6 +158,20 @@ class MediaCoverArtOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
                 ),
                 vol.Optional(CONF_ARTWORK_WIDTH, default=defaults[CONF_ARTWORK_WIDTH]): vol.Coerce(int),
                 vol.Optional(CONF_ARTWORK_HEIGHT, default=defaults[CONF_ARTWORK_HEIGHT]): vol.Coerce(int),
+                vol.Optional(CONF_LIBRARY_PATH, default=defaults[CONF_LIBRARY_PATH]): str,
+                # Rendition size per entity (0 = artwork size); the nearest cached step is served.
+                vol.Optional(CONF_IMAGE_SIZE, default=defaults[CONF_IMAGE_SIZE]): vol.Coerce(int),
+                vol.Optional(CONF_CAMERA_SIZE, default=defaults[CONF_CAMERA_SIZE]): vol.Coerce(int),
+                vol.Optional(CONF_PLAYER_SIZE, default=defaults[CONF_PLAYER_SIZE]): vol.Coerce(int),
+                vol.Optional(CONF_RECORD_TRACE, default=defaults[CONF_RECORD_TRACE]): bool,
+                # Only the selected platforms are loaded for this entry.
+                vol.Optional(CONF_PLATFORMS, default=defaults[CONF_PLATFORMS]): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=PLATFORM_OPTIONS,
+                        multiple=True,
+                        mode=selector.SelectSelectorMode.LIST,
+                    )
+                ),
             }
         )
 
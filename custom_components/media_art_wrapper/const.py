@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
 from homeassistant.const import Platform
 
 DOMAIN = "media_art_wrapper"
 
+# All platforms an entry can provide; each entry forwards only the ones selected in its options.
 PLATFORMS: list[Platform] = [Platform.IMAGE, Platform.CAMERA, Platform.MEDIA_PLAYER, Platform.SENSOR]
 
 CONF_SOURCE_ENTITY_ID = "source_entity_id"
@@ -11,11 +14,117 @@ CONF_PROVIDERS = "providers"
 CONF_ARTWORK_SIZE = "artwork_size"
 CONF_ARTWORK_WIDTH = "artwork_width"
 CONF_ARTWORK_HEIGHT = "artwork_height"
+CONF_LIBRARY_PATH = "library_path"
+CONF_IMAGE_SIZE = "image_size"
+CONF_CAMERA_SIZE = "camera_size"
+CONF_PLAYER_SIZE = "player_size"
+CONF_RECORD_TRACE = "record_trace"
+CONF_PLATFORMS = "platforms"
 
 PROVIDER_ITUNES = "itunes"
 PROVIDER_MUSICBRAINZ = "musicbrainz"
+PROVIDER_LOCAL_LIBRARY = "local_library"
+PROVIDER_SOURCE = "source"
 
-DEFAULT_PROVIDERS: list[str] = [PROVIDER_ITUNES]
+DEFAULT_PROVIDERS: list[str] = [PROVIDER_SOURCE, PROVIDER_ITUNES]
 DEFAULT_ARTWORK_SIZE = 600
 DEFAULT_ARTWORK_WIDTH = 600
 DEFAULT_ARTWORK_HEIGHT = 600
+
+# Progressive delivery: targets at or above PROGRESSIVE_MIN_SIZE get a preview first.
+ARTWORK_PREVIEW_SIZE = 100
+PROGRESSIVE_MIN_SIZE = 300
+
+# Downscaled renditions generated per cover; entities pick the nearest step.
+RENDITION_SIZES: tuple[int, ...] = (128, 300, 600, 1200)
+
+# Output types offered to clients that list them in ``Accept``, most compact first,
+# and how many re-encoded covers are kept.
+TRANSCODE_TYPES: tuple[str, ...] = ("image/avif", "image/webp")
+COVER_VARIANTS_MAX = 128
+
+# Cover URLs carry an ``authSig`` valid this long; a signature is reused for half of
+# it and entity states are rewritten often enough that a shown URL never expires.
+COVER_URL_EXPIRATION = timedelta(hours=24)
+COVER_URL_REFRESH_INTERVAL = timedelta(hours=6)
+SIGNED_COVER_URLS_MAX = 64
+
+# Colours extracted per cover and BlurHash detail (x, y components)
+PALETTE_COLORS = 6
+BLURHASH_COMPONENTS: tuple[int, int] = (4, 4)
+
+# Change with every track – kept out of the recorder to limit history growth.
+UNRECORDED_ATTRIBUTES = frozenset({"artwork_url", "track_key", "last_error", "palette", "blurhash"})
+
+# Shared hass.data keys (domain-wide, not per config entry)
+DATA_LIBRARY_INDEXES = f"{DOMAIN}_library_indexes"
+DATA_COVER_CACHE = f"{DOMAIN}_cover_cache"
+DATA_VIEW_REGISTERED = f"{DOMAIN}_view_registered"
+DATA_RESOLVER_ENGINE = f"{DOMAIN}_resolver_engine"
+DATA_RESOLVER_ENGINE_LOCK = f"{DOMAIN}_resolver_engine_lock"
+DATA_STATION_RULES = f"{DOMAIN}_station_rules"
+DATA_STARTUP_NEXT_REFRESH = f"{DOMAIN}_startup_next_refresh"
+DATA_WEBSOCKET_REGISTERED = f"{DOMAIN}_websocket_registered"
+DATA_SIGNED_COVER_URLS = f"{DOMAIN}_signed_cover_urls"
+
+# Dispatcher signal sent with the coordinator whenever it publishes a new CoverData
+SIGNAL_COVER_UPDATED = f"{DOMAIN}_cover_updated"
+
+# WebSocket pushes inline the smallest rendition as a data URI up to this size
+WS_THUMBNAIL_MAX_BYTES = 16 * 1024
+
+# Per-station metadata rules, relative to the HA config directory
+STATION_RULES_FILE = f"{DOMAIN}/station_rules.json"
+STATION_RULES_CHECK_INTERVAL = 60  # seconds between mtime checks, done on track changes
+
+LIBRARY_REFRESH_INTERVAL = timedelta(minutes=15)
+
+COVER_CACHE_STORAGE_KEY = f"{DOMAIN}.cover_cache"
+COVER_CACHE_STORAGE_VERSION = 1
+COVER_CACHE_SAVE_DELAY = 30  # seconds
+COVER_CACHE_MAX_ENTRIES = 5000
+COVER_CACHE_MAX_IMAGES = 64  # entries whose image bytes stay in memory
+COVER_CACHE_REVALIDATE_INTERVAL = timedelta(hours=12)
+COVER_CACHE_REVALIDATE_AGE = timedelta(days=7)
+
+# Near-duplicate lookup in the cover cache (Dice similarity of title/artist trigrams)
+FUZZY_MATCH_THRESHOLD = 0.85
+FUZZY_MATCH_MIN_ARTIST = 0.8
+
+# Match confidence (0..1) of text searches. iTunes matches below CONFIDENCE_HIGH get a
+# concurrent second opinion from MusicBrainz when it is one of the selected providers.
+CONFIDENCE_HIGH = 0.8
+
+# Opt-in metadata trace (<config>/media_art_wrapper/traces/<entity>.jsonl)
+TRACE_FLUSH_DELAY = 10  # seconds
+TRACE_MAX_BYTES = 50 * 1024 * 1024
+
+# Shared resolver engine: worker pool size and queue priorities (lower runs first)
+ENGINE_WORKERS = 4
+PRIORITY_PLAYING = 0
+PRIORITY_PREFETCH = 1
+PRIORITY_WARMUP = 2
+
+# Dedicated image pool (decode, renditions, palette): parallel jobs and waiting jobs.
+# With IMAGE_POOL_PROCESSES the jobs run in spawned worker processes instead of
+# threads; each process imports the integration (and with it HA core) once.
+IMAGE_POOL_WORKERS = 2
+IMAGE_QUEUE_LIMIT = 8
+IMAGE_POOL_PROCESSES = False
+
+# Dedicated HTTP connection pools for the artwork providers (one per provider,
+# shared by the hosts it talks to, e.g. the iTunes API and Apple's image CDN).
+# Idle connections are kept open across track changes so a new track does not
+# pay for DNS, TCP and TLS again.
+POOLED_PROVIDERS: tuple[str, ...] = (PROVIDER_ITUNES, PROVIDER_MUSICBRAINZ)
+PROVIDER_POOL_LIMIT = 8  # connections per provider
+PROVIDER_POOL_LIMIT_PER_HOST = 4
+PROVIDER_KEEPALIVE = 300  # seconds an idle connection stays open
+PROVIDER_DNS_TTL = 600  # seconds
+
+# Initial refreshes after HA start are spaced this far apart (seconds) across entries.
+STARTUP_REFRESH_STAGGER = 2.0
+
+# Minimum spacing (seconds) between calls per provider, across all entries.
+# MusicBrainz asks for at most one request per second.
+PROVIDER_MIN_INTERVAL: dict[str, float] = {PROVIDER_MUSICBRAINZ: 1.0, PROVIDER_ITUNES: 0.25}
@@ -1,61 +1,259 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import replace
-from typing import Iterable
+import time
+from typing import TYPE_CHECKING, Any, AsyncContextManager, Iterable, Mapping
 
-from .const import PROVIDER_ITUNES, PROVIDER_MUSICBRAINZ
-from .itunes import async_itunes_resolve
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import (
+    CONFIDENCE_HIGH,
+    FUZZY_MATCH_THRESHOLD,
+    PROVIDER_ITUNES,
+    PROVIDER_LOCAL_LIBRARY,
+    PROVIDER_MUSICBRAINZ,
+    PROVIDER_SOURCE,
+)
+from .fuzzy import match_confidence
 from .models import ResolvedCover, TrackQuery
-from .musicbrainz import async_musicbrainz_resolve
+from .stats import ResolutionStats
+
+if TYPE_CHECKING:
+    from .local_library import LocalLibraryIndex
+    from .musicbrainz import MusicBrainzMatch
+    from .sessions import ProviderSessions
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _provider_session(provider: str, session, sessions: ProviderSessions | None):
+    """The provider's own connection pool when it has one, else the shared ``session``."""
+    pooled = sessions.get(provider) if sessions is not None else None
+    return pooled if pooled is not None else session
+
+
+async def _async_musicbrainz_opinion(
+    *,
+    session,
+    query: TrackQuery,
+    stats: ResolutionStats,
+    limiters: Mapping[str, AsyncContextManager[Any]] | None,
+) -> MusicBrainzMatch | None:
+    from .musicbrainz import async_musicbrainz_match  # noqa: PLC0415
+
+    limiter = limiters.get(PROVIDER_MUSICBRAINZ) if limiters else None
+    try:
+        with stats.timed("second_opinion", PROVIDER_MUSICBRAINZ):
+            return await async_musicbrainz_match(session=session, query=query, stats=stats, limiter=limiter)
+    except HomeAssistantError as err:
+        stats.provider(PROVIDER_MUSICBRAINZ).errors += 1
+        _LOGGER.debug("Second opinion failed (title=%r): %s", query.title, err)
+        return None
+
+
+async def _async_itunes_gated(
+    *,
+    session,
+    sessions: ProviderSessions | None,
+    query: TrackQuery,
+    stats: ResolutionStats,
+    limiters: Mapping[str, AsyncContextManager[Any]] | None,
+) -> ResolvedCover | None:
+    """iTunes with a MusicBrainz second opinion for borderline matches.
+
+    Matches at or above ``CONFIDENCE_HIGH`` are fetched right away. Below it the
+    MusicBrainz search runs while the iTunes artwork downloads: agreement raises
+    the confidence, a MusicBrainz recording that fits the query better replaces
+    the iTunes match.
+    """
+    from .itunes import async_itunes_fetch, async_itunes_search  # noqa: PLC0415
+    from .musicbrainz import async_musicbrainz_fetch  # noqa: PLC0415
+
+    mb_session = _provider_session(PROVIDER_MUSICBRAINZ, session, sessions)
+    session = _provider_session(PROVIDER_ITUNES, session, sessions)
+    limiter = limiters.get(PROVIDER_ITUNES) if limiters else None
+    match = await async_itunes_search(session=session, query=query, stats=stats, limiter=limiter)
+    if match is None:
+        return None
+    if match.confidence >= CONFIDENCE_HIGH:
+        return await async_itunes_fetch(session=session, query=query, match=match, stats=stats)
+
+    stats.second_opinions += 1
+    fetch = asyncio.ensure_future(async_itunes_fetch(session=session, query=query, match=match, stats=stats))
+    try:
+        opinion = await _async_musicbrainz_opinion(session=mb_session, query=query, stats=stats, limiters=limiters)
+    except BaseException:
+        fetch.cancel()
+        raise
+    try:
+        resolved = await fetch
+    except HomeAssistantError:
+        if opinion is None:
+            raise
+        resolved = None
+    if opinion is None:
+        return resolved
+
+    if match_confidence(match.artist, match.title, opinion.artist, opinion.title) >= FUZZY_MATCH_THRESHOLD:
+        stats.second_opinion_agreed += 1
+        if resolved is not None:
+            confidence = 1 - (1 - match.confidence) * (1 - opinion.confidence)
+            return replace(resolved, confidence=round(confidence, 3))
+    elif resolved is not None and opinion.confidence <= match_confidence(
+        query.artist, query.title, match.artist, match.title
+    ):
+        return resolved
+
+    # The iTunes artwork is missing or MusicBrainz found the better recording.
+    fallback = await async_musicbrainz_fetch(session=mb_session, match=opinion, stats=stats)
+    if fallback is None:
+        return resolved
+    stats.second_opinion_overruled += resolved is not None
+    return fallback
+
+
+async def _call_provider(
+    provider: str,
+    *,
+    session,
+    sessions: ProviderSessions | None = None,
+    query: TrackQuery,
+    library: LocalLibraryIndex | None,
+    hass: HomeAssistant | None,
+    stats: ResolutionStats,
+    limiters: Mapping[str, AsyncContextManager[Any]] | None = None,
+    second_opinion: bool = False,
+) -> ResolvedCover | None:
+    # Provider modules are imported on first use so unused providers cost nothing at startup.
+    if provider == PROVIDER_SOURCE:
+        from .source_art import async_source_art_resolve  # noqa: PLC0415
+
+        return await async_source_art_resolve(hass=hass, session=session, query=query, stats=stats)
+    if provider == PROVIDER_LOCAL_LIBRARY:
+        from .local_library import async_local_library_resolve  # noqa: PLC0415
+
+        return await async_local_library_resolve(library=library, query=query)
+    if provider == PROVIDER_ITUNES:
+        if second_opinion:
+            return await _async_itunes_gated(
+                session=session, sessions=sessions, query=query, stats=stats, limiters=limiters
+            )
+        from .itunes import async_itunes_resolve  # noqa: PLC0415
+
+        return await async_itunes_resolve(
+            session=_provider_session(provider, session, sessions),
+            query=query,
+            stats=stats,
+            limiter=limiters.get(provider) if limiters else None,
+        )
+    if provider == PROVIDER_MUSICBRAINZ:
+        from .musicbrainz import async_musicbrainz_resolve  # noqa: PLC0415
+
+        return await async_musicbrainz_resolve(
+            session=_provider_session(provider, session, sessions),
+            query=query,
+            stats=stats,
+            limiter=limiters.get(provider) if limiters else None,
+        )
+    _LOGGER.debug("Unknown provider '%s' (skipping)", provider)
+    return None
+
+
 async def _try_providers(
     *,
     session,
+    sessions: ProviderSessions | None = None,
     query: TrackQuery,
     provider_list: list[str],
+    library: LocalLibraryIndex | None = None,
+    hass: HomeAssistant | None = None,
+    stats: ResolutionStats,
+    limiters: Mapping[str, AsyncContextManager[Any]] | None = None,
 ) -> ResolvedCover | None:
     """Try each provider once with the given query. Returns first match or None."""
     for provider in provider_list:
+        counters = stats.provider(provider)
+        started = time.perf_counter()
         try:
-            if provider == PROVIDER_ITUNES:
-                resolved = await async_itunes_resolve(session=session, query=query)
-                if resolved:
-                    return resolved
-                continue
-
-            if provider == PROVIDER_MUSICBRAINZ:
-                resolved = await async_musicbrainz_resolve(session=session, query=query)
-                if resolved:
-                    return resolved
-                continue
-
-            _LOGGER.debug("Unknown provider '%s' (skipping)", provider)
-
+            resolved = await _call_provider(
+                provider,
+                session=session,
+                sessions=sessions,
+                query=query,
+                library=library,
+                hass=hass,
+                stats=stats,
+                limiters=limiters,
+                # MusicBrainz, when selected, double-checks borderline iTunes matches.
+                second_opinion=PROVIDER_MUSICBRAINZ in provider_list,
+            )
         except Exception as err:  # noqa: BLE001
+            counters.errors += 1
             _LOGGER.debug("Provider '%s' failed (title=%r): %s", provider, query.title, err)
+            continue
+        finally:
+            counters.latency.observe((time.perf_counter() - started) * 1000)
+
+        if resolved:
+            counters.hits += 1
+            return resolved
+        counters.misses += 1
 
     return None
 
 
-async def async_resolve_cover(*, session, query: TrackQuery, providers: Iterable[str]) -> ResolvedCover | None:
+async def async_resolve_cover(
+    *,
+    session,
+    sessions: ProviderSessions | None = None,
+    query: TrackQuery,
+    providers: Iterable[str],
+    library: LocalLibraryIndex | None = None,
+    hass: HomeAssistant | None = None,
+    stats: ResolutionStats | None = None,
+    limiters: Mapping[str, AsyncContextManager[Any]] | None = None,
+) -> ResolvedCover | None:
     """Resolve cover art with a staged title fallback strategy.
 
+    Stage 0 – the source player's own artwork (``source`` provider): one LAN
+              request instead of several text searches; skipped when the
+              source exposes no current picture or only a placeholder.
     Stage 1 – original title (e.g. "Song (Remix)"): lets providers find a
               remix-specific cover if one exists.
     Stage 2 – cleaned title (e.g. "Song"): strips remix/edit annotations and
               retries so the original release cover is used as a fallback.
 
+    ``library`` is the local music index used by the ``local_library`` provider;
+    it is ignored when that provider is not selected. ``stats`` collects
+    per-provider counters and per-stage timings; ``limiters`` (provider ->
+    async context manager) pace every API request of providers with request
+    limits, not just the start of a resolution (artwork downloads are not paced).
+    ``sessions`` holds the per-provider connection pools; providers without
+    one, and all providers when it is omitted, use ``session``.
+
     Returns the first successful result or None (callers should show the
     default fallback logo in that case).
     """
+    stats = stats or ResolutionStats()
     provider_list = [p for p in providers if isinstance(p, str)]
     if not provider_list:
         provider_list = [PROVIDER_ITUNES]
 
+    if PROVIDER_SOURCE in provider_list:
+        provider_list = [p for p in provider_list if p != PROVIDER_SOURCE]
+        resolved = await _try_providers(
+            session=session,
+            query=query,
+            provider_list=[PROVIDER_SOURCE],
+            hass=hass,
+            stats=stats,
+        )
+        if resolved:
+            return resolved
+
     # Build the ordered list of title variants to try.
     # original_title is set only when it differs from the cleaned title.
     if query.original_title and query.original_title != query.title:
@@ -66,7 +264,16 @@ async def async_resolve_cover(*, session, query: TrackQuery, providers: Iterable
     for stage_title in title_stages:
         stage_query = replace(query, title=stage_title, original_title=None) if stage_title != query.title else query
         _LOGGER.debug("Cover search stage title=%r", stage_title)
-        resolved = await _try_providers(session=session, query=stage_query, provider_list=provider_list)
+        resolved = await _try_providers(
+            session=session,
+            sessions=sessions,
+            query=stage_query,
+            provider_list=provider_list,
+            library=library,
+            hass=hass,
+            stats=stats,
+            limiters=limiters,
+        )
         if resolved:
             return resolved
 
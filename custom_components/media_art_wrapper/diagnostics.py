@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import CoverCoordinator, CoverData
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return resolver timings, provider counters and cache state for this entry."""
+    coordinator: CoverCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data: CoverData | None = coordinator.data
+    library = coordinator.library
+    recorder = coordinator.recorder
+
+    return {
+        "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+        "source": {
+            "entity_id": coordinator.source_entity_id,
+            "state": coordinator.source.state,
+        },
+        "cover": {
+            "track_key": data.track_key,
+            "provider": data.provider,
+            "artwork_url": data.artwork_url,
+            "content_type": data.content_type,
+            "image_bytes": len(data.image) if data.image else 0,
+            "image_hash": data.image_hash,
+            "renditions": {size: len(r.image) for size, r in sorted(data.renditions.items())},
+            "palette": data.palette.as_attributes() if data.palette else None,
+            "last_updated": data.last_updated.isoformat() if data.last_updated else None,
+        }
+        if data
+        else None,
+        "group": {
+            "members": list(coordinator.group_members),
+            "leader": leader.source_entity_id if (leader := coordinator.group_leader) else None,
+        },
+        "last_error": coordinator.last_error,
+        "cache": {"entries": len(coordinator.cache)},
+        "engine": {
+            "pending": coordinator.engine.pending,
+            "images": coordinator.engine.images.as_dict(),
+            "http": coordinator.engine.sessions.as_dict(),
+        },
+        "library": {"root": library.root, "tracks": library.track_count} if library else None,
+        "trace": {"path": recorder.path, "events": recorder.events} if recorder else None,
+        "stats": coordinator.stats.as_dict(),
+    }
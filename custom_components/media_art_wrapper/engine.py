@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import itertools
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import aiohttp_client
+
+from .cache import CoverCache, async_get_cover_cache
+from .const import (
+    DATA_COVER_CACHE,
+    DATA_RESOLVER_ENGINE,
+    DATA_RESOLVER_ENGINE_LOCK,
+    DOMAIN,
+    ENGINE_WORKERS,
+    PRIORITY_PLAYING,
+    PROVIDER_ITUNES,
+    PROVIDER_MIN_INTERVAL,
+)
+from .cover_resolver import async_resolve_cover
+from .imaging import ImagePool
+from .models import ResolvedCover, TrackQuery
+from .sessions import ProviderSessions
+from .stats import ResolutionStats
+
+if TYPE_CHECKING:
+    from .local_library import LocalLibraryIndex
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Space consecutive calls at least ``min_interval`` seconds apart."""
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._next_allowed = 0.0
+
+    async def __aenter__(self) -> None:
+        async with self._lock:
+            delay = self._next_allowed - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_allowed = time.monotonic() + self.min_interval
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+@dataclass(order=True, slots=True)
+class _Job:
+    priority: int
+    seq: int
+    key: str = field(compare=False)
+    query: TrackQuery = field(compare=False)
+    providers: list[str] = field(compare=False)
+    library: LocalLibraryIndex | None = field(compare=False)
+    stats: ResolutionStats = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    queued_at: float = field(default_factory=time.perf_counter, compare=False)
+
+
+class ResolverEngine:
+    """Domain-wide resolver shared by all config entries.
+
+    Owns the cover cache, the HTTP sessions (Home Assistant's shared one plus a
+    connection pool per artwork provider), one rate limiter per provider, the
+    image pool and a fixed pool of ``ENGINE_WORKERS`` workers, so outbound
+    concurrency stays the same whether one room or twenty are configured. Coordinators submit queries
+    with a priority (``PRIORITY_PLAYING`` < ``PRIORITY_PREFETCH`` <
+    ``PRIORITY_WARMUP``); identical queries in flight share one resolution.
+    """
+
+    def __init__(self, hass: HomeAssistant, cache: CoverCache) -> None:
+        self.hass = hass
+        self.cache = cache
+        self.session = aiohttp_client.async_get_clientsession(hass)
+        self.sessions = ProviderSessions(hass)
+        self.limiters = {provider: RateLimiter(interval) for provider, interval in PROVIDER_MIN_INTERVAL.items()}
+        self.images = ImagePool(hass)
+        self._queue: asyncio.PriorityQueue[_Job] = asyncio.PriorityQueue()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._seq = itertools.count()
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def pending(self) -> int:
+        return len(self._inflight)
+
+    def async_start(self) -> None:
+        for index in range(ENGINE_WORKERS - len(self._workers)):
+            self._workers.append(
+                self.hass.async_create_background_task(self._async_worker(), f"{DOMAIN} resolver worker {index}")
+            )
+
+    async def async_stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        for future in self._inflight.values():
+            future.cancel()
+        self._inflight.clear()
+        self.images.async_stop()
+        self.cache.async_stop()
+        await self.sessions.async_close()
+
+    async def async_resolve(
+        self,
+        query: TrackQuery,
+        *,
+        providers: list[str],
+        key: str,
+        library: LocalLibraryIndex | None = None,
+        stats: ResolutionStats | None = None,
+        priority: int = PRIORITY_PLAYING,
+    ) -> ResolvedCover | None:
+        """Queue ``query`` and wait for its result.
+
+        ``key`` identifies the query (track and size); a second request for the
+        same key joins the pending one. A more urgent duplicate is queued again
+        so it is not stuck behind its lower-priority twin.
+        """
+        key = f"{key}|{','.join(providers)}"
+        future = self._inflight.get(key)
+        if future is None:
+            future = self._inflight[key] = self.hass.loop.create_future()
+        self._queue.put_nowait(
+            _Job(priority, next(self._seq), key, query, providers, library, stats or ResolutionStats(), future)
+        )
+        # Shielded: a caller giving up must not cancel the result for others.
+        return await asyncio.shield(future)
+
+    async def _async_worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.future.done():
+                    continue  # already resolved through a higher-priority duplicate
+                job.stats.observe("queue_wait", (time.perf_counter() - job.queued_at) * 1000)
+                try:
+                    resolved = await async_resolve_cover(
+                        session=self.session,
+                        sessions=self.sessions,
+                        query=job.query,
+                        providers=job.providers,
+                        library=job.library,
+                        hass=self.hass,
+                        stats=job.stats,
+                        limiters=self.limiters,
+                    )
+                except Exception as err:  # noqa: BLE001
+                    if not job.future.done():
+                        job.future.set_exception(err)
+                else:
+                    if not job.future.done():
+                        job.future.set_result(resolved)
+                finally:
+                    if self._inflight.get(job.key) is job.future:
+                        del self._inflight[job.key]
+            finally:
+                self._queue.task_done()
+
+
+def _engine_lock(hass: HomeAssistant) -> asyncio.Lock:
+    lock: asyncio.Lock | None = hass.data.get(DATA_RESOLVER_ENGINE_LOCK)
+    if lock is None:
+        lock = hass.data[DATA_RESOLVER_ENGINE_LOCK] = asyncio.Lock()
+    return lock
+
+
+async def async_get_resolver_engine(hass: HomeAssistant) -> ResolverEngine:
+    """Return the domain-wide resolver engine, creating it on first use.
+
+    Entries are set up concurrently; the lock makes every caller wait for the
+    one engine (and its fully loaded cache) instead of building its own.
+    """
+    async with _engine_lock(hass):
+        engine: ResolverEngine | None = hass.data.get(DATA_RESOLVER_ENGINE)
+        if engine is None:
+            cache = await async_get_cover_cache(hass)
+            engine = hass.data[DATA_RESOLVER_ENGINE] = ResolverEngine(hass, cache)
+            engine.async_start()
+            # Revalidation is a bulk iTunes lookup: keep it on the iTunes pool.
+            cache.async_start(engine.sessions.get(PROVIDER_ITUNES), engine.limiters.get(PROVIDER_ITUNES))
+    return engine
+
+
+async def async_release_resolver_engine(hass: HomeAssistant) -> None:
+    """Stop the engine and drop the shared cache once the last entry is unloaded."""
+    async with _engine_lock(hass):
+        engine: ResolverEngine | None = hass.data.pop(DATA_RESOLVER_ENGINE, None)
+        if engine is not None:
+            await engine.async_stop()
+        hass.data.pop(DATA_COVER_CACHE, None)
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Collection
+import re
+import sys
+import unicodedata
+
+from .const import FUZZY_MATCH_MIN_ARTIST, FUZZY_MATCH_THRESHOLD
+
+# "feat. X" / "ft. X" / "(with X)" – guest artists are listed inconsistently.
+_RE_FEAT = re.compile(r"[(\[]\s*(?:feat\.?|ft\.?|featuring|with)\s+[^)\]]*[)\]]|\s(?:feat\.?|ft\.?|featuring)\s.*$", re.I)
+# Re-release annotations that do not change the artwork of the original recording;
+# only stripped inside brackets or after " - " so words like "Stereo Love" stay intact.
+_VERSION = r"""
+    (?:\d{4}\s+)?
+    (?:remaster(?:ed)?|deluxe|expanded|anniversary|mono|stereo|single\s+version|album\s+version|radio\s+edit)\b
+    (?:\s+(?:version|edition))?
+    (?:\s+\d{4})?
+"""
+_RE_VERSION = re.compile(rf"[(\[]\s*{_VERSION}\s*[)\]]|\s-\s+{_VERSION}\s*$", re.I | re.X)
+# Numbers that tell tracks apart: "Symphony No. 5" / "No. 6", "Pt. 1" / "Pt. 2", "Part II".
+_RE_NUMBER = re.compile(r"\b\d+\b|\b(?:part|pt|vol|no|chapter|act|book)\s+([ivx]+)\b")
+# Annotations naming a different recording: "Song (Live)", "Song - Acoustic", "Song [Club Mix]".
+_RE_ANNOTATION = re.compile(r"[(\[]([^)\]]*)[)\]]|\s-\s+(.*)$")
+_VERSION_WORDS = frozenset(
+    {"remix", "remixed", "mix", "edit", "live", "acoustic", "instrumental", "unplugged", "demo", "karaoke", "dub"}
+    | {"extended", "rework", "reprise", "orchestral", "piano", "session", "sessions"}
+)
+_RE_APOSTROPHE = re.compile(r"['’`´]")
+_RE_NON_WORD = re.compile(r"[^\w\s]")
+_ARTIST_JOINERS = {"&", "and", "und", "x", "vs", "feat", "ft", "featuring", "with", "the"}
+
+
+def _fold(value: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", _RE_APOSTROPHE.sub("", value.lower()))
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def normalize_artist(artist: str) -> str:
+    """Order-independent artist string: "Sia & David Guetta" == "David Guetta feat. Sia"."""
+    tokens = _RE_NON_WORD.sub(" ", _fold(artist)).split()
+    return " ".join(sorted(t for t in tokens if t not in _ARTIST_JOINERS))
+
+
+def normalize_title(title: str) -> str:
+    title = _RE_VERSION.sub(" ", _RE_FEAT.sub(" ", _fold(title)))
+    return " ".join(_RE_NON_WORD.sub(" ", title).split())
+
+
+def title_numbers(normalized_title: str) -> str:
+    """Numeric tokens of a normalized title, sorted and space-separated ("" for none).
+
+    Tracks whose numbers differ never match.
+    """
+    return " ".join(sorted({match.group(1) or match.group(0) for match in _RE_NUMBER.finditer(normalized_title)}))
+
+
+def title_versions(title: str) -> str:
+    """Version words in the annotations of a raw title, sorted and space-separated ("" for none).
+
+    Live, remix, acoustic, … recordings are tracks of their own and never match
+    the original. Re-release annotations ("Remastered 2011", "Radio Edit") are
+    removed first and do not count.
+    """
+    folded = _RE_VERSION.sub(" ", _RE_FEAT.sub(" ", _fold(title)))
+    words = {
+        word
+        for match in _RE_ANNOTATION.finditer(folded)
+        for word in _RE_NON_WORD.sub(" ", match.group(1) or match.group(2)).split()
+        if word in _VERSION_WORDS
+    }
+    return " ".join(sorted(words))
+
+
+def trigrams(value: str) -> frozenset[str]:
+    padded = f"  {value} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def _dice(a: Collection[str], b: Collection[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return 2 * len(frozenset(a).intersection(b)) / (len(a) + len(b))
+
+
+def match_confidence(artist_a: str | None, title_a: str | None, artist_b: str | None, title_b: str | None) -> float:
+    """Similarity (0..1) of two artist/title pairs, weighted like ``FuzzyIndex.find``."""
+    normalized_a, normalized_b = normalize_title(title_a or ""), normalize_title(title_b or "")
+    if title_numbers(normalized_a) != title_numbers(normalized_b):
+        return 0.0
+    if title_versions(title_a or "") != title_versions(title_b or ""):
+        return 0.0
+    title_score = _dice(trigrams(normalized_a), trigrams(normalized_b))
+    if not artist_a or not artist_b:
+        return title_score
+    artist_score = _dice(trigrams(normalize_artist(artist_a)), trigrams(normalize_artist(artist_b)))
+    return 0.6 * title_score + 0.4 * artist_score
+
+
+class FuzzyIndex:
+    """Trigram inverted index over the artist/title of resolved tracks.
+
+    Candidates are gathered from the title trigram postings, then scored by Dice
+    similarity of title and artist separately so a shared title never matches
+    across different artists ("Hello" by Adele vs. Lionel Richie). Titles with
+    different numbers ("Symphony No. 5" vs. "No. 6") or version words ("Song"
+    vs. "Song (Live)") are never matched.
+
+    Laid out for caches with 100k tracks: trigrams are interned, all tracks of an
+    artist share one trigram set, a track keeps only its normalized title and
+    trigram count (the trigrams are recomputed on removal, numbers only for
+    candidates that pass the title threshold) and postings are lists (removal
+    is rare: eviction and revalidation only).
+    """
+
+    def __init__(self) -> None:
+        # key -> (group, artist trigrams, normalized title, title trigram count, version words)
+        self._docs: dict[str, tuple[str, frozenset[str], str, int, str]] = {}
+        self._postings: dict[str, list[str]] = {}
+        self._artists: dict[str, frozenset[str]] = {}  # normalized artist -> trigrams
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _artist_grams(self, artist: str) -> frozenset[str]:
+        normalized = normalize_artist(artist)
+        grams = self._artists.get(normalized)
+        if grams is None:
+            grams = self._artists[normalized] = frozenset(sys.intern(gram) for gram in trigrams(normalized))
+        return grams
+
+    def add(self, key: str, artist: str | None, title: str | None, group: str) -> None:
+        """Index ``key``; only keys of the same ``group`` (artwork size) are compared."""
+        self.remove(key)
+        if not artist or not title:
+            return
+        normalized = normalize_title(title)
+        title_grams = trigrams(normalized)
+        versions = sys.intern(title_versions(title))
+        self._docs[key] = (sys.intern(group), self._artist_grams(artist), normalized, len(title_grams), versions)
+        for gram in title_grams:
+            gram = sys.intern(gram)
+            posting = self._postings.get(gram)
+            if posting is None:
+                self._postings[gram] = [key]
+            else:
+                posting.append(key)
+
+    def remove(self, key: str) -> None:
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return
+        for gram in trigrams(doc[2]):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.remove(key)
+                if not posting:
+                    del self._postings[gram]
+
+    def find(self, artist: str | None, title: str | None, group: str) -> tuple[str, float] | None:
+        """Return ``(key, confidence)`` of the best match above the threshold, or None."""
+        if not artist or not title or not self._docs:
+            return None
+        normalized = normalize_title(title)
+        title_grams = trigrams(normalized)
+        numbers = title_numbers(normalized)
+        versions = title_versions(title)
+        artist_grams = trigrams(normalize_artist(artist))
+
+        overlaps: Counter[str] = Counter()
+        for gram in title_grams:
+            overlaps.update(self._postings.get(gram, ()))
+
+        best: tuple[str, float] | None = None
+        for key, overlap in overlaps.items():
+            doc_group, doc_artist, doc_title, doc_grams, doc_versions = self._docs[key]
+            if doc_group != group or doc_versions != versions:
+                continue
+            title_score = 2 * overlap / (len(title_grams) + doc_grams)
+            if title_score < FUZZY_MATCH_THRESHOLD or title_numbers(doc_title) != numbers:
+                continue
+            artist_score = _dice(artist_grams, doc_artist)
+            if artist_score < FUZZY_MATCH_MIN_ARTIST:
+                continue
+            confidence = 0.6 * title_score + 0.4 * artist_score
+            if confidence >= FUZZY_MATCH_THRESHOLD and (best is None or confidence > best[1]):
+                best = (key, confidence)
+        return best
@@ -9,8 +9,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import CoverCoordinator, CoverData
-from .const import DOMAIN
-from .helpers import FALLBACK_IMAGE, source_name
+from .const import DOMAIN, UNRECORDED_ATTRIBUTES
+from .helpers import fallback_image, source_name
+from .views import async_signed_cover_url
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
@@ -21,6 +22,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 class MediaCoverArtImage(CoordinatorEntity[CoverCoordinator], ImageEntity):
     _attr_has_entity_name = True
     _attr_icon = "mdi:disc"
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
 
     def __init__(self, coordinator: CoverCoordinator, entry: ConfigEntry) -> None:
         CoordinatorEntity.__init__(self, coordinator)
@@ -45,28 +47,19 @@ class MediaCoverArtImage(CoordinatorEntity[CoverCoordinator], ImageEntity):
         data: CoverData | None = self.coordinator.data
         if not data or not data.image:
             self._attr_content_type = "image/png"
-            return FALLBACK_IMAGE
-        self._attr_content_type = data.content_type or "image/jpeg"
-        return data.image
+            return fallback_image()
+        image, content_type = data.image_for_size(self.coordinator.image_size)
+        self._attr_content_type = content_type or "image/jpeg"
+        return image
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def entity_picture(self) -> str | None:
+        # Content-addressed, signed URL: browsers cache it and refetch only on a new cover.
         data: CoverData | None = self.coordinator.data
-        base = {
-            "source_entity_id": self.coordinator.source_entity_id,
-        }
-        if not data:
-            return base
+        if data and data.image and data.image_hash:
+            return async_signed_cover_url(self.hass, data.image_hash, data.content_type, self.coordinator.image_size)
+        return super().entity_picture
 
-        return {
-            **base,
-            "track_key": data.track_key,
-            "artist": data.artist,
-            "title": data.title,
-            "album": data.album,
-            "provider": data.provider,
-            "artwork_url": data.artwork_url,
-            "artwork_width": self.coordinator.artwork_width,
-            "artwork_height": self.coordinator.artwork_height,
-            "artwork_size": self.coordinator.artwork_size,
-        }
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self.coordinator.cover_attributes
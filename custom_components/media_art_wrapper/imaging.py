@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import logging
+import multiprocessing
+import time
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, IMAGE_POOL_PROCESSES, IMAGE_POOL_WORKERS, IMAGE_QUEUE_LIMIT
+from .stats import LatencyHistogram
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ImageJobCancelled(Exception):
+    """The job was superseded by a newer track or shed from a full queue before it ran."""
+
+
+@dataclass(slots=True)
+class _ImageJob:
+    key: str
+    func: Callable[..., Any]
+    args: tuple[Any, ...]
+    future: asyncio.Future
+    owners: set[str] = field(default_factory=set)
+    queued_at: float = field(default_factory=time.perf_counter)
+
+
+class ImagePool:
+    """Bounded worker pool for decoding, resizing and colour analysis of covers.
+
+    Runs on its own executor instead of Home Assistant's shared one, so a burst
+    of track changes never occupies the default executor. At most
+    ``IMAGE_POOL_WORKERS`` jobs run at once and at most ``IMAGE_QUEUE_LIMIT``
+    wait; when the queue is full the oldest waiting job is shed. Jobs for the
+    same key are shared, and waiting jobs are cancelled once every coordinator
+    that asked for them has moved on to another track.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self.workers = IMAGE_POOL_WORKERS
+        self._executor: Executor | None = None
+        self._processes = IMAGE_POOL_PROCESSES
+        self._queue: deque[_ImageJob] = deque()
+        self._jobs: dict[str, _ImageJob] = {}
+        self._running = 0
+        self._started = time.monotonic()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.joined = 0  # requests served by a job already queued or running
+        self.cancelled = 0  # superseded before they ran
+        self.dropped = 0  # shed because the queue was full
+        self.max_queued = 0
+        self.wait = LatencyHistogram()
+        self.run = LatencyHistogram()
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._processes:
+                # Spawned, not forked: forking the multi-threaded HA process is unsafe.
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+            else:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix=f"{DOMAIN}_image")
+        return self._executor
+
+    async def async_run(self, key: str, owner: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Run ``func(*args)`` in the pool and return its result.
+
+        ``key`` identifies the work (e.g. the cache key of the cover); ``owner``
+        the coordinator asking for it. Raises ``ImageJobCancelled`` when the job
+        is superseded or shed before it started.
+        """
+        job = self._jobs.get(key)
+        if job is not None:
+            self.joined += 1
+        else:
+            self.submitted += 1
+            job = self._jobs[key] = _ImageJob(key, func, args, self.hass.loop.create_future())
+            if len(self._queue) >= IMAGE_QUEUE_LIMIT:
+                self._finish_cancelled(self._queue.popleft(), "queue full")
+                self.dropped += 1
+            self._queue.append(job)
+            self.max_queued = max(self.max_queued, len(self._queue))
+            self._dispatch()
+        job.owners.add(owner)
+        # Shielded: one caller giving up must not cancel the job for the others.
+        return await asyncio.shield(job.future)
+
+    def cancel_owner(self, owner: str) -> None:
+        """Withdraw ``owner`` from its waiting jobs; jobs nobody waits for any more are cancelled."""
+        for job in list(self._queue):
+            job.owners.discard(owner)
+            if not job.owners:
+                self._queue.remove(job)
+                self._finish_cancelled(job, "superseded")
+                self.cancelled += 1
+
+    def _finish_cancelled(self, job: _ImageJob, reason: str) -> None:
+        _LOGGER.debug("Image job %s cancelled: %s", job.key, reason)
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+        if not job.future.done():
+            job.future.set_exception(ImageJobCancelled(reason))
+            job.future.exception()  # retrieved: nobody may be waiting any more
+
+    def _dispatch(self) -> None:
+        while self._queue and self._running < self.workers:
+            job = self._queue.popleft()
+            self._running += 1
+            self.wait.observe((time.perf_counter() - job.queued_at) * 1000)
+            self.hass.async_create_background_task(self._async_execute(job), f"{DOMAIN} image job")
+
+    async def _async_execute(self, job: _ImageJob) -> None:
+        started = time.perf_counter()
+        try:
+            try:
+                result = await self.hass.loop.run_in_executor(self._get_executor(), job.func, *job.args)
+            except BrokenExecutor as err:
+                if not self._processes:
+                    raise
+                _LOGGER.warning("Image worker processes unavailable (%s), using threads instead", err)
+                self._reset_executor(processes=False)
+                result = await self.hass.loop.run_in_executor(self._get_executor(), job.func, *job.args)
+        except Exception as err:  # noqa: BLE001
+            self.failed += 1
+            if not job.future.done():
+                job.future.set_exception(err)
+                job.future.exception()
+        else:
+            self.completed += 1
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self.run.observe((time.perf_counter() - started) * 1000)
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+            self._running -= 1
+            self._dispatch()
+
+    def _reset_executor(self, *, processes: bool) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._processes = processes
+
+    def async_stop(self) -> None:
+        for job in list(self._queue):
+            self._finish_cancelled(job, "stopped")
+        self._queue.clear()
+        self._reset_executor(processes=self._processes)
+
+    def as_dict(self) -> dict[str, Any]:
+        uptime_min = (time.monotonic() - self._started) / 60
+        return {
+            "mode": "processes" if self._processes else "threads",
+            "workers": self.workers,
+            "running": self._running,
+            "queued": len(self._queue),
+            "max_queued": self.max_queued,
+            "queue_limit": IMAGE_QUEUE_LIMIT,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "joined": self.joined,
+            "cancelled": self.cancelled,
+            "dropped": self.dropped,
+            "jobs_per_min": round(self.completed / uptime_min, 2) if uptime_min else None,
+            "wait": self.wait.as_dict(),
+            "run": self.run.as_dict(),
+        }
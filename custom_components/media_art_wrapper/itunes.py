@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
+from dataclasses import dataclass
+import logging
 import re
-from typing import Any
+from typing import Any, AsyncContextManager, Iterable
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .const import ARTWORK_PREVIEW_SIZE, PROGRESSIVE_MIN_SIZE, PROVIDER_ITUNES
 from .models import ResolvedCover, TrackQuery
+from .stats import ProviderStats, ResolutionStats
+
+_LOGGER = logging.getLogger(__name__)
 
 ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
+ITUNES_LOOKUP_URL = "https://itunes.apple.com/lookup"
+# The lookup endpoint accepts comma-separated ids; stay well below URL length limits.
+ITUNES_LOOKUP_BATCH_SIZE = 200
 _JSON_KW = {"content_type": None}
 _RE_ARTWORK_SIZE = re.compile(r"/(\d{2,4})x(\d{2,4})bb\.(jpg|png)$", re.IGNORECASE)
 
@@ -68,6 +78,12 @@ def _score_result(query: TrackQuery, item: dict[str, Any]) -> int:
     return score
 
 
+def _score_confidence(query: TrackQuery, score: int) -> float:
+    """Map a ``_score_result`` score to 0..1 against an exact title/artist/album match."""
+    ideal = (16 if query.title else 0) + (14 if query.artist else 0) + (6 if query.album else 0)
+    return round(min(1.0, max(0, score) / ideal), 3) if ideal else 0.0
+
+
 def _upscale_artwork(url: str, size: int) -> str:
     m = _RE_ARTWORK_SIZE.search(url)
     if not m:
@@ -76,14 +92,89 @@ def _upscale_artwork(url: str, size: int) -> str:
     return _RE_ARTWORK_SIZE.sub(f"/{size}x{size}bb.{ext}", url)
 
 
-async def _search_itunes(session, term: str) -> list[dict[str, Any]]:
+def artwork_size_from_url(url: str) -> int | None:
+    """Return the edge length encoded in an Apple artwork URL (``.../600x600bb.jpg``)."""
+    m = _RE_ARTWORK_SIZE.search(url)
+    return int(m.group(1)) if m else None
+
+
+def artwork_url_for_item(item: dict[str, Any], size: int) -> str | None:
+    artwork = item.get("artworkUrl100") or item.get("artworkUrl60") or item.get("artworkUrl30")
+    if not isinstance(artwork, str) or not artwork:
+        return None
+    return _upscale_artwork(artwork, max(100, int(size)))
+
+
+def _as_int(value: Any) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+async def async_itunes_lookup(
+    session, ids: Iterable[int], limiter: AsyncContextManager[Any] | None = None
+) -> tuple[dict[int, dict[str, Any]], set[int]]:
+    """Look up tracks/collections by id, ``ITUNES_LOOKUP_BATCH_SIZE`` ids per request.
+
+    Returns a mapping of every requested id that iTunes still knows to its result
+    item, and the ids whose answer can be trusted: those of batches that came
+    back well-formed with at least half of their ids. An empty or mostly empty
+    batch is more likely throttling or an outage than mass delisting, so a
+    missing id only means "gone" when it is in the second set. Ids may be
+    trackIds or collectionIds; both are matched.
+    """
+    wanted = list(dict.fromkeys(int(i) for i in ids))
+    found: dict[int, dict[str, Any]] = {}
+    answered: set[int] = set()
+    for start in range(0, len(wanted), ITUNES_LOOKUP_BATCH_SIZE):
+        batch = wanted[start : start + ITUNES_LOOKUP_BATCH_SIZE]
+        params = {"id": ",".join(str(i) for i in batch)}
+        try:
+            async with limiter or nullcontext(), session.get(ITUNES_LOOKUP_URL, params=params, timeout=10) as resp:
+                resp.raise_for_status()
+                payload = await resp.json(**_JSON_KW)
+        except Exception as err:
+            raise HomeAssistantError(f"iTunes lookup failed: {err}") from err
+
+        results = payload.get("results") if isinstance(payload, dict) else None
+        if not isinstance(results, list):
+            _LOGGER.debug("iTunes lookup returned no result list for %d ids", len(batch))
+            continue
+        requested = set(batch)
+        matched: set[int] = set()
+        for item in results:
+            if not isinstance(item, dict):
+                continue
+            for id_field in ("trackId", "collectionId"):
+                item_id = _as_int(item.get(id_field))
+                if item_id in requested:
+                    found.setdefault(item_id, item)
+                    matched.add(item_id)
+        if 2 * len(matched) >= len(batch):
+            answered.update(batch)
+        else:
+            _LOGGER.debug("iTunes lookup knew only %d of %d ids, not trusting the batch", len(matched), len(batch))
+    return found, answered
+
+
+async def _search_itunes(
+    session,
+    term: str,
+    counters: ProviderStats | None = None,
+    limiter: AsyncContextManager[Any] | None = None,
+) -> list[dict[str, Any]]:
     params = {
         "term": term,
         "entity": "song",
         "media": "music",
         "limit": "15",
     }
-    async with session.get(ITUNES_SEARCH_URL, params=params, timeout=10) as resp:
+    async with limiter or nullcontext(), session.get(ITUNES_SEARCH_URL, params=params, timeout=10) as resp:
+        if counters is not None:
+            counters.requests += 1
+            counters.rate_limited += resp.status == 429
+            counters.bytes += resp.content_length or 0
         resp.raise_for_status()
         payload = await resp.json(**_JSON_KW)
     results = payload.get("results") if isinstance(payload, dict) else None
@@ -92,10 +183,39 @@ async def _search_itunes(session, term: str) -> list[dict[str, Any]]:
     return [item for item in results if isinstance(item, dict)]
 
 
-async def async_itunes_resolve(*, session, query: TrackQuery) -> ResolvedCover | None:
+@dataclass(slots=True, frozen=True)
+class ItunesMatch:
+    item: dict[str, Any]
+    score: int
+    confidence: float
+
+    @property
+    def artist(self) -> str | None:
+        return self.item.get("artistName")
+
+    @property
+    def title(self) -> str | None:
+        return self.item.get("trackName")
+
+
+async def async_itunes_search(
+    *,
+    session,
+    query: TrackQuery,
+    stats: ResolutionStats | None = None,
+    limiter: AsyncContextManager[Any] | None = None,
+) -> ItunesMatch | None:
+    """Search iTunes and return the best scoring result at or above the minimum score.
+
+    ``limiter`` paces every search request (up to three per query); artwork
+    downloads come from the CDN and are not paced.
+    """
     if not (query.artist or query.title):
         return None
 
+    stats = stats or ResolutionStats()
+    counters = stats.provider(PROVIDER_ITUNES)
+
     terms: list[str] = []
     term1 = " ".join([p for p in [_clean(query.artist or ""), _clean(query.title or "")] if p])
     if term1:
@@ -110,7 +230,9 @@ async def async_itunes_resolve(*, session, query: TrackQuery) -> ResolvedCover |
         results: list[dict[str, Any]] = []
         seen_ids: set[str] = set()
         for term in terms:
-            for item in await _search_itunes(session, term):
+            with stats.timed("search", f"{PROVIDER_ITUNES}: {term}"):
+                found = await _search_itunes(session, term, counters, limiter)
+            for item in found:
                 item_id = str(item.get("trackId") or item.get("collectionId") or id(item))
                 if item_id in seen_ids:
                     continue
@@ -124,28 +246,53 @@ async def async_itunes_resolve(*, session, query: TrackQuery) -> ResolvedCover |
 
     best: dict[str, Any] | None = None
     best_score = -999
-    for item in results:
-        score = _score_result(query, item)
-        if score > best_score:
-            best_score = score
-            best = item
+    with stats.timed("score", f"{PROVIDER_ITUNES}: {len(results)} results"):
+        for item in results:
+            score = _score_result(query, item)
+            if score > best_score:
+                best_score = score
+                best = item
 
     minimum_score = 10 if query.title else 4
     if not best or best_score < minimum_score:
         return None
-
-    artwork = best.get("artworkUrl100") or best.get("artworkUrl60") or best.get("artworkUrl30")
-    if not isinstance(artwork, str) or not artwork:
+    return ItunesMatch(best, best_score, _score_confidence(query, best_score))
+
+
+async def async_itunes_fetch(
+    *,
+    session,
+    query: TrackQuery,
+    match: ItunesMatch,
+    stats: ResolutionStats | None = None,
+) -> ResolvedCover | None:
+    """Download the artwork of ``match`` at the query's size (or a preview first)."""
+    stats = stats or ResolutionStats()
+    counters = stats.provider(PROVIDER_ITUNES)
+    best = match.item
+
+    target_size = max(query.artwork_width, query.artwork_height)
+    artwork_url = artwork_url_for_item(best, target_size)
+    if not artwork_url:
         return None
 
-    target_size = max(100, int(max(query.artwork_width, query.artwork_height)))
-    artwork_url = _upscale_artwork(artwork, target_size)
+    # Progressive delivery: for large targets fetch the small rendition first and
+    # let the coordinator upgrade to full size once the preview is on screen.
+    upgrade_url: str | None = None
+    if query.progressive and target_size >= PROGRESSIVE_MIN_SIZE:
+        preview_url = artwork_url_for_item(best, ARTWORK_PREVIEW_SIZE)
+        if preview_url and preview_url != artwork_url:
+            artwork_url, upgrade_url = preview_url, artwork_url
 
     try:
-        async with session.get(artwork_url, timeout=10) as img_resp:
-            img_resp.raise_for_status()
-            content_type = img_resp.headers.get("Content-Type", "image/jpeg")
-            image = await img_resp.read()
+        with stats.timed("download", artwork_url):
+            async with session.get(artwork_url, timeout=10) as img_resp:
+                counters.requests += 1
+                counters.rate_limited += img_resp.status == 429
+                img_resp.raise_for_status()
+                content_type = img_resp.headers.get("Content-Type", "image/jpeg")
+                image = await img_resp.read()
+                counters.bytes += len(image)
     except Exception as err:
         raise HomeAssistantError(f"iTunes artwork fetch failed: {err}") from err
 
@@ -153,8 +300,25 @@ async def async_itunes_resolve(*, session, query: TrackQuery) -> ResolvedCover |
         return None
 
     return ResolvedCover(
-        provider="itunes",
+        provider=PROVIDER_ITUNES,
         artwork_url=artwork_url,
         content_type=content_type,
         image=image,
+        track_id=_as_int(best.get("trackId")),
+        collection_id=_as_int(best.get("collectionId")),
+        upgrade_url=upgrade_url,
+        confidence=match.confidence,
     )
+
+
+async def async_itunes_resolve(
+    *,
+    session,
+    query: TrackQuery,
+    stats: ResolutionStats | None = None,
+    limiter: AsyncContextManager[Any] | None = None,
+) -> ResolvedCover | None:
+    match = await async_itunes_search(session=session, query=query, stats=stats, limiter=limiter)
+    if match is None:
+        return None
+    return await async_itunes_fetch(session=session, query=query, match=match, stats=stats)
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+import os
+import re
+import time
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_LIBRARY_INDEXES, DOMAIN, LIBRARY_REFRESH_INTERVAL, PROVIDER_LOCAL_LIBRARY
+from .models import ResolvedCover, TrackQuery
+
+_LOGGER = logging.getLogger(__name__)
+
+_AUDIO_EXTENSIONS = {".aac", ".aif", ".aiff", ".alac", ".flac", ".m4a", ".mp3", ".mp4", ".ogg", ".opus", ".wav", ".wma"}
+# Checked in order – the first existing file wins as album art for a directory.
+_FOLDER_ART_NAMES = ("cover.jpg", "cover.png", "folder.jpg", "folder.png", "front.jpg", "front.png", "album.jpg", "album.png")
+_CONTENT_TYPES = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png"}
+
+_RE_NON_WORD = re.compile(r"[^\w]+")
+_RE_TRACK_NUMBER = re.compile(r"^\s*\d{1,3}(?:[-.]\d{1,3})?\s*[-._)]*\s*")
+
+
+def _key_part(value: str | None) -> str:
+    if not value:
+        return ""
+    return " ".join(_RE_NON_WORD.sub(" ", value.lower()).split())
+
+
+def _track_key(artist: str | None, title: str | None, album: str | None = None) -> str:
+    return "|".join((_key_part(artist), _key_part(title), _key_part(album)))
+
+
+def _album_key(artist: str | None, album: str | None) -> str:
+    return "|".join((_key_part(artist), "", _key_part(album)))
+
+
+def _first_tag(tags, name: str) -> str | None:
+    value = tags.get(name) if tags is not None else None
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return str(value) if value else None
+
+
+def _tags_from_path(path: str) -> tuple[str | None, str | None, str | None]:
+    """Derive (artist, title, album) from an ``Artist/Album/NN Title.ext`` layout."""
+    album_dir = os.path.dirname(path)
+    album = os.path.basename(album_dir) or None
+    artist = os.path.basename(os.path.dirname(album_dir)) or None
+    title = _RE_TRACK_NUMBER.sub("", os.path.splitext(os.path.basename(path))[0])
+    if artist and " - " in title and title.lower().startswith(artist.lower()):
+        title = title.split(" - ", 1)[1]
+    return artist, title.strip() or None, album
+
+
+def _read_tags(path: str) -> tuple[str | None, str | None, str | None]:
+    try:
+        import mutagen  # noqa: PLC0415 – a manifest requirement, imported only by this provider
+    except ImportError:
+        return _tags_from_path(path)
+
+    try:
+        audio = mutagen.File(path, easy=True)
+    except Exception as err:  # noqa: BLE001
+        _LOGGER.debug("Could not read tags from %s: %s", path, err)
+        audio = None
+
+    tags = getattr(audio, "tags", None)
+    artist = _first_tag(tags, "artist") or _first_tag(tags, "albumartist")
+    title = _first_tag(tags, "title")
+    album = _first_tag(tags, "album")
+    if not title:
+        return _tags_from_path(path)
+    return artist, title, album
+
+
+def _read_embedded_art(path: str) -> tuple[bytes, str] | None:
+    """Return embedded cover bytes (ID3 APIC, MP4 covr, FLAC/Vorbis pictures)."""
+    try:
+        import mutagen  # noqa: PLC0415
+    except ImportError:
+        return None
+
+    try:
+        audio = mutagen.File(path)
+    except Exception as err:  # noqa: BLE001
+        _LOGGER.debug("Could not read embedded art from %s: %s", path, err)
+        return None
+    if audio is None:
+        return None
+
+    pictures = getattr(audio, "pictures", None)
+    if pictures:
+        return bytes(pictures[0].data), pictures[0].mime or "image/jpeg"
+
+    tags = audio.tags
+    if tags is None:
+        return None
+
+    if hasattr(tags, "getall"):
+        frames = tags.getall("APIC")
+        if frames:
+            # Prefer the front cover (picture type 3) when several frames exist.
+            frame = next((f for f in frames if getattr(f, "type", None) == 3), frames[0])
+            return bytes(frame.data), frame.mime or "image/jpeg"
+        return None
+
+    covers = tags.get("covr") if hasattr(tags, "get") else None
+    if covers:
+        cover = covers[0]
+        content_type = "image/png" if getattr(cover, "imageformat", None) == 14 else "image/jpeg"
+        return bytes(cover), content_type
+    return None
+
+
+def _read_file(path: str) -> tuple[bytes, str] | None:
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read()
+    except OSError as err:
+        _LOGGER.debug("Could not read %s: %s", path, err)
+        return None
+    if not data:
+        return None
+    return data, _CONTENT_TYPES.get(os.path.splitext(path)[1].lower(), "image/jpeg")
+
+
+@dataclass(slots=True)
+class _LibraryTrack:
+    path: str | None
+    folder_art: str | None
+
+
+@dataclass(slots=True)
+class _DirectoryState:
+    mtime: float
+    subdirs: list[str] = field(default_factory=list)
+    keys: list[str] = field(default_factory=list)
+
+
+class LocalLibraryIndex:
+    """Incremental index of a music directory mapping track keys to local artwork.
+
+    Directories are only re-read when their mtime changed since the last scan, so
+    refreshing a large, unchanged NAS share costs one ``stat`` per directory.
+    Lookups are plain dict accesses; only the final image read touches the disk.
+    """
+
+    def __init__(self, hass: HomeAssistant, root: str) -> None:
+        self.hass = hass
+        self.root = root
+        self._tracks: dict[str, _LibraryTrack] = {}
+        self._dirs: dict[str, _DirectoryState] = {}
+        self._last_scan: float | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+    @property
+    def track_count(self) -> int:
+        return len(self._tracks)
+
+    @property
+    def ready(self) -> bool:
+        """Whether the first build has finished; lookups miss until then."""
+        return self._last_scan is not None
+
+    @callback
+    def async_schedule_refresh(self) -> None:
+        """Build or refresh the index in the background unless that is already running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self.hass.async_create_background_task(
+                self._async_refresh(), f"{PROVIDER_LOCAL_LIBRARY} refresh {self.root}"
+            )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop a running build; a directory scan already in the executor finishes on its own."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+
+    @callback
+    def async_ensure_fresh(self) -> None:
+        """Start the first build if needed, then refresh in the background when stale.
+
+        Never waits for the scan: a first build over a large NAS share can take
+        minutes and must not hold a resolver worker or the coordinator lock.
+        """
+        if self._last_scan is None or time.monotonic() - self._last_scan >= LIBRARY_REFRESH_INTERVAL.total_seconds():
+            self.async_schedule_refresh()
+
+    async def _async_refresh(self) -> None:
+        async with self._refresh_lock:
+            started = time.monotonic()
+            await self.hass.async_add_executor_job(self._refresh)
+            self._last_scan = time.monotonic()
+        _LOGGER.debug(
+            "Local library %s indexed: %d tracks in %.2fs",
+            self.root,
+            len(self._tracks),
+            self._last_scan - started,
+        )
+
+    def _refresh(self) -> None:
+        seen: set[str] = set()
+        pending = [self.root]
+        while pending:
+            directory = pending.pop()
+            try:
+                mtime = os.stat(directory).st_mtime
+            except OSError:
+                continue
+            seen.add(directory)
+            state = self._dirs.get(directory)
+            if state is None or state.mtime != mtime:
+                state = self._scan_directory(directory, mtime)
+            pending.extend(state.subdirs)
+
+        for directory in [d for d in self._dirs if d not in seen]:
+            self._drop_directory(directory)
+
+    def _drop_directory(self, directory: str) -> None:
+        state = self._dirs.pop(directory, None)
+        if state is None:
+            return
+        for key in state.keys:
+            track = self._tracks.get(key)
+            if track is not None and track.path and os.path.dirname(track.path) == directory:
+                del self._tracks[key]
+
+    def _scan_directory(self, directory: str, mtime: float) -> _DirectoryState:
+        self._drop_directory(directory)
+        state = _DirectoryState(mtime=mtime)
+        self._dirs[directory] = state
+
+        try:
+            entries = list(os.scandir(directory))
+        except OSError as err:
+            _LOGGER.debug("Could not list %s: %s", directory, err)
+            return state
+
+        names = {entry.name.lower(): entry.path for entry in entries if entry.is_file()}
+        folder_art = next((names[name] for name in _FOLDER_ART_NAMES if name in names), None)
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                state.subdirs.append(entry.path)
+                continue
+            if os.path.splitext(entry.name)[1].lower() not in _AUDIO_EXTENSIONS:
+                continue
+            artist, title, album = _read_tags(entry.path)
+            if not title:
+                continue
+            track = _LibraryTrack(path=entry.path, folder_art=folder_art)
+            keys = [_track_key(artist, title, album), _track_key(artist, title)]
+            if album:
+                keys.append(_album_key(artist, album))
+            for key in keys:
+                self._tracks.setdefault(key, track)
+                state.keys.append(key)
+
+        return state
+
+    def _lookup(self, query: TrackQuery) -> _LibraryTrack | None:
+        keys = [_track_key(query.artist, query.title, query.album), _track_key(query.artist, query.title)]
+        if query.album:
+            keys.append(_album_key(query.artist, query.album))
+        for key in keys:
+            track = self._tracks.get(key)
+            if track is not None:
+                return track
+        return None
+
+    async def async_lookup(self, query: TrackQuery) -> tuple[bytes, str, str] | None:
+        """Return ``(image, content_type, path)`` for the query, None on a miss or while the first build runs."""
+        self.async_ensure_fresh()
+        if not self.ready:
+            return None
+        track = self._lookup(query)
+        if track is None:
+            return None
+        return await self.hass.async_add_executor_job(self._load_art, track)
+
+    @staticmethod
+    def _load_art(track: _LibraryTrack) -> tuple[bytes, str, str] | None:
+        if track.path:
+            embedded = _read_embedded_art(track.path)
+            if embedded:
+                return embedded[0], embedded[1], track.path
+        if track.folder_art:
+            loaded = _read_file(track.folder_art)
+            if loaded:
+                return loaded[0], loaded[1], track.folder_art
+        return None
+
+
+@callback
+def async_get_library_index(hass: HomeAssistant, root: str) -> LocalLibraryIndex:
+    """Return the shared index for ``root`` (one per directory across all entries).
+
+    A new index starts building in the background right away; indexes no loaded
+    entry uses any more (the library path was changed) are dropped.
+    """
+    indexes: dict[str, LocalLibraryIndex] = hass.data.setdefault(DATA_LIBRARY_INDEXES, {})
+    root = os.path.abspath(root)
+    index = indexes.get(root)
+    if index is None:
+        in_use = {
+            library.root
+            for coordinator in hass.data.get(DOMAIN, {}).values()
+            if (library := getattr(coordinator, "library", None)) is not None
+        }
+        for unused in [known for known in indexes if known not in in_use]:
+            indexes.pop(unused).async_cancel()
+        index = indexes[root] = LocalLibraryIndex(hass, root)
+        index.async_schedule_refresh()
+    return index
+
+
+@callback
+def async_release_library_indexes(hass: HomeAssistant) -> None:
+    """Drop all indexes once the last entry is unloaded."""
+    for index in hass.data.pop(DATA_LIBRARY_INDEXES, {}).values():
+        index.async_cancel()
+
+
+async def async_local_library_resolve(*, library: LocalLibraryIndex | None, query: TrackQuery) -> ResolvedCover | None:
+    if library is None or not query.title:
+        return None
+
+    found = await library.async_lookup(query)
+    if found is None:
+        return None
+
+    image, content_type, path = found
+    return ResolvedCover(
+        provider=PROVIDER_LOCAL_LIBRARY,
+        artwork_url=f"file://{path}",
+        content_type=content_type,
+        image=image,
+        confidence=1.0,  # looked up by artist/title key
+    )
@@ -1,16 +1,50 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.media_player import MediaPlayerEntity, MediaPlayerEntityFeature, MediaPlayerState
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, State, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import CoverCoordinator, CoverData
-from .const import DOMAIN
-from .helpers import FALLBACK_IMAGE, source_name
+from . import CoverCoordinator, CoverData, SourceSnapshot
+from .const import DOMAIN, UNRECORDED_ATTRIBUTES
+from .helpers import fallback_image, source_name
+from .views import async_signed_cover_url
+
+
+# Source attributes whose changes are worth a state write. Position is handled
+# separately: it is extrapolated from media_position_updated_at by consumers.
+_MIRRORED_ATTRIBUTES = (
+    "supported_features",
+    "media_title",
+    "media_artist",
+    "media_album_name",
+    "media_duration",
+    "volume_level",
+    "is_volume_muted",
+    "source",
+    "source_list",
+    "sound_mode",
+    "sound_mode_list",
+    "shuffle",
+    "repeat",
+)
+# Reported positions within this many seconds of the extrapolated one are not a seek.
+_POSITION_TOLERANCE = 2.0
+
+
+def _mirror_snapshot(source: SourceSnapshot) -> tuple[str | None, dict[str, Any]]:
+    return source.state, {key: source.attr(key) for key in _MIRRORED_ATTRIBUTES}
+
+
+def _position_of(source: SourceSnapshot) -> tuple[float | None, datetime | None]:
+    position = source.attr("media_position")
+    updated_at = source.attr("media_position_updated_at")
+    if not isinstance(position, (int, float)) or not isinstance(updated_at, datetime):
+        return None, None
+    return float(position), updated_at
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
@@ -28,6 +62,7 @@ class MediaCoverArtUniversalPlayer(CoordinatorEntity[CoverCoordinator], MediaPla
     _attr_should_poll = False
     _attr_has_entity_name = False
     _attr_icon = "mdi:speaker"
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
 
     def __init__(self, coordinator: CoverCoordinator, entry: ConfigEntry) -> None:
         CoordinatorEntity.__init__(self, coordinator)
@@ -37,43 +72,54 @@ class MediaCoverArtUniversalPlayer(CoordinatorEntity[CoverCoordinator], MediaPla
             pass
         self._attr_unique_id = f"{entry.entry_id}_cover_player"
         self._attr_name = f"{source_name(coordinator.source_entity_id)} Cover"
-        self._unsub_source_state = None
+        self._written_snapshot: tuple[str | None, dict[str, Any]] | None = None
+        self._written_position: tuple[float | None, datetime | None] = (None, None)
 
     @property
     def source_entity_id(self) -> str:
         return self.coordinator.source_entity_id
 
     @property
-    def source_state(self) -> State | None:
-        return self.hass.states.get(self.source_entity_id)
+    def source_state(self) -> SourceSnapshot:
+        return self.coordinator.source
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
-        self._unsub_source_state = async_track_state_change_event(
-            self.hass,
-            [self.source_entity_id],
-            self._async_handle_source_state,
-        )
+        self.async_on_remove(self.coordinator.async_add_source_listener(self._async_handle_source_state))
+
+    def _position_jumped(self, source: SourceSnapshot) -> bool:
+        """Return True if the reported position diverges from the extrapolated one (seek, restart)."""
+        position, updated_at = _position_of(source)
+        last_position, last_updated_at = self._written_position
+        if position is None or last_position is None:
+            return position != last_position
+        expected = last_position
+        if source.state == MediaPlayerState.PLAYING:
+            expected += (updated_at - last_updated_at).total_seconds()
+        return abs(position - expected) > _POSITION_TOLERANCE
 
-    async def async_will_remove_from_hass(self) -> None:
-        if self._unsub_source_state is not None:
-            self._unsub_source_state()
-            self._unsub_source_state = None
-        await super().async_will_remove_from_hass()
+    @callback
+    def async_write_ha_state(self) -> None:
+        src = self.source_state
+        self._written_snapshot = _mirror_snapshot(src)
+        self._written_position = _position_of(src)
+        super().async_write_ha_state()
 
     @callback
-    def _async_handle_source_state(self, event) -> None:
+    def _async_handle_source_state(self, source: SourceSnapshot) -> None:
+        if _mirror_snapshot(source) == self._written_snapshot and not self._position_jumped(source):
+            # Only media_position ticked along – consumers extrapolate it themselves.
+            return
         self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
-        src = self.source_state
-        return src is not None and src.state not in {"unavailable", "unknown"}
+        return self.source_state.available
 
     @property
     def state(self) -> MediaPlayerState | None:
         src = self.source_state
-        if src is None:
+        if src.state is None:
             return None
         try:
             return MediaPlayerState(src.state)
@@ -82,19 +128,10 @@ class MediaCoverArtUniversalPlayer(CoordinatorEntity[CoverCoordinator], MediaPla
 
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
-        src = self.source_state
-        if src is None:
-            return MediaPlayerEntityFeature(0)
-        try:
-            return MediaPlayerEntityFeature(int(src.attributes.get("supported_features", 0)))
-        except (TypeError, ValueError):
-            return MediaPlayerEntityFeature(0)
+        return MediaPlayerEntityFeature(self.source_state.supported_features)
 
     def _source_attr(self, key: str, default: Any = None) -> Any:
-        src = self.source_state
-        if src is None:
-            return default
-        return src.attributes.get(key, default)
+        return self.source_state.attr(key, default)
 
     @property
     def media_title(self) -> str | None:
@@ -166,24 +203,21 @@ class MediaCoverArtUniversalPlayer(CoordinatorEntity[CoverCoordinator], MediaPla
     async def async_get_media_image(self):
         data: CoverData | None = self.coordinator.data
         if not data or not data.image:
-            return FALLBACK_IMAGE, "image/png"
-        return data.image, data.content_type or "image/jpeg"
+            return fallback_image(), "image/png"
+        image, content_type = data.image_for_size(self.coordinator.player_size)
+        return image, content_type or "image/jpeg"
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def entity_picture(self) -> str | None:
+        # Content-addressed, signed URL: browsers cache it and refetch only on a new cover.
         data: CoverData | None = self.coordinator.data
-        return {
-            "source_entity_id": self.source_entity_id,
-            "track_key": data.track_key if data else None,
-            "artist": data.artist if data else None,
-            "title": data.title if data else None,
-            "album": data.album if data else None,
-            "provider": data.provider if data else None,
-            "artwork_url": data.artwork_url if data else None,
-            "artwork_width": self.coordinator.artwork_width,
-            "artwork_height": self.coordinator.artwork_height,
-            "artwork_size": self.coordinator.artwork_size,
-        }
+        if data and data.image and data.image_hash:
+            return async_signed_cover_url(self.hass, data.image_hash, data.content_type, self.coordinator.player_size)
+        return super().entity_picture
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self.coordinator.cover_attributes
 
     async def _async_call_source(self, service: str, **service_data: Any) -> None:
         await self.hass.services.async_call(
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import logging
+import os
+import re
+import sys
+import time
+from typing import Any, Mapping
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_STATION_RULES, STATION_RULES_CHECK_INTERVAL, STATION_RULES_FILE
+
+_LOGGER = logging.getLogger(__name__)
+
+_RE_CLEAN = re.compile(
+    r"""
+       \s*
+       (
+           \([^)]*(?:Remix|Edit|Mix)[^)]*\) |
+           \[[^\]]*(?:Remix|Edit|Mix)[^\]]*\] |
+           -\s*.*(?:Remix|Edit|Mix).* |
+           \(?\s*\d+[_:]\d+\s*\)?
+       )
+    """,
+    re.I | re.X,
+)
+_BAD = {"", "none", "null", "unknown", "n/a", "-", "unknown artist", "unknown track", "unknown title"}
+
+# "Artist - Title" separators used by radio streams (ICY StreamTitle and friends).
+_RE_SEPARATOR = re.compile(r"\s+[-–—|]\s+|\s+/\s+")
+# "Title - Remastered 2011", "Title - Radio Edit": the part after the separator
+# is a version annotation, not a title (it needs a year or a version word).
+_VERSION_WORD = (
+    r"(?:\d{4}|digitally|remaster(?:ed)?|live|remix(?:ed)?|radio|edit|extended|original|club|mix|version|mono|"
+    r"stereo|single|album|demo|acoustic|instrumental|bonus|track|deluxe|explicit|clean)"
+)
+_RE_VERSION_PART = re.compile(
+    rf"(?=.*\b(?:\d{{4}}|remaster(?:ed)?|remix(?:ed)?|edit|mix|version)\b){_VERSION_WORD}(?:\s+{_VERSION_WORD})*",
+    re.I,
+)
+
+# Applied to every source; station rules add their own patterns on top. Only
+# broadcast markers: "(Live)", "(Explicit)" and "(Clean)" name recordings of their
+# own and stay in the title (a station rule can strip them).
+DEFAULT_STRIP: tuple[str, ...] = (
+    r"^\s*(?:now playing|jetzt läuft|on air|nowplaying)\s*[:\-]\s*",
+    r"\s*[\[(](?:on air|ad|advert|werbung)[\])]\s*",
+    r"\s*\*{2,}.*$",
+)
+# Non-music segments; matched against the whole title and only when no artist is
+# set, so songs like "Weather With You" or "Traffic" are not mistaken for them.
+_SEGMENT = (
+    r"(?:die\s+|the\s+)?(?:nachrichten|news|wetter|weather|verkehr|traffic|werbung|advert(?:isement)?s?|"
+    r"commercials?|ad break|jingle|station id|sponsored)"
+)
+DEFAULT_SKIP: tuple[str, ...] = (
+    rf"{_SEGMENT}(?:\s*(?:,|&|\+|/|und|and)\s*{_SEGMENT})*"
+    r"(?:\s*[:\-–]?\s*(?:um\s+|at\s+)?\d{1,2}(?:[:.]\d{2})?(?:\s*uhr)?)?",
+)
+
+
+def intern_text(value: str | None) -> str | None:
+    """Intern repeated metadata so caches, coordinators and cover data share one copy."""
+    return sys.intern(value) if value else None
+
+
+def _raw_text(value: str | None) -> str | None:
+    """Normalize whitespace only – keeps remix/edit/mix annotations intact."""
+    if not isinstance(value, str):
+        return None
+    normalized = re.sub(r"\s{2,}", " ", value).strip()
+    if normalized.lower() in _BAD:
+        return None
+    return normalized or None
+
+
+def _clean_text(value: str | None) -> str | None:
+    if not isinstance(value, str):
+        return None
+    cleaned = re.sub(r"\s{2,}", " ", _RE_CLEAN.sub("", value)).strip()
+    if cleaned.lower() in _BAD:
+        return None
+    return cleaned or None
+
+
+def _norm(s: str) -> str:
+    return " ".join(s.strip().lower().split())
+
+
+def _build_track_key(artist: str | None, title: str | None, album: str | None) -> str | None:
+    if not artist and not title:
+        return None
+    parts = [
+        _norm(artist) if artist else "",
+        _norm(title) if title else "",
+        _norm(album) if album else "",
+    ]
+    return "|".join(parts)
+
+
+def _compile(patterns: Any) -> tuple[re.Pattern[str], ...]:
+    if not isinstance(patterns, list):
+        return ()
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append(re.compile(str(pattern), re.I))
+        except re.error as err:
+            _LOGGER.warning("Ignoring invalid station rule pattern %r: %s", pattern, err)
+    return tuple(compiled)
+
+
+@dataclass(slots=True, frozen=True)
+class StationRule:
+    """How to read the metadata of one station.
+
+    ``match`` is tested against the entity id, ``media_channel``, ``source``,
+    ``media_artist`` and ``media_title``; the first matching rule applies.
+    ``order`` tells which side of the separator is the artist. ``strip``
+    removes tags/ad markers and ``skip`` marks non-music segments (searched
+    in the stripped title). The built-in skips only apply to whole titles
+    without an artist.
+    """
+
+    match: re.Pattern[str]
+    name: str | None = None
+    separator: re.Pattern[str] = _RE_SEPARATOR
+    order: str = "artist_title"
+    strip: tuple[re.Pattern[str], ...] = ()
+    skip: tuple[re.Pattern[str], ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> StationRule:
+        separator = data.get("separator")
+        return cls(
+            match=re.compile(str(data["match"]), re.I),
+            name=data.get("name"),
+            separator=re.compile(rf"\s*{re.escape(separator)}\s*") if separator else _RE_SEPARATOR,
+            order="title_artist" if data.get("order") == "title_artist" else "artist_title",
+            strip=_compile(data.get("strip")),
+            skip=_compile(data.get("skip")),
+        )
+
+
+@dataclass(slots=True)
+class StationRules:
+    rules: list[StationRule] = field(default_factory=list)
+    strip: tuple[re.Pattern[str], ...] = _compile(list(DEFAULT_STRIP))
+    skip: tuple[re.Pattern[str], ...] = _compile(list(DEFAULT_SKIP))
+    mtime: float | None = None
+    checked_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def due(self) -> bool:
+        """Whether the rules file should be checked for changes again."""
+        return time.monotonic() - self.checked_at >= STATION_RULES_CHECK_INTERVAL
+
+    def rule_for(self, entity_id: str, attrs: Mapping[str, Any]) -> StationRule | None:
+        candidates = [
+            entity_id,
+            attrs.get("media_channel"),
+            attrs.get("source"),
+            attrs.get("media_artist"),
+            attrs.get("media_title"),
+        ]
+        for rule in self.rules:
+            if any(isinstance(c, str) and rule.match.search(c) for c in candidates):
+                return rule
+        return None
+
+
+@dataclass(slots=True, frozen=True)
+class ParsedMetadata:
+    """The current track of a source, shared by its coordinator and cover data.
+
+    Strings are interned by ``parse_metadata`` and the track key is built once.
+    """
+
+    artist: str | None
+    title: str | None  # cleaned (remix/edit annotations removed)
+    raw_title: str | None  # whitespace-normalised, annotations kept
+    album: str | None
+    skip_reason: str | None = None  # set for news, jingles, ads, station IDs
+    track_key: str | None = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "track_key", intern_text(_build_track_key(self.artist, self.raw_title, self.album)))
+
+
+NO_TRACK = ParsedMetadata(artist=None, title=None, raw_title=None, album=None)
+
+
+def _strip(value: str, patterns: tuple[re.Pattern[str], ...]) -> str:
+    for pattern in patterns:
+        value = pattern.sub("", value)
+    return value.strip()
+
+
+def parse_metadata(entity_id: str, attrs: Mapping[str, Any], rules: StationRules | None = None) -> ParsedMetadata:
+    """Turn raw media_player attributes into artist/title/album for the resolver.
+
+    Splits combined "Artist - Title" strings when no separate artist is given
+    (or the artist field only carries the station name), strips station tags
+    and ad markers and flags non-music segments so no lookup is made for them.
+    """
+    rules = rules or StationRules()
+    rule = rules.rule_for(entity_id, attrs)
+    strip = rules.strip + (rule.strip if rule else ())
+
+    title_value = attrs.get("media_title")
+    artist_value = attrs.get("media_artist")
+    title = _strip(title_value, strip) if isinstance(title_value, str) else None
+    artist = _strip(artist_value, strip) if isinstance(artist_value, str) else None
+    album = _clean_text(attrs.get("media_album_name"))
+
+    station_names = {
+        _norm(name)
+        for name in (attrs.get("media_channel"), rule.name if rule else None)
+        if isinstance(name, str) and name.strip()
+    }
+
+    def is_station(value: str | None) -> bool:
+        return bool(value) and (_norm(value) in station_names or bool(rule and rule.match.fullmatch(value.strip())))
+
+    if is_station(artist):
+        artist = None  # the artist field carries the station name
+
+    whole_title = _raw_text(title) if not _raw_text(artist) else None
+    if title and not _raw_text(artist):
+        separator = rule.separator if rule else _RE_SEPARATOR
+        parts = [part.strip() for part in separator.split(title, maxsplit=1)]
+        if len(parts) == 2 and all(parts) and not _RE_VERSION_PART.fullmatch(parts[1]):
+            first, second = parts
+            artist, title = (second, first) if rule and rule.order == "title_artist" else (first, second)
+
+    raw_title = _raw_text(title)
+    artist = _raw_text(artist)
+
+    skip_reason = None
+    if raw_title and (
+        any(pattern.search(raw_title) for pattern in (rule.skip if rule else ()))
+        or (whole_title and any(pattern.fullmatch(whole_title) for pattern in rules.skip))
+    ):
+        skip_reason = "segment"
+    elif is_station(raw_title) or is_station(artist):
+        skip_reason = "station"
+
+    return ParsedMetadata(
+        artist=intern_text(_clean_text(artist)),
+        title=intern_text(_clean_text(raw_title)),
+        raw_title=intern_text(raw_title),
+        album=intern_text(album),
+        skip_reason=skip_reason,
+    )
+
+
+def _load_rules_file(path: str, known_mtime: float | None) -> tuple[float | None, Any]:
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None, None
+    if mtime == known_mtime:
+        return mtime, None
+    with open(path, encoding="utf-8") as handle:
+        return mtime, json.load(handle)
+
+
+async def async_get_station_rules(hass: HomeAssistant) -> StationRules:
+    """Return the shared station rules, re-reading the rules file when it changed.
+
+    Coordinators call this again on track changes once the rules are ``due``,
+    so edits take effect within ``STATION_RULES_CHECK_INTERVAL`` without a reload.
+
+    Rules live in ``<config>/media_art_wrapper/station_rules.json``::
+
+        {"stations": [{"match": "radio ?eins", "name": "Radio Eins",
+                       "separator": " - ", "order": "artist_title",
+                       "strip": ["\\\\s*\\\\|.*$"], "skip": ["^der beste mix"]}]}
+    """
+    current: StationRules | None = hass.data.get(DATA_STATION_RULES)
+    path = hass.config.path(STATION_RULES_FILE)
+    try:
+        mtime, data = await hass.async_add_executor_job(_load_rules_file, path, current.mtime if current else None)
+    except (OSError, ValueError) as err:
+        _LOGGER.warning("Could not read station rules %s: %s", path, err)
+        mtime, data = None, None
+
+    if current is not None and data is None and mtime == current.mtime:
+        current.checked_at = time.monotonic()
+        return current
+
+    rules = StationRules(mtime=mtime)
+    stations = data.get("stations") if isinstance(data, dict) else None
+    for item in stations if isinstance(stations, list) else []:
+        try:
+            rules.rules.append(StationRule.from_dict(item))
+        except (KeyError, TypeError, re.error) as err:
+            _LOGGER.warning("Ignoring invalid station rule %r: %s", item, err)
+    hass.data[DATA_STATION_RULES] = rules
+    return rules
@@ -11,6 +11,9 @@ class TrackQuery:
     artwork_width: int
     artwork_height: int
     original_title: str | None = None  # raw title before remix/edit stripping
+    source_entity_id: str | None = None
+    source_picture: str | None = None  # entity_picture of the source, if it is current
+    progressive: bool = False  # allow a small preview first (see ResolvedCover.upgrade_url)
 
 
 @dataclass(slots=True)
@@ -19,3 +22,7 @@ class ResolvedCover:
     artwork_url: str | None
     content_type: str
     image: bytes
+    track_id: int | None = None  # iTunes trackId, used for bulk revalidation
+    collection_id: int | None = None  # iTunes collectionId
+    upgrade_url: str | None = None  # full-size artwork to fetch after publishing this preview
+    confidence: float | None = None  # 0..1, how well the match fits the query
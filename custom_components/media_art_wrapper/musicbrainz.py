@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
+from dataclasses import dataclass
 import logging
-from typing import Any
+from typing import Any, AsyncContextManager
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .const import PROVIDER_MUSICBRAINZ
+from .fuzzy import match_confidence
 from .models import ResolvedCover, TrackQuery
+from .stats import ResolutionStats
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -14,10 +19,39 @@ CAA_FRONT_URL = "https://coverartarchive.org/release/{release_id}/front-500"
 _JSON_KW = {"content_type": None}
 
 
-async def async_musicbrainz_resolve(*, session, query: TrackQuery) -> ResolvedCover | None:
+@dataclass(slots=True, frozen=True)
+class MusicBrainzMatch:
+    release_id: str
+    artist: str | None
+    title: str | None
+    confidence: float
+
+
+def _artist_credit(credit: Any) -> str | None:
+    if not isinstance(credit, list):
+        return None
+    # [{"name": "Sia", "joinphrase": " & "}, {"name": "David Guetta"}]
+    parts = [f"{c.get('name', '')}{c.get('joinphrase', '')}" for c in credit if isinstance(c, dict)]
+    return "".join(parts).strip() or None
+
+
+async def async_musicbrainz_match(
+    *,
+    session,
+    query: TrackQuery,
+    stats: ResolutionStats | None = None,
+    limiter: AsyncContextManager[Any] | None = None,
+) -> MusicBrainzMatch | None:
+    """Search recordings and return the first one with a release (its cover is looked up later).
+
+    ``limiter`` paces the search request; the Cover Art Archive download is not paced.
+    """
     if not (query.artist or query.title):
         return None
 
+    stats = stats or ResolutionStats()
+    counters = stats.provider(PROVIDER_MUSICBRAINZ)
+
     fragments: list[str] = []
     if query.title:
         fragments.append(f'recording:"{query.title}"')
@@ -37,9 +71,15 @@ async def async_musicbrainz_resolve(*, session, query: TrackQuery) -> ResolvedCo
     }
 
     try:
-        async with session.get(MB_SEARCH_URL, params=params, headers=headers, timeout=10) as resp:
-            resp.raise_for_status()
-            payload = await resp.json(**_JSON_KW)
+        with stats.timed("search", f"{PROVIDER_MUSICBRAINZ}: {mb_query}"):
+            async with limiter or nullcontext(), session.get(
+                MB_SEARCH_URL, params=params, headers=headers, timeout=10
+            ) as resp:
+                counters.requests += 1
+                counters.rate_limited += resp.status in (429, 503)  # MusicBrainz throttles with 503
+                counters.bytes += resp.content_length or 0
+                resp.raise_for_status()
+                payload = await resp.json(**_JSON_KW)
     except Exception as err:
         raise HomeAssistantError(f"MusicBrainz search failed: {err}") from err
 
@@ -47,7 +87,6 @@ async def async_musicbrainz_resolve(*, session, query: TrackQuery) -> ResolvedCo
     if not isinstance(recordings, list) or not recordings:
         return None
 
-    release_id: str | None = None
     for rec in recordings:
         if not isinstance(rec, dict):
             continue
@@ -59,22 +98,38 @@ async def async_musicbrainz_resolve(*, session, query: TrackQuery) -> ResolvedCo
                 continue
             rel_id = rel.get("id")
             if isinstance(rel_id, str) and rel_id:
-                release_id = rel_id
-                break
-        if release_id:
-            break
-
-    if not release_id:
-        return None
-
-    artwork_url = CAA_FRONT_URL.format(release_id=release_id)
+                artist = _artist_credit(rec.get("artist-credit"))
+                title = rec.get("title") if isinstance(rec.get("title"), str) else None
+                return MusicBrainzMatch(
+                    release_id=rel_id,
+                    artist=artist,
+                    title=title,
+                    confidence=round(match_confidence(query.artist, query.title, artist, title), 3),
+                )
+    return None
+
+
+async def async_musicbrainz_fetch(
+    *,
+    session,
+    match: MusicBrainzMatch,
+    stats: ResolutionStats | None = None,
+) -> ResolvedCover | None:
+    """Download the Cover Art Archive front cover of the matched release."""
+    stats = stats or ResolutionStats()
+    counters = stats.provider(PROVIDER_MUSICBRAINZ)
+    artwork_url = CAA_FRONT_URL.format(release_id=match.release_id)
 
     try:
-        async with session.get(artwork_url, timeout=10) as img_resp:
-            if img_resp.status >= 400:
-                return None
-            content_type = img_resp.headers.get("Content-Type", "image/jpeg")
-            image = await img_resp.read()
+        with stats.timed("download", artwork_url):
+            async with session.get(artwork_url, timeout=10) as img_resp:
+                counters.requests += 1
+                counters.rate_limited += img_resp.status == 429
+                if img_resp.status >= 400:
+                    return None
+                content_type = img_resp.headers.get("Content-Type", "image/jpeg")
+                image = await img_resp.read()
+                counters.bytes += len(image)
     except Exception as err:  # noqa: BLE001
         _LOGGER.debug("MusicBrainz artwork fetch failed for %s: %s", artwork_url, err)
         return None
@@ -83,8 +138,22 @@ async def async_musicbrainz_resolve(*, session, query: TrackQuery) -> ResolvedCo
         return None
 
     return ResolvedCover(
-        provider="musicbrainz",
+        provider=PROVIDER_MUSICBRAINZ,
         artwork_url=artwork_url,
         content_type=content_type,
         image=image,
+        confidence=match.confidence,
     )
+
+
+async def async_musicbrainz_resolve(
+    *,
+    session,
+    query: TrackQuery,
+    stats: ResolutionStats | None = None,
+    limiter: AsyncContextManager[Any] | None = None,
+) -> ResolvedCover | None:
+    match = await async_musicbrainz_match(session=session, query=query, stats=stats, limiter=limiter)
+    if match is None:
+        return None
+    return await async_musicbrainz_fetch(session=session, match=match, stats=stats)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import colorsys
+from dataclasses import dataclass
+import math
+from typing import Any
+
+from .const import BLURHASH_COMPONENTS, PALETTE_COLORS
+
+_BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+_SAMPLE_SIZE = 64  # px, palette quantisation input
+_BLURHASH_SAMPLE = 32  # px, blurhash input
+
+
+@dataclass(slots=True, frozen=True)
+class Palette:
+    dominant: tuple[int, int, int]  # most frequent colour
+    vibrant: tuple[int, int, int]  # most saturated/bright colour with a meaningful share
+    colors: tuple[tuple[int, int, int], ...]  # quantised palette, most frequent first
+    blurhash: str | None
+
+    def as_attributes(self) -> dict[str, Any]:
+        return {
+            "dominant_color": list(self.dominant),
+            "vibrant_color": list(self.vibrant),
+            "palette": [_hex(color) for color in self.colors],
+            "blurhash": self.blurhash,
+        }
+
+
+def _hex(color: tuple[int, int, int]) -> str:
+    return "#{:02x}{:02x}{:02x}".format(*color)
+
+
+def _vibrancy(color: tuple[int, int, int], share: float) -> float:
+    _h, saturation, value = colorsys.rgb_to_hsv(*(c / 255 for c in color))
+    # Prefer saturated mid/bright colours; a tiny share is usually an outlier.
+    return saturation * (1 - abs(value - 0.75)) * min(1.0, share * 10)
+
+
+def _srgb_to_linear(value: int) -> float:
+    v = value / 255
+    return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value: float) -> int:
+    v = max(0.0, min(1.0, value))
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def _base83(value: int, length: int) -> str:
+    return "".join(_BASE83[(value // 83 ** (length - 1 - i)) % 83] for i in range(length))
+
+
+def blurhash_encode(pixels: list[tuple[int, int, int]], width: int, height: int, x_components: int, y_components: int) -> str:
+    """Encode RGB ``pixels`` (row-major) as a BlurHash string (https://blurha.sh)."""
+    linear = [tuple(_srgb_to_linear(c) for c in pixel) for pixel in pixels]
+    cos_x = [[math.cos(math.pi * i * x / width) for x in range(width)] for i in range(x_components)]
+    cos_y = [[math.cos(math.pi * j * y / height) for y in range(height)] for j in range(y_components)]
+
+    factors: list[tuple[float, float, float]] = []
+    for j in range(y_components):
+        for i in range(x_components):
+            r = g = b = 0.0
+            for y in range(height):
+                row = y * width
+                cy = cos_y[j][y]
+                for x in range(width):
+                    basis = cos_x[i][x] * cy
+                    pr, pg, pb = linear[row + x]
+                    r += basis * pr
+                    g += basis * pg
+                    b += basis * pb
+            scale = (1 if i == j == 0 else 2) / (width * height)
+            factors.append((r * scale, g * scale, b * scale))
+
+    dc, ac = factors[0], factors[1:]
+    result = _base83((x_components - 1) + (y_components - 1) * 9, 1)
+    if ac:
+        quantised_max = max(0, min(82, int(max(abs(v) for f in ac for v in f) * 166 - 0.5)))
+        max_value = (quantised_max + 1) / 166
+        result += _base83(quantised_max, 1)
+    else:
+        max_value = 1.0
+        result += _base83(0, 1)
+
+    result += _base83((_linear_to_srgb(dc[0]) << 16) + (_linear_to_srgb(dc[1]) << 8) + _linear_to_srgb(dc[2]), 4)
+
+    def quantise(v: float) -> int:
+        return max(0, min(18, int(math.copysign(abs(v / max_value) ** 0.5, v) * 9 + 9.5)))
+
+    for r, g, b in ac:
+        result += _base83(quantise(r) * 19 * 19 + quantise(g) * 19 + quantise(b), 2)
+    return result
+
+
+def extract_palette(src: Any) -> Palette:
+    """Compute colours and a BlurHash from a decoded PIL image (runs in the executor)."""
+    from PIL import Image  # noqa: PLC0415
+
+    rgb = src.convert("RGB")
+    sample = rgb.resize((_SAMPLE_SIZE, _SAMPLE_SIZE), Image.BILINEAR)
+    quantised = sample.quantize(colors=PALETTE_COLORS, method=Image.Quantize.MEDIANCUT)
+    raw_palette = quantised.getpalette() or []
+    counts = sorted(quantised.getcolors() or [], reverse=True)
+    total = sum(count for count, _index in counts) or 1
+    colors = [tuple(raw_palette[index * 3 : index * 3 + 3]) for _count, index in counts]
+    shares = [count / total for count, _index in counts]
+
+    dominant = colors[0] if colors else (0, 0, 0)
+    vibrant = max(zip(colors, shares), key=lambda item: _vibrancy(item[0], item[1]))[0] if colors else dominant
+
+    small = rgb.resize((_BLURHASH_SAMPLE, _BLURHASH_SAMPLE), Image.BILINEAR)
+    x_components, y_components = BLURHASH_COMPONENTS
+    blurhash = blurhash_encode(list(small.getdata()), _BLURHASH_SAMPLE, _BLURHASH_SAMPLE, x_components, y_components)
+
+    return Palette(dominant=dominant, vibrant=vibrant, colors=tuple(colors), blurhash=blurhash)
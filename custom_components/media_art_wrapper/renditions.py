@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+import hashlib
+import io
+import logging
+
+from .const import RENDITION_SIZES
+from .palette import Palette, extract_palette
+
+_LOGGER = logging.getLogger(__name__)
+
+_JPEG_QUALITY = 85
+# Pillow format and save options per type in TRANSCODE_TYPES
+_TRANSCODE_FORMATS: dict[str, tuple[str, dict[str, int]]] = {
+    "image/avif": ("AVIF", {"quality": 60, "speed": 6}),
+    "image/webp": ("WEBP", {"quality": 80, "method": 4}),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Rendition:
+    size: int  # longest edge in px
+    content_type: str
+    image: bytes
+
+
+@dataclass(slots=True, frozen=True)
+class ProcessedCover:
+    """Everything derived from one cover image, computed once per image."""
+
+    image_hash: str
+    renditions: dict[int, Rendition] = field(default_factory=dict)
+    palette: Palette | None = None
+
+
+def image_hash(image: bytes) -> str:
+    return hashlib.sha256(image).hexdigest()
+
+
+def process_cover(image: bytes, content_type: str) -> ProcessedCover:
+    """Return the hash, rendition ladder and palette of ``image``.
+
+    Runs in the executor. The original is always part of the ladder under its own
+    edge length; ``RENDITION_SIZES`` steps at or above that size are skipped (no
+    upscaling). Without Pillow, or for undecodable data, only the hash is set.
+    """
+    digest = image_hash(image)
+    try:  # Pillow ships with Home Assistant core; imported here (in the executor) to keep startup light.
+        from PIL import Image  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        return ProcessedCover(digest)
+
+    try:
+        with Image.open(io.BytesIO(image)) as src:
+            src.load()
+            edge = max(src.size)
+            ladder = {edge: Rendition(edge, content_type, image)}
+            has_alpha = src.mode in ("RGBA", "LA") or (src.mode == "P" and "transparency" in src.info)
+            for size in RENDITION_SIZES:
+                if size >= edge:
+                    continue
+                scaled = src.copy()
+                scaled.thumbnail((size, size), Image.LANCZOS)
+                buffer = io.BytesIO()
+                if has_alpha:
+                    scaled.save(buffer, format="PNG", optimize=True)
+                    ladder[size] = Rendition(size, "image/png", buffer.getvalue())
+                else:
+                    scaled.convert("RGB").save(buffer, format="JPEG", quality=_JPEG_QUALITY, optimize=True)
+                    ladder[size] = Rendition(size, "image/jpeg", buffer.getvalue())
+            palette = extract_palette(src)
+    except Exception as err:  # noqa: BLE001
+        _LOGGER.debug("Could not process cover image: %s", err)
+        return ProcessedCover(digest)
+
+    return ProcessedCover(digest, ladder, palette)
+
+
+def share_original(processed: ProcessedCover, image: bytes) -> ProcessedCover:
+    """Point the full-size rendition at ``image`` itself; worker processes hand back a copy."""
+    for size, rendition in processed.renditions.items():
+        if rendition.image is not image and rendition.image == image:
+            processed.renditions[size] = replace(rendition, image=image)
+    return processed
+
+
+def transcode(image: bytes, candidates: tuple[str, ...]) -> Rendition | None:
+    """Re-encode ``image`` into the first of ``candidates`` this Pillow build can write.
+
+    Runs in the image pool. Returns None without Pillow, when no candidate is
+    supported, or when the result would not be smaller than ``image``.
+    """
+    try:
+        from PIL import Image  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        return None
+
+    Image.init()  # registers optional plugins such as AVIF
+    for target in candidates:
+        pil_format, options = _TRANSCODE_FORMATS[target]
+        if pil_format not in Image.SAVE:
+            continue
+        try:
+            with Image.open(io.BytesIO(image)) as src:
+                has_alpha = src.mode in ("RGBA", "LA") or (src.mode == "P" and "transparency" in src.info)
+                buffer = io.BytesIO()
+                src.convert("RGBA" if has_alpha else "RGB").save(buffer, format=pil_format, **options)
+                edge = max(src.size)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Could not encode cover as %s: %s", target, err)
+            continue
+        encoded = buffer.getvalue()
+        if len(encoded) >= len(image):
+            return None
+        return Rendition(edge, target, encoded)
+    return None
+
+
+def pick_rendition(ladder: dict[int, Rendition], size: int) -> Rendition | None:
+    """Return the smallest rendition covering ``size``, else the largest available."""
+    if not ladder:
+        return None
+    larger = [s for s in ladder if s >= size]
+    return ladder[min(larger)] if larger else ladder[max(ladder)]
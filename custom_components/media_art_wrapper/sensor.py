@@ -1,23 +1,30 @@
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import CoverCoordinator, CoverData
-from .const import DOMAIN
+from .const import DOMAIN, UNRECORDED_ATTRIBUTES
 from .helpers import source_name
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
     coordinator: CoverCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([MediaCoverArtStatusSensor(coordinator, entry)], update_before_add=False)
+    async_add_entities(
+        [MediaCoverArtStatusSensor(coordinator, entry), MediaCoverArtTimingSensor(coordinator, entry)],
+        update_before_add=False,
+    )
 
 
 class MediaCoverArtStatusSensor(CoordinatorEntity[CoverCoordinator], SensorEntity):
     _attr_has_entity_name = False
     _attr_icon = "mdi:music-circle"
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
 
     def __init__(self, coordinator: CoverCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator)
@@ -42,19 +49,52 @@ class MediaCoverArtStatusSensor(CoordinatorEntity[CoverCoordinator], SensorEntit
 
     @property
     def extra_state_attributes(self) -> dict[str, str | int | None]:
-        data: CoverData | None = self.coordinator.data
-        source_state = self.coordinator.hass.states.get(self.coordinator.source_entity_id)
         return {
-            "source_entity_id": self.coordinator.source_entity_id,
-            "source_state": source_state.state if source_state else None,
-            "track_key": data.track_key if data else None,
-            "artist": data.artist if data else None,
-            "title": data.title if data else None,
-            "album": data.album if data else None,
-            "provider": data.provider if data else None,
-            "artwork_url": data.artwork_url if data else None,
-            "artwork_width": self.coordinator.artwork_width,
-            "artwork_height": self.coordinator.artwork_height,
-            "artwork_size": self.coordinator.artwork_size,
+            **self.coordinator.cover_attributes,
+            "source_state": self.coordinator.source.state,
             "last_error": self.coordinator.last_error,
         }
+
+
+class MediaCoverArtTimingSensor(CoordinatorEntity[CoverCoordinator], SensorEntity):
+    """Time-to-cover of the last resolution, with per-provider counters as attributes.
+
+    Disabled by default; the full breakdown is also available in the diagnostics dump.
+    """
+
+    _attr_has_entity_name = False
+    _attr_icon = "mdi:timer-music-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _unrecorded_attributes = frozenset({"providers", "last_trace"})
+
+    def __init__(self, coordinator: CoverCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}_cover_timing"
+        self._attr_name = f"{source_name(coordinator.source_entity_id)} Cover Resolution Time"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.stats.last_total_ms
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        stats = self.coordinator.stats
+        return {
+            "resolutions": stats.resolutions,
+            "providers": {
+                name: {
+                    "requests": counters.requests,
+                    "hits": counters.hits,
+                    "misses": counters.misses,
+                    "errors": counters.errors,
+                    "rate_limited": counters.rate_limited,
+                    "bytes": counters.bytes,
+                }
+                for name, counters in stats.providers.items()
+            },
+            "last_trace": stats.last_trace,
+        }
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import client_context
+
+from .const import (
+    POOLED_PROVIDERS,
+    PROVIDER_DNS_TTL,
+    PROVIDER_KEEPALIVE,
+    PROVIDER_POOL_LIMIT,
+    PROVIDER_POOL_LIMIT_PER_HOST,
+)
+from .stats import LatencyHistogram
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PoolStats:
+    requests: int = 0
+    connections: int = 0  # new connections (DNS, TCP and TLS)
+    reused: int = 0  # requests served on a kept-alive connection
+    queued: int = 0  # requests that waited for a free connection
+    dns_hits: int = 0
+    dns_misses: int = 0
+    connect: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "connections": self.connections,
+            "reused": self.reused,
+            "reuse_rate": round(self.reused / self.requests, 3) if self.requests else None,
+            "queued": self.queued,
+            "dns_hits": self.dns_hits,
+            "dns_misses": self.dns_misses,
+            "connect": self.connect.as_dict(),
+        }
+
+
+def _trace_config(stats: PoolStats) -> aiohttp.TraceConfig:
+    trace = aiohttp.TraceConfig()
+
+    async def _on_request_start(_session, _ctx, _params) -> None:
+        stats.requests += 1
+
+    async def _on_connection_create_start(_session, ctx, _params) -> None:
+        ctx.connect_started = time.perf_counter()
+
+    async def _on_connection_create_end(_session, ctx, _params) -> None:
+        stats.connections += 1
+        stats.connect.observe((time.perf_counter() - ctx.connect_started) * 1000)
+
+    async def _on_connection_reuseconn(_session, _ctx, _params) -> None:
+        stats.reused += 1
+
+    async def _on_connection_queued_start(_session, _ctx, _params) -> None:
+        stats.queued += 1
+
+    async def _on_dns_cache_hit(_session, _ctx, _params) -> None:
+        stats.dns_hits += 1
+
+    async def _on_dns_cache_miss(_session, _ctx, _params) -> None:
+        stats.dns_misses += 1
+
+    trace.on_request_start.append(_on_request_start)
+    trace.on_connection_create_start.append(_on_connection_create_start)
+    trace.on_connection_create_end.append(_on_connection_create_end)
+    trace.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace.on_connection_queued_start.append(_on_connection_queued_start)
+    trace.on_dns_cache_hit.append(_on_dns_cache_hit)
+    trace.on_dns_cache_miss.append(_on_dns_cache_miss)
+    return trace
+
+
+class ProviderSessions:
+    """One HTTP session with its own connection pool per artwork provider.
+
+    Home Assistant's shared session closes idle connections after a few
+    seconds and shares its pool with every other integration, so each track
+    change used to open fresh TLS connections to the provider. Here every
+    provider in ``POOLED_PROVIDERS`` gets a connector of its own with long
+    keep-alive, cached DNS and a per-host limit. Other providers (the source
+    player on the LAN) keep using the shared session.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+        self.stats: dict[str, PoolStats] = {provider: PoolStats() for provider in POOLED_PROVIDERS}
+        self._unsub_close = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_on_close)
+
+    def get(self, provider: str | None) -> aiohttp.ClientSession | None:
+        """Return the pooled session of ``provider``, or None when it has none."""
+        if provider not in self.stats:
+            return None
+        session = self._sessions.get(provider)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=PROVIDER_POOL_LIMIT,
+                limit_per_host=PROVIDER_POOL_LIMIT_PER_HOST,
+                keepalive_timeout=PROVIDER_KEEPALIVE,
+                ttl_dns_cache=PROVIDER_DNS_TTL,
+                enable_cleanup_closed=True,
+                ssl=client_context(),
+            )
+            session = self._sessions[provider] = aiohttp.ClientSession(
+                connector=connector,
+                headers={"User-Agent": SERVER_SOFTWARE},
+                trace_configs=[_trace_config(self.stats[provider])],
+            )
+            _LOGGER.debug("Opened connection pool for %s", provider)
+        return session
+
+    async def async_close(self) -> None:
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            await session.close()
+
+    @callback
+    def _async_on_close(self, _event: Event) -> None:
+        self._unsub_close = None
+        self.hass.async_create_task(self.async_close())
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "limit": PROVIDER_POOL_LIMIT,
+            "limit_per_host": PROVIDER_POOL_LIMIT_PER_HOST,
+            "keepalive_s": PROVIDER_KEEPALIVE,
+            "dns_ttl_s": PROVIDER_DNS_TTL,
+            "providers": {
+                provider: {"open": provider in self._sessions} | stats.as_dict()
+                for provider, stats in self.stats.items()
+            },
+        }
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+from urllib.parse import urlsplit
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.network import NoURLAvailableError, get_url
+
+from .const import PROVIDER_SOURCE
+from .models import ResolvedCover, TrackQuery
+from .stats import ResolutionStats
+
+_LOGGER = logging.getLogger(__name__)
+
+MEDIA_PLAYER_DOMAIN = "media_player"
+# Anything smaller is almost certainly an app icon or a 1x1 placeholder, not a cover.
+_MIN_IMAGE_BYTES = 1024
+
+
+def _is_valid_image(image: bytes | None, content_type: str | None) -> bool:
+    if not image or len(image) < _MIN_IMAGE_BYTES:
+        return False
+    return not content_type or content_type.split(";", 1)[0].strip().lower().startswith("image/")
+
+
+async def _async_fetch_from_entity(hass: HomeAssistant, entity_id: str) -> tuple[bytes | None, str | None]:
+    """Ask the source entity for its image in-process (same path as the media player proxy)."""
+    component = hass.data.get(MEDIA_PLAYER_DOMAIN)
+    get_entity = getattr(component, "get_entity", None)
+    entity = get_entity(entity_id) if get_entity else None
+    if entity is None:
+        return None, None
+    return await entity.async_get_media_image()
+
+
+async def _async_fetch_url(hass: HomeAssistant, session, url: str) -> tuple[bytes | None, str | None]:
+    if not urlsplit(url).scheme:
+        try:
+            url = f"{get_url(hass, prefer_external=False)}{url}"
+        except NoURLAvailableError:
+            return None, None
+    async with session.get(url, timeout=10) as resp:
+        if resp.status >= 400:
+            return None, None
+        return await resp.read(), resp.headers.get("Content-Type")
+
+
+async def _async_fetch_source(
+    hass: HomeAssistant, session, entity_id: str, picture: str, proxied: bool
+) -> tuple[bytes | None, str | None]:
+    if proxied:
+        image, content_type = await _async_fetch_from_entity(hass, entity_id)
+        if image is not None:
+            return image, content_type
+    return await _async_fetch_url(hass, session, picture)
+
+
+async def async_source_art_resolve(
+    *,
+    hass: HomeAssistant | None,
+    session,
+    query: TrackQuery,
+    stats: ResolutionStats | None = None,
+) -> ResolvedCover | None:
+    """Use the artwork the source media_player already exposes via ``entity_picture``.
+
+    Proxied pictures (``/api/media_player_proxy/...``) are read straight from the
+    source entity without an HTTP round trip; absolute URLs are fetched directly.
+    """
+    picture = query.source_picture
+    if hass is None or not picture or not query.source_entity_id:
+        return None
+
+    stats = stats or ResolutionStats()
+    counters = stats.provider(PROVIDER_SOURCE)
+    proxied = urlsplit(picture).path.startswith(f"/api/{MEDIA_PLAYER_DOMAIN}_proxy/")
+    try:
+        with stats.timed("download", f"{PROVIDER_SOURCE}: {query.source_entity_id}"):
+            image, content_type = await _async_fetch_source(hass, session, query.source_entity_id, picture, proxied)
+    except Exception as err:
+        raise HomeAssistantError(f"Source artwork fetch failed: {err}") from err
+    counters.requests += 1
+    counters.bytes += len(image or b"")
+
+    if not _is_valid_image(image, content_type):
+        _LOGGER.debug("Ignoring source artwork of %s (missing or placeholder)", query.source_entity_id)
+        return None
+
+    return ResolvedCover(
+        provider=PROVIDER_SOURCE,
+        # Never expose the proxy access token through the artwork_url attribute.
+        artwork_url=urlsplit(picture).path if proxied else picture,
+        content_type=content_type or "image/jpeg",
+        image=image,
+        confidence=1.0,  # what the player itself shows
+    )
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+# Upper bounds (ms) of the latency histogram buckets; one overflow bucket follows.
+LATENCY_BUCKETS_MS: tuple[int, ...] = (10, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"<={bound}" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "max_ms": round(self.max_ms, 1),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+@dataclass(slots=True)
+class ProviderStats:
+    requests: int = 0
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+    rate_limited: int = 0  # HTTP 429 responses
+    bytes: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "bytes": self.bytes,
+            "latency": self.latency.as_dict(),
+        }
+
+
+class ResolutionStats:
+    """Counters and timings for one resolver stack.
+
+    ``timed`` records a stage into its latency histogram and into the trace of the
+    current resolution, so the last trace shows where time-to-cover went (cache
+    lookup, each search term, scoring, image download, ...).
+    """
+
+    def __init__(self) -> None:
+        self.providers: dict[str, ProviderStats] = {}
+        self.stages: dict[str, LatencyHistogram] = {}
+        self.resolutions = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.fuzzy_hits = 0  # served from a near-duplicate cache entry
+        self.group_hits = 0  # taken from the leader of the speaker group
+        self.second_opinions = 0  # borderline matches checked against a second provider
+        self.second_opinion_agreed = 0
+        self.second_opinion_overruled = 0  # the second provider's match was used instead
+        self.skipped = 0  # non-music segments, resolved without a lookup
+        self.last_trace: list[dict[str, Any]] = []
+        self._trace: list[dict[str, Any]] = []
+
+    def provider(self, name: str) -> ProviderStats:
+        stats = self.providers.get(name)
+        if stats is None:
+            stats = self.providers[name] = ProviderStats()
+        return stats
+
+    def observe(self, stage: str, ms: float, detail: str | None = None, *, trace: bool = True) -> None:
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = LatencyHistogram()
+        histogram.observe(ms)
+        if trace:
+            entry: dict[str, Any] = {"stage": stage, "ms": round(ms, 1)}
+            if detail:
+                entry["detail"] = detail
+            self._trace.append(entry)
+
+    @contextmanager
+    def timed(self, stage: str, detail: str | None = None) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, (time.perf_counter() - started) * 1000, detail)
+
+    def begin_resolution(self) -> None:
+        self._trace = []
+
+    def end_resolution(self) -> None:
+        self.resolutions += 1
+        self.last_trace = self._trace
+
+    @property
+    def last_total_ms(self) -> float | None:
+        for entry in reversed(self.last_trace):
+            if entry["stage"] == "total":
+                return entry["ms"]
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "resolutions": self.resolutions,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "fuzzy_hits": self.fuzzy_hits,
+            "group_hits": self.group_hits,
+            "second_opinion": {
+                "requested": self.second_opinions,
+                "agreed": self.second_opinion_agreed,
+                "overruled": self.second_opinion_overruled,
+            },
+            "skipped": self.skipped,
+            "providers": {name: stats.as_dict() for name, stats in self.providers.items()},
+            "stages": {name: histogram.as_dict() for name, histogram in self.stages.items()},
+            "last_trace": list(self.last_trace),
+        }
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, TRACE_FLUSH_DELAY, TRACE_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+# Attributes written per event; everything else in the source state is ignored.
+TRACE_ATTRIBUTES: tuple[str, ...] = ("media_title", "media_artist", "media_album_name")
+
+
+def trace_path(hass: HomeAssistant, entity_id: str) -> str:
+    return hass.config.path(DOMAIN, "traces", f"{entity_id.replace('.', '_')}.jsonl")
+
+
+def trace_event_from_state(state: State) -> dict[str, Any]:
+    """Compact trace line: wall-clock ``t``, entity, state and the non-empty metadata."""
+    event: dict[str, Any] = {"t": round(time.time(), 3), "entity_id": state.entity_id, "state": state.state}
+    for attr in TRACE_ATTRIBUTES:
+        value = state.attributes.get(attr)
+        if value not in (None, ""):
+            event[attr] = value
+    return event
+
+
+def load_trace(path: str) -> list[dict[str, Any]]:
+    """Read a trace file; ``t`` is rebased so the first event is at 0 s.
+
+    Malformed lines (e.g. a partial line from a crash during a flush) are skipped.
+    """
+    events: list[dict[str, Any]] = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(event, dict):
+                events.append(event)
+    if events:
+        start = float(events[0].get("t", 0.0))
+        for event in events:
+            event["t"] = round(float(event.get("t", start)) - start, 3)
+    return events
+
+
+def _append_lines(path: str, lines: list[str]) -> int:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.writelines(lines)
+        return handle.tell()
+
+
+class TraceRecorder:
+    """Append the metadata event stream of one source entity to a JSONL file.
+
+    Only events that change the state or one of ``TRACE_ATTRIBUTES`` are kept
+    (position ticks and volume changes are dropped). Lines are buffered and
+    written in the executor at most every ``TRACE_FLUSH_DELAY`` seconds; the
+    recorder stops by itself once the file reaches ``TRACE_MAX_BYTES``.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str, path: str | None = None) -> None:
+        self.hass = hass
+        self.path = path or trace_path(hass, entity_id)
+        self.events = 0
+        self._buffer: list[str] = []
+        self._last: tuple[Any, ...] | None = None
+        self._unsub_flush: Any | None = None
+        self._full = False
+
+    @callback
+    def record(self, state: State | None) -> None:
+        if state is None or self._full:
+            return
+        signature = (state.state, *(state.attributes.get(attr) for attr in TRACE_ATTRIBUTES))
+        if signature == self._last:
+            return
+        self._last = signature
+        self._buffer.append(json.dumps(trace_event_from_state(state), ensure_ascii=False, separators=(",", ":")) + "\n")
+        self.events += 1
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self.hass, TRACE_FLUSH_DELAY, self._async_scheduled_flush)
+
+    async def _async_scheduled_flush(self, _now: Any) -> None:
+        self._unsub_flush = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        try:
+            size = await self.hass.async_add_executor_job(_append_lines, self.path, lines)
+        except OSError as err:
+            _LOGGER.warning("Could not write trace %s: %s", self.path, err)
+            return
+        if size >= TRACE_MAX_BYTES:
+            self._full = True
+            _LOGGER.warning("Trace %s reached %d bytes, recording stopped", self.path, size)
+
+    async def async_stop(self) -> None:
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        await self.async_flush()
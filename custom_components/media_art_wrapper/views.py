@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from http import HTTPStatus
+import logging
+import re
+import time
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http.auth import async_sign_path
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    COVER_URL_EXPIRATION,
+    COVER_VARIANTS_MAX,
+    DATA_COVER_CACHE,
+    DATA_RESOLVER_ENGINE,
+    DATA_SIGNED_COVER_URLS,
+    DOMAIN,
+    SIGNED_COVER_URLS_MAX,
+    TRANSCODE_TYPES,
+)
+from .imaging import ImageJobCancelled
+from .renditions import Rendition, pick_rendition, transcode
+
+_LOGGER = logging.getLogger(__name__)
+
+COVER_URL_PREFIX = f"/api/{DOMAIN}/cover"
+_IMMUTABLE = "public, max-age=31536000, immutable"
+_RE_HASH = re.compile(r"^[0-9a-f]{64}$")
+_EXTENSIONS = {"image/jpeg": "jpg", "image/png": "png", "image/webp": "webp", "image/avif": "avif", "image/gif": "gif"}
+
+
+def cover_url(image_hash: str, content_type: str, size: int | None = None) -> str:
+    """Return the content-addressed URL under which ``CoverImageView`` serves a cover."""
+    ext = _EXTENSIONS.get(content_type.split(";", 1)[0].strip().lower(), "jpg")
+    url = f"{COVER_URL_PREFIX}/{image_hash}.{ext}"
+    return f"{url}?size={size}" if size else url
+
+
+@callback
+def async_signed_cover_url(hass: HomeAssistant, image_hash: str, content_type: str, size: int | None = None) -> str:
+    """Return ``cover_url`` signed for ``COVER_URL_EXPIRATION``.
+
+    A signature is reused for half its lifetime, so states written in between
+    publish the same URL and browsers keep serving their cached copy.
+    """
+    path = cover_url(image_hash, content_type, size)
+    signed: OrderedDict[str, tuple[str, float]] = hass.data.setdefault(DATA_SIGNED_COVER_URLS, OrderedDict())
+    now = time.monotonic()
+    cached = signed.get(path)
+    if cached is not None and cached[1] > now:
+        signed.move_to_end(path)
+        return cached[0]
+    url = async_sign_path(hass, path, COVER_URL_EXPIRATION, use_content_user=True)
+    signed[path] = (url, now + COVER_URL_EXPIRATION.total_seconds() / 2)
+    signed.move_to_end(path)
+    while len(signed) > SIGNED_COVER_URLS_MAX:
+        signed.popitem(last=False)
+    return url
+
+
+def _accepted_types(accept: str) -> tuple[str, ...]:
+    """Return the ``TRANSCODE_TYPES`` listed explicitly (q > 0) in an ``Accept`` header."""
+    listed: set[str] = set()
+    for part in accept.split(","):
+        media_type, *params = (p.strip() for p in part.split(";"))
+        quality = next((p.partition("=")[2] for p in params if p.startswith("q=")), "1")
+        try:
+            if float(quality) <= 0:
+                continue
+        except ValueError:
+            continue
+        listed.add(media_type.lower())
+    return tuple(t for t in TRANSCODE_TYPES if t in listed)
+
+
+def _find_cover(hass: HomeAssistant, image_hash: str) -> tuple[bytes, str, dict[int, Rendition]] | None:
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        data = getattr(coordinator, "data", None)
+        if data is not None and data.image and data.image_hash == image_hash:
+            return data.image, data.content_type, data.renditions
+    cache = hass.data.get(DATA_COVER_CACHE)
+    cached = cache.find_by_hash(image_hash) if cache is not None else None
+    if cached is not None and cached.image:
+        return cached.image, cached.content_type, cached.renditions or {}
+    return None
+
+
+class CoverImageView(HomeAssistantView):
+    """Serve cover bytes by content hash with strong ETags and immutable caching.
+
+    The URL embeds the SHA-256 of the image, so a given URL never changes content
+    and clients may cache it forever. The hash is no secret (it can be computed
+    from public provider artwork), so requests must be authenticated; entities
+    publish paths signed by ``async_signed_cover_url``, which browsers can load
+    in ``<img>`` without an auth header.
+
+    Clients listing AVIF or WebP in ``Accept`` get the cover re-encoded into the
+    most compact of them. Variants are encoded once in the image pool and kept
+    in a small LRU; without encoder support, or while the pool is busy, the
+    original bytes are served.
+    """
+
+    url = COVER_URL_PREFIX + "/{image_hash}.{ext}"
+    name = f"api:{DOMAIN}:cover"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        # (hash, size, accepted types) -> variant, or None when the original is smaller
+        self._variants: OrderedDict[tuple[str, int, tuple[str, ...]], Rendition | None] = OrderedDict()
+
+    async def _async_variant(
+        self, image_hash: str, size: int, candidates: tuple[str, ...], image: bytes
+    ) -> Rendition | None:
+        key = (image_hash, size, candidates)
+        if key in self._variants:
+            self._variants.move_to_end(key)
+            return self._variants[key]
+        engine = self.hass.data.get(DATA_RESOLVER_ENGINE)
+        if engine is None:
+            return None
+        try:
+            variant = await engine.images.async_run(
+                f"{image_hash}|{size}|{','.join(candidates)}", "view", transcode, image, candidates
+            )
+        except ImageJobCancelled:
+            return None  # pool is busy; try again on the next request
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Could not transcode cover %s: %s", image_hash, err)
+            variant = None
+        self._variants[key] = variant
+        while len(self._variants) > COVER_VARIANTS_MAX:
+            self._variants.popitem(last=False)
+        return variant
+
+    async def get(self, request: web.Request, image_hash: str, ext: str) -> web.StreamResponse:
+        if not _RE_HASH.match(image_hash):
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        try:
+            size = int(request.query.get("size", 0))
+        except ValueError:
+            size = 0
+
+        # The ETag names hash, size and – when negotiated – the output type. Any
+        # type of the same hash and size is the same picture, so it is not modified.
+        base = f"{image_hash}-{size}" if size else image_hash
+        for tag in request.headers.get(hdrs.IF_NONE_MATCH, "").split(","):
+            tag = tag.strip().removeprefix("W/").strip('"')
+            if tag == base or (tag.startswith(f"{base}-") and not tag[len(base) + 1 :].isdigit()):
+                headers = {hdrs.ETAG: f'"{tag}"', hdrs.CACHE_CONTROL: _IMMUTABLE, hdrs.VARY: hdrs.ACCEPT}
+                return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        found = _find_cover(self.hass, image_hash)
+        if found is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        image, content_type, renditions = found
+        if size and (rendition := pick_rendition(renditions, size)):
+            image, content_type = rendition.image, rendition.content_type
+        candidates = _accepted_types(request.headers.get(hdrs.ACCEPT, ""))
+        if candidates and content_type not in candidates:
+            variant = await self._async_variant(image_hash, size, candidates, image)
+            if variant is not None:
+                image, content_type = variant.image, variant.content_type
+
+        etag = f'"{base}-{content_type.partition("/")[2]}"' if candidates else f'"{base}"'
+        headers = {hdrs.ETAG: etag, hdrs.CACHE_CONTROL: _IMMUTABLE, hdrs.VARY: hdrs.ACCEPT}
+        return web.Response(body=image, content_type=content_type, headers=headers)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import base64
+from functools import lru_cache
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, SIGNAL_COVER_UPDATED, WS_THUMBNAIL_MAX_BYTES
+from .views import async_signed_cover_url
+
+if TYPE_CHECKING:
+    from . import CoverCoordinator, CoverData
+
+_LOGGER = logging.getLogger(__name__)
+
+# Cover attributes pushed alongside the image URL (the rest stay entity attributes).
+_PUSHED_ATTRIBUTES = (
+    "track_key",
+    "artist",
+    "title",
+    "album",
+    "provider",
+    "confidence",
+    "dominant_color",
+    "vibrant_color",
+    "palette",
+    "blurhash",
+)
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    websocket_api.async_register_command(hass, ws_subscribe)
+
+
+@lru_cache(maxsize=32)
+def _data_uri(content_type: str, image: bytes) -> str:
+    return f"data:{content_type};base64,{base64.b64encode(image).decode('ascii')}"
+
+
+def _thumbnail(data: CoverData) -> str | None:
+    """The smallest rendition (or a small original) as a data URI, None when too large."""
+    if data.renditions:
+        rendition = data.renditions[min(data.renditions)]
+        image, content_type = rendition.image, rendition.content_type
+    else:
+        image, content_type = data.image, data.content_type
+    if not image or len(image) > WS_THUMBNAIL_MAX_BYTES:
+        return None
+    return _data_uri(content_type, image)
+
+
+def cover_message(coordinator: CoverCoordinator, size: int | None, thumbnail: bool) -> dict[str, Any]:
+    """Compact push payload of the coordinator's current cover."""
+    data: CoverData = coordinator.data
+    attributes = coordinator.cover_attributes
+    has_image = bool(data.image and data.image_hash)
+    return {
+        "source_entity_id": coordinator.source_entity_id,
+        "entry_id": coordinator.entry.entry_id,
+        **{key: attributes[key] for key in _PUSHED_ATTRIBUTES},
+        "image_hash": data.image_hash if has_image else None,
+        "url": (
+            async_signed_cover_url(coordinator.hass, data.image_hash, data.content_type, size or coordinator.image_size)
+            if has_image
+            else None
+        ),
+        "thumbnail": _thumbnail(data) if thumbnail and has_image else None,
+        "last_updated": data.last_updated.isoformat() if data.last_updated else None,
+    }
+
+
+def _entry_ids(hass: HomeAssistant, entity_ids: list[str]) -> set[str]:
+    """Config entries behind ``entity_ids``: wrapper entities or the source players they wrap."""
+    registry = er.async_get(hass)
+    entry_ids: set[str] = set()
+    for entity_id in entity_ids:
+        entity = registry.async_get(entity_id)
+        if entity is not None and entity.platform == DOMAIN and entity.config_entry_id:
+            entry_ids.add(entity.config_entry_id)
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        if coordinator.source_entity_id in entity_ids:
+            entry_ids.add(coordinator.entry.entry_id)
+    return entry_ids
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Optional("entity_id"): cv.entity_ids,
+        vol.Optional("size"): vol.All(vol.Coerce(int), vol.Range(min=16, max=4096)),
+        vol.Optional("thumbnail", default=True): cv.boolean,
+    }
+)
+@callback
+def ws_subscribe(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]) -> None:
+    """Push the cover of the selected entries (all when ``entity_id`` is omitted) whenever it changes.
+
+    ``entity_id`` may name wrapper entities or source players. The current
+    covers are sent right after subscribing, then one event per new cover.
+    """
+    entry_ids: set[str] | None = None
+    if "entity_id" in msg:
+        entry_ids = _entry_ids(hass, msg["entity_id"])
+        if not entry_ids:
+            connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "No media art wrapper for these entities")
+            return
+    size: int | None = msg.get("size")
+    thumbnail: bool = msg["thumbnail"]
+
+    @callback
+    def _async_forward(coordinator: CoverCoordinator) -> None:
+        if coordinator.data is None or (entry_ids is not None and coordinator.entry.entry_id not in entry_ids):
+            return
+        connection.send_message(websocket_api.event_message(msg["id"], cover_message(coordinator, size, thumbnail)))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(hass, SIGNAL_COVER_UPDATED, _async_forward)
+    connection.send_result(msg["id"])
+    _LOGGER.debug("Cover subscription %s for entries %s", msg["id"], sorted(entry_ids) if entry_ids else "all")
+    for coordinator in list(hass.data.get(DOMAIN, {}).values()):
+        _async_forward(coordinator)
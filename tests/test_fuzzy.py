@@ -0,0 +1,75 @@
+"""Near-duplicate matching of the cover cache (``fuzzy.py``)."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.media_art_wrapper.fuzzy import FuzzyIndex, match_confidence, normalize_title
+
+GROUP = "|600"
+
+
+def _index(*tracks: tuple[str, str]) -> FuzzyIndex:
+    index = FuzzyIndex()
+    for artist, title in tracks:
+        index.add(f"{artist}|{title}".lower(), artist, title, GROUP)
+    return index
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("Stereo Love", "stereo love"),
+        ("Monolith", "monolith"),
+        ("Yesterday (Remastered 2009)", "yesterday"),
+        ("Yesterday - 2009 Remaster", "yesterday"),
+        ("Let It Be [Mono]", "let it be"),
+    ],
+)
+def test_normalize_title_strips_only_annotations(title: str, expected: str) -> None:
+    assert normalize_title(title) == expected
+
+
+def test_version_annotations_still_match() -> None:
+    index = _index(("The Beatles", "Yesterday"))
+    assert index.find("The Beatles", "Yesterday (Remastered 2009)", GROUP)[0] == "the beatles|yesterday"
+
+
+@pytest.mark.parametrize(
+    ("artist", "cached", "query"),
+    [
+        ("Beethoven", "Symphony No. 5", "Symphony No. 6"),
+        ("Pink Floyd", "Another Brick in the Wall, Pt. 1", "Another Brick in the Wall, Pt. 2"),
+        ("Pink Floyd", "Shine On You Crazy Diamond, Part I", "Shine On You Crazy Diamond, Part II"),
+    ],
+)
+def test_titles_with_different_numbers_do_not_match(artist: str, cached: str, query: str) -> None:
+    assert _index((artist, cached)).find(artist, query, GROUP) is None
+    assert match_confidence(artist, cached, artist, query) == 0.0
+
+
+def test_word_containing_version_tag_is_not_stripped() -> None:
+    index = _index(("Edward Maya", "Love"))
+    assert index.find("Edward Maya", "Stereo Love", GROUP) is None
+    assert match_confidence("Edward Maya", "Stereo Love", "Edward Maya", "Love") < 1.0
+
+
+@pytest.mark.parametrize(
+    ("artist", "cached", "query"),
+    [
+        ("Gotye", "Somebody That I Used To Know", "Somebody That I Used To Know (Remix)"),
+        ("Oasis", "Dont Look Back In Anger", "Dont Look Back In Anger (Live)"),
+        ("Nirvana", "Where Did You Sleep Last Night", "Where Did You Sleep Last Night (Live)"),
+        ("Gotye", "Somebody That I Used To Know", "Somebody That I Used To Know - Acoustic"),
+    ],
+)
+def test_other_recordings_do_not_match(artist: str, cached: str, query: str) -> None:
+    assert _index((artist, cached)).find(artist, query, GROUP) is None
+    assert _index((artist, query)).find(artist, cached, GROUP) is None
+    assert match_confidence(artist, cached, artist, query) == 0.0
+
+
+def test_same_version_words_still_match() -> None:
+    index = _index(("Oasis", "Dont Look Back In Anger (Live)"))
+    assert index.find("Oasis", "Don't Look Back in Anger - Live", GROUP)[0] == "oasis|dont look back in anger (live)"
+    assert _index(("Oasis", "Live Forever")).find("Oasis", "Live Forever (Remastered 2014)", GROUP) is not None
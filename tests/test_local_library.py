@@ -0,0 +1,131 @@
+"""Local music library provider (``local_library.py``) against a fixture directory."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from custom_components.media_art_wrapper.const import DATA_LIBRARY_INDEXES, DOMAIN
+from custom_components.media_art_wrapper.local_library import (
+    LocalLibraryIndex,
+    async_get_library_index,
+    async_local_library_resolve,
+    async_release_library_indexes,
+)
+from custom_components.media_art_wrapper.models import TrackQuery
+
+COVER = b"\xff\xd8\xff\xe0fixture-cover"
+
+
+class _FakeHass:
+    """Just enough of ``HomeAssistant`` for the index: background tasks and executor jobs."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.tasks: list[asyncio.Task] = []
+
+    def async_create_background_task(self, coro, name: str) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(coro, name=name)
+        self.tasks.append(task)
+        return task
+
+    async def async_add_executor_job(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+def _library(root: Path) -> Path:
+    album = root / "Daft Punk" / "Discovery"
+    album.mkdir(parents=True)
+    (album / "01 One More Time.mp3").write_bytes(b"not really audio")
+    (album / "02 Aerodynamic.mp3").write_bytes(b"not really audio")
+    (album / "cover.jpg").write_bytes(COVER)
+    (root / "Daft Punk" / "notes.txt").write_text("ignored")
+    return root
+
+
+def _query(artist: str, title: str, album: str | None = None) -> TrackQuery:
+    return TrackQuery(artist=artist, title=title, album=album, artwork_width=600, artwork_height=600)
+
+
+def test_lookup_uses_folder_art(tmp_path: Path) -> None:
+    async def run() -> None:
+        hass = _FakeHass()
+        index = LocalLibraryIndex(hass, str(_library(tmp_path)))
+        index.async_schedule_refresh()
+        await asyncio.gather(*hass.tasks)
+
+        assert index.track_count > 0
+        resolved = await async_local_library_resolve(library=index, query=_query("Daft Punk", "One More Time"))
+        assert resolved is not None
+        assert resolved.image == COVER
+        assert resolved.content_type == "image/jpeg"
+        assert resolved.artwork_url.endswith("cover.jpg")
+        assert await async_local_library_resolve(library=index, query=_query("Daft Punk", "Digital Love")) is None
+
+    asyncio.run(run())
+
+
+def test_first_lookup_does_not_wait_for_the_build(tmp_path: Path) -> None:
+    async def run() -> None:
+        hass = _FakeHass()
+        index = LocalLibraryIndex(hass, str(_library(tmp_path)))
+
+        # The first lookup starts the build and misses instead of waiting for it.
+        assert await index.async_lookup(_query("Daft Punk", "Aerodynamic")) is None
+        assert len(hass.tasks) == 1
+        await asyncio.gather(*hass.tasks)
+
+        assert index.ready
+        assert await index.async_lookup(_query("Daft Punk", "Aerodynamic")) is not None
+
+    asyncio.run(run())
+
+
+def test_refresh_picks_up_new_and_removed_directories(tmp_path: Path) -> None:
+    async def run() -> None:
+        hass = _FakeHass()
+        root = _library(tmp_path)
+        index = LocalLibraryIndex(hass, str(root))
+        index.async_schedule_refresh()
+        await asyncio.gather(*hass.tasks)
+
+        album = root / "Air" / "Moon Safari"
+        album.mkdir(parents=True)
+        (album / "01 La Femme d'Argent.flac").write_bytes(b"not really audio")
+        (album / "folder.png").write_bytes(b"\x89PNG fixture")
+        for path in (root / "Daft Punk" / "Discovery").iterdir():
+            path.unlink()
+        (root / "Daft Punk" / "Discovery").rmdir()
+
+        index.async_schedule_refresh()
+        await asyncio.gather(*hass.tasks)
+
+        found = await index.async_lookup(_query("Air", "La Femme d'Argent"))
+        assert found is not None and found[1] == "image/png"
+        assert await index.async_lookup(_query("Daft Punk", "One More Time")) is None
+
+    asyncio.run(run())
+
+
+def test_indexes_no_entry_uses_are_dropped(tmp_path: Path) -> None:
+    async def run() -> None:
+        hass = _FakeHass()
+        first = async_get_library_index(hass, str(tmp_path / "first"))
+        assert async_get_library_index(hass, str(tmp_path / "first")) is first
+
+        # The library path changed: the old index is no longer used by any entry.
+        second = async_get_library_index(hass, str(tmp_path / "second"))
+        assert list(hass.data[DATA_LIBRARY_INDEXES].values()) == [second]
+
+        hass.data[DOMAIN] = {"entry": SimpleNamespace(library=second)}
+        third = async_get_library_index(hass, str(tmp_path / "third"))
+        assert list(hass.data[DATA_LIBRARY_INDEXES].values()) == [second, third]
+
+        async_release_library_indexes(hass)
+        assert DATA_LIBRARY_INDEXES not in hass.data
+        await asyncio.gather(*hass.tasks, return_exceptions=True)
+        assert first.track_count == second.track_count == 0
+
+    asyncio.run(run())
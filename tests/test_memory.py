@@ -0,0 +1,14 @@
+"""Memory footprint of the cover cache (``benchmarks/memory_benchmark.py``) against its budget."""
+
+from __future__ import annotations
+
+import asyncio
+
+from benchmarks.memory_benchmark import BYTES_PER_TRACK_BUDGET, measure
+
+
+def test_cover_cache_stays_within_budget_at_10k_tracks() -> None:
+    result = asyncio.run(measure(10_000))
+
+    assert result["tracks"] == 10_000
+    assert result["bytes_per_track"] <= BYTES_PER_TRACK_BUDGET, result
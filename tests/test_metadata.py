@@ -0,0 +1,85 @@
+"""Radio metadata parsing (``metadata.py``): splitting, station names and segment skips."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from custom_components.media_art_wrapper.metadata import StationRule, StationRules, parse_metadata
+
+ENTITY_ID = "media_player.radio"
+
+
+def _parse(title: str | None, artist: str | None = None, rules: StationRules | None = None, **attrs: Any):
+    return parse_metadata(ENTITY_ID, {"media_title": title, "media_artist": artist, **attrs}, rules)
+
+
+@pytest.mark.parametrize(
+    ("title", "artist", "expected"),
+    [
+        ("Queen - Bohemian Rhapsody", None, ("Queen", "Bohemian Rhapsody")),
+        ("Queen – Bohemian Rhapsody", None, ("Queen", "Bohemian Rhapsody")),
+        ("Queen / Bohemian Rhapsody", None, ("Queen", "Bohemian Rhapsody")),
+        ("Oasis - Live Forever", None, ("Oasis", "Live Forever")),
+        ("Bohemian Rhapsody", "Queen", ("Queen", "Bohemian Rhapsody")),
+        ("AC-DC", None, (None, "AC-DC")),
+    ],
+)
+def test_split_artist_and_title(title: str, artist: str | None, expected: tuple[str | None, str | None]) -> None:
+    parsed = _parse(title, artist)
+    assert (parsed.artist, parsed.raw_title) == expected
+    assert parsed.skip_reason is None
+
+
+@pytest.mark.parametrize(
+    "title",
+    ["Bohemian Rhapsody - Remastered 2011", "Bohemian Rhapsody - 2011 Remaster", "Song - Radio Edit"],
+)
+def test_version_suffix_is_not_split(title: str) -> None:
+    parsed = _parse(title)
+    assert parsed.artist is None
+    assert parsed.raw_title == title
+
+
+@pytest.mark.parametrize("marker", ["(Live)", "(Explicit)", "(Clean)"])
+def test_recording_markers_stay_in_the_track_key(marker: str) -> None:
+    parsed = _parse(f"Song {marker}", "X")
+    assert parsed.raw_title == f"Song {marker}"
+    assert parsed.track_key != _parse("Song", "X").track_key
+
+
+def test_broadcast_markers_are_stripped() -> None:
+    parsed = _parse("Now playing: Queen - Bohemian Rhapsody (Werbung)")
+    assert (parsed.artist, parsed.raw_title) == ("Queen", "Bohemian Rhapsody")
+
+
+def test_station_name_in_artist_field() -> None:
+    parsed = _parse("Queen - Bohemian Rhapsody", "Radio Eins", media_channel="Radio Eins")
+    assert (parsed.artist, parsed.raw_title) == ("Queen", "Bohemian Rhapsody")
+    assert _parse("Radio Eins", "Radio Eins", media_channel="Radio Eins").skip_reason == "station"
+
+
+def test_station_rule_order_and_skip() -> None:
+    rule = StationRule.from_dict(
+        {"match": "radio ?eins", "separator": " | ", "order": "title_artist", "skip": ["^der beste mix"]}
+    )
+    rules = StationRules(rules=[rule])
+    parsed = _parse("Bohemian Rhapsody | Queen", rules=rules, media_channel="Radio Eins")
+    assert (parsed.artist, parsed.raw_title) == ("Queen", "Bohemian Rhapsody")
+    assert _parse("Der beste Mix am Morgen", rules=rules, media_channel="Radio Eins").skip_reason == "segment"
+
+
+@pytest.mark.parametrize(
+    "title", ["Nachrichten", "News - 12:00", "Wetter und Verkehr", "Werbung", "Nachrichten um 14 Uhr"]
+)
+def test_segments_are_skipped(title: str) -> None:
+    assert _parse(title).skip_reason == "segment"
+
+
+@pytest.mark.parametrize(
+    ("title", "artist"),
+    [("Weather With You", "Crowded House"), ("Traffic", "Stereophonics"), ("News of the World", None)],
+)
+def test_songs_named_like_segments_are_not_skipped(title: str, artist: str | None) -> None:
+    assert _parse(title, artist).skip_reason is None